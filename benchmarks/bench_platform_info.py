@@ -0,0 +1,435 @@
+"""Benchmark platform_info's import, collection & helper costs using only the stdlib.
+
+Description:
+    Each repetition of each benchmark runs in a fresh interpreter (`python -c ...`), so
+    import & "cold" numbers are not skewed by modules or memoized probes left over from
+    a previous run. The 'probes' benchmark runs every probe in its own interpreter, so
+    each `probe:*` case is the cold cost of that probe alone. Results are summarized as median/p95 (in milliseconds, or bytes for
+    the 'memory' & binary size cases), printed as a table & written to a JSON file that can be
+    compared against a stored baseline.
+
+Usage:
+    - Run all benchmarks: `python benchmarks/bench_platform_info.py`
+    - Run with nox: `nox -s bench`
+    - Save a baseline: `python benchmarks/bench_platform_info.py -o baseline.json`
+    - Compare against it: `python benchmarks/bench_platform_info.py --baseline baseline.json`
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from pathlib import Path
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import textwrap
+import typing as t
+
+REPO_ROOT: Path = Path(__file__).resolve().parent.parent
+
+## Snapshots held in memory per sample of the 'memory' benchmark
+MEMORY_SNAPSHOTS: int = 200
+
+## Byte counts converted per sample of the 'convert_bytes' batch cases
+BATCH_SIZE: int = 100_000
+
+## Prefix for the line a benchmark child process prints its results on
+RESULT_PREFIX: str = "BENCH_RESULT:"
+
+## Code run in a fresh interpreter for each benchmark. Each snippet must call
+#  _emit() with a dict of {case name: [samples]}. Samples are in nanoseconds, or in
+#  bytes for cases named 'memory:*' & 'size:*'.
+_CHILD_PRELUDE: str = f"""
+import json, sys, time
+
+def _emit(results):
+    sys.stdout.write("\\n{RESULT_PREFIX}" + json.dumps(results) + "\\n")
+"""
+
+BENCHMARKS: dict[str, str] = {
+    "import": """
+        _start = time.perf_counter_ns()
+        import platform_info
+        _emit({"import": [time.perf_counter_ns() - _start]})
+    """,
+    "collect": """
+        import platform_info
+
+        _start = time.perf_counter_ns()
+        platform_info.get_platform_info()
+        cold = time.perf_counter_ns() - _start
+
+        warm = []
+        for _ in range(WARM_CALLS):
+            _start = time.perf_counter_ns()
+            platform_info.get_platform_info()
+            warm.append(time.perf_counter_ns() - _start)
+
+        _emit({"collect_cold": [cold], "collect_warm": warm})
+    """,
+    "probes": """
+        import platform_info
+
+        probe = next(
+            probe for probe in platform_info.get_probes() if probe.path == PROBE_PATH
+        )
+        ## get_probes() reads platform.system(), which caches uname()
+        platform_info._clear_static_probe_caches()
+        _, stats = platform_info.run_timed_probe(probe)
+
+        _emit({f"probe:{probe.path}": [stats.wall_ns]})
+    """,
+    "memory": """
+        import json, tracemalloc
+        import platform_info
+
+        ## Simulate snapshots of many different hosts: every snapshot is rebuilt
+        #  from a JSON payload, so no strings are shared between them.
+        values = platform_info.ProbeCollector().collect(platform_info.get_probes()).values
+        values["uname"] = values["uname"].as_dict()
+        values["cpu"] = values["cpu"] and values["cpu"].as_dict()
+        values["python.modules"] = values["python.modules"].records
+        payload = json.dumps(values, default=str)
+
+        def _load():
+            host_values = json.loads(payload)
+            host_values["uname"] = platform_info.PlatformUname(**host_values["uname"])
+            if host_values["cpu"] is not None:
+                host_values["cpu"] = platform_info.CPUInfo(**host_values["cpu"])
+            host_values["cpu_limits"] = platform_info.CPULimits(*host_values["cpu_limits"])
+            if host_values["cpu_features"] is not None:
+                host_values["cpu_features"] = platform_info.CPUFeatures(
+                    *host_values["cpu_features"]
+                )
+            if host_values["cpu_topology"] is not None:
+                cpus, nodes = host_values["cpu_topology"]
+                host_values["cpu_topology"] = platform_info.CPUTopology(
+                    cpus=tuple(map(tuple, cpus)),
+                    nodes=tuple(
+                        platform_info.NUMANode(node, tuple(node_cpus), memory)
+                        for node, node_cpus, memory in nodes
+                    ),
+                )
+            host_values["python.modules"] = platform_info.ModuleInventory(
+                platform_info.ModuleRecord(*record) for record in host_values["python.modules"]
+            )
+            return platform_info.build_platform_info(host_values)
+
+        def _bytes_per_snapshot(build, count=MEMORY_SNAPSHOTS):
+            tracemalloc.start()
+            before = tracemalloc.get_traced_memory()[0]
+            snapshots = [build() for _ in range(count)]
+            used = tracemalloc.get_traced_memory()[0] - before
+            tracemalloc.stop()
+            del snapshots
+            return used // count
+
+        _emit({
+            "memory:platform_info": [_bytes_per_snapshot(_load)],
+            "memory:snapshot": [_bytes_per_snapshot(lambda: _load().freeze())],
+        })
+    """,
+    "binary": """
+        import json, timeit
+        import platform_info
+
+        info = platform_info.PlatformInfo()
+        json_data = info.to_json().encode("utf-8")
+        binary_data = info.to_binary()
+
+        def _ns_per_call(func, number=200):
+            return [int(timeit.Timer(func).timeit(number) * 1e9 / number)]
+
+        _emit({
+            "size:json": [len(json_data)],
+            "size:binary": [len(binary_data)],
+            "encode:json": _ns_per_call(info.to_json),
+            "encode:binary": _ns_per_call(info.to_binary),
+            "decode:json": _ns_per_call(lambda: platform_info.PlatformInfo.from_json(json_data)),
+            "decode:binary": _ns_per_call(lambda: platform_info.PlatformInfo.from_binary(binary_data)),
+            "read_field:json": _ns_per_call(lambda: json.loads(json_data)["system"]),
+            "read_field:binary": _ns_per_call(lambda: platform_info.decode_binary(binary_data).system),
+        })
+    """,
+    "resources": """
+        import timeit
+        import platform_info
+
+        number = 1000
+        with platform_info.ResourceSampler() as sampler:
+            sampler.sample()
+            timer = timeit.Timer(sampler.sample)
+            _emit({"resource_sample": [int(timer.timeit(number) * 1e9 / number)]})
+    """,
+    "convert_bytes": """
+        import timeit
+        import platform_info
+
+        number = 10000
+        timer = timeit.Timer(lambda: platform_info.convert_bytes(10485760, as_str=True))
+
+        ## Convert BATCH_SIZE byte counts, 1 call per value vs. 1 batch call
+        from array import array
+        import random
+
+        random.seed(0)
+        values = array("Q", (random.getrandbits(random.randint(1, 50)) for _ in range(BATCH_SIZE)))
+
+        def _ns(func, number=3):
+            return [int(timeit.Timer(func).timeit(number) * 1e9 / number)]
+
+        _emit({
+            "convert_bytes": [int(timer.timeit(number) * 1e9 / number)],
+            "convert_bytes:loop": _ns(lambda: [platform_info.convert_bytes(value, as_str=True) for value in values]),
+            "convert_bytes:batch_str": _ns(lambda: platform_info.convert_bytes_batch(values, as_str=True)),
+            "convert_bytes:batch": _ns(lambda: platform_info.convert_bytes_batch(values)),
+        })
+    """,
+}
+
+
+## Lists the probes the 'probes' benchmark runs, 1 interpreter per probe
+_PROBE_PATHS_CODE: str = """
+    import platform_info
+    _emit({"paths": [probe.path for probe in platform_info.get_probes()]})
+"""
+
+
+def _child_env(pycache_dir: str) -> dict[str, str]:
+    """Environment for benchmark children. Bytecode is cached so imports are realistic."""
+    env: dict[str, str] = os.environ.copy()
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    env["PYTHONPYCACHEPREFIX"] = pycache_dir
+
+    return env
+
+
+def run_child(
+    code: str,
+    env: dict[str, str],
+    warm_calls: int,
+    variables: dict[str, t.Any] | None = None,
+) -> dict[str, list[int]]:
+    """Run a benchmark snippet in a fresh interpreter & return its samples.
+
+    `variables` are defined as globals for the snippet, i.e. the 'probes' benchmark's
+    PROBE_PATH.
+    """
+    source: str = (
+        _CHILD_PRELUDE
+        + f"WARM_CALLS = {warm_calls}\nMEMORY_SNAPSHOTS = {MEMORY_SNAPSHOTS}\n"
+        + f"BATCH_SIZE = {BATCH_SIZE}\n"
+        + "".join(f"{name} = {value!r}\n" for name, value in (variables or {}).items())
+        + textwrap.dedent(code)
+    )
+
+    proc = subprocess.run(
+        [sys.executable, "-c", source],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"Benchmark child failed:\n{proc.stderr}")
+
+    for line in reversed(proc.stdout.splitlines()):
+        if line.startswith(RESULT_PREFIX):
+            return json.loads(line[len(RESULT_PREFIX) :])
+
+    raise RuntimeError(f"Benchmark child did not report results:\n{proc.stdout}")
+
+
+def get_unit(case: str) -> str:
+    """Return the unit a case is reported in, 'bytes' for memory & size cases, else 'ms'."""
+    return "bytes" if case.startswith(("memory:", "size:")) else "ms"
+
+
+def summarize(samples: list[int], unit: str = "ms") -> dict[str, t.Any]:
+    """Return median/p95/min/max for a list of samples.
+
+    Samples are in nanoseconds (reported in milliseconds) when `unit` is 'ms',
+    otherwise they are reported as-is.
+    """
+    values: list[float] = [
+        sample / 1e6 if unit == "ms" else sample for sample in samples
+    ]
+
+    if len(values) > 1:
+        p95: float = statistics.quantiles(values, n=20, method="inclusive")[-1]
+    else:
+        p95 = values[0]
+
+    return {
+        f"median_{unit}": statistics.median(values),
+        f"p95_{unit}": p95,
+        f"min_{unit}": min(values),
+        f"max_{unit}": max(values),
+        "unit": unit,
+        "samples": len(values),
+    }
+
+
+def run_benchmarks(
+    names: list[str], repetitions: int, warm_calls: int
+) -> dict[str, t.Any]:
+    """Run benchmarks, each repetition in a fresh interpreter, & summarize them."""
+    samples: dict[str, list[int]] = {}
+
+    with tempfile.TemporaryDirectory(prefix="platform_info_bench_") as pycache_dir:
+        env: dict[str, str] = _child_env(pycache_dir)
+        ## Compile the module once, so the first repetition does not pay for it
+        run_child(BENCHMARKS["import"], env, warm_calls)
+
+        for name in names:
+            ## Probes share memoized values (i.e. 'platform' computes uname & libc), so
+            #  each probe runs in its own interpreter to measure its cold cost
+            child_variables: list[dict[str, t.Any]] = (
+                [
+                    {"PROBE_PATH": path}
+                    for path in run_child(_PROBE_PATHS_CODE, env, warm_calls)["paths"]
+                ]
+                if name == "probes"
+                else [{}]
+            )
+
+            for _ in range(repetitions):
+                for variables in child_variables:
+                    for case, case_samples in run_child(
+                        BENCHMARKS[name], env, warm_calls, variables
+                    ).items():
+                        samples.setdefault(case, []).extend(case_samples)
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "repetitions": repetitions,
+            "warm_calls": warm_calls,
+        },
+        "results": {
+            case: summarize(values, unit=get_unit(case))
+            for case, values in samples.items()
+        },
+    }
+
+
+def compare(
+    report: dict[str, t.Any], baseline: dict[str, t.Any], threshold: float
+) -> list[str]:
+    """Return the cases whose median regressed by more than `threshold` (i.e. 0.2 = 20%)."""
+    regressions: list[str] = []
+
+    for case, result in report["results"].items():
+        median: str = f"median_{result.get('unit', 'ms')}"
+        base: dict[str, t.Any] | None = baseline.get("results", {}).get(case)
+        if not base or not base.get(median):
+            continue
+
+        ratio: float = result[median] / base[median]
+        result[f"baseline_{median}"] = base[median]
+        result["ratio"] = ratio
+
+        if ratio > 1 + threshold:
+            regressions.append(case)
+
+    return regressions
+
+
+def format_report(report: dict[str, t.Any]) -> str:
+    """Format a report as a table of median/p95 per case."""
+    results: dict[str, dict[str, t.Any]] = report["results"]
+    width: int = max((len(case) for case in results), default=4)
+
+    lines: list[str] = [
+        f"[ platform_info benchmarks ] Python {report['meta']['python']}, {report['meta']['repetitions']} repetition(s)",
+        f"{'Case':<{width}}  {'Median':>11}  {'p95':>11}  {'Unit':<5}  {'vs baseline':>11}",
+    ]
+    for case, result in results.items():
+        unit: str = result.get("unit", "ms")
+        ratio: str = f"{result['ratio']:.2f}x" if "ratio" in result else "-"
+        lines.append(
+            f"{case:<{width}}  {result[f'median_{unit}']:>11.3f}  {result[f'p95_{unit}']:>11.3f}  {unit:<5}  {ratio:>11}"
+        )
+
+    return "\n".join(lines)
+
+
+def get_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+
+    parser.add_argument(
+        "benchmarks",
+        nargs="*",
+        help=f"Benchmarks to run (default: all). Choices: {', '.join(BENCHMARKS)}",
+    )
+    parser.add_argument(
+        "-n",
+        "--repetitions",
+        type=int,
+        default=20,
+        help="Fresh interpreters to run per benchmark",
+    )
+    parser.add_argument(
+        "--warm-calls",
+        type=int,
+        default=20,
+        help="Repeated get_platform_info() calls per interpreter in the 'collect' benchmark",
+    )
+    parser.add_argument(
+        "-o", "--output", type=Path, help="Write the JSON report to this file"
+    )
+    parser.add_argument(
+        "--baseline", type=Path, help="JSON report to compare the results against"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Fraction a median may regress vs. the baseline before failing (default: 0.2)",
+    )
+
+    args: argparse.Namespace = parser.parse_args()
+
+    unknown: list[str] = [name for name in args.benchmarks if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"Unknown benchmark(s): {', '.join(unknown)}")
+
+    return args
+
+
+def main(options: argparse.Namespace) -> int:
+    report: dict[str, t.Any] = run_benchmarks(
+        names=options.benchmarks or list(BENCHMARKS),
+        repetitions=options.repetitions,
+        warm_calls=options.warm_calls,
+    )
+
+    regressions: list[str] = []
+    if options.baseline:
+        baseline: dict[str, t.Any] = json.loads(options.baseline.read_text())
+        regressions = compare(report, baseline, threshold=options.threshold)
+
+    print(format_report(report))
+
+    if options.output:
+        options.output.write_text(json.dumps(report, indent=2))
+        print(f"\nWrote report to {options.output}")
+
+    if regressions:
+        print(
+            f"\nRegressed by more than {options.threshold:.0%}: {', '.join(regressions)}"
+        )
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(get_args()))
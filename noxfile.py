@@ -43,7 +43,11 @@ DEFAULT_PYTHON: str = f"{PY_VER_TUPLE[0]}.{PY_VER_TUPLE[1]}"
 ## Set PDM version to install throughout
 PDM_VER: str = "2.15.4"
 ## Set paths to lint with the lint session
-LINT_PATHS: list[str] = ["platform_info.py", "tests"]
+LINT_PATHS: list[str] = ["platform_info.py", "tests", "benchmarks"]
+## Path to the benchmark harness run by the bench session
+BENCH_SCRIPT: str = "benchmarks/bench_platform_info.py"
+## Path to the baseline benchmark report, compared when it exists
+BENCH_BASELINE: str = "benchmarks/baseline.json"
 
 
 def setup_nox_logging(
@@ -186,6 +190,20 @@ def run_tests(session: nox.Session):
     )
 
 
+@nox.session(python=[DEFAULT_PYTHON], name="bench", tags=["test", "bench"])
+def run_benchmarks(session: nox.Session):
+    ## The harness is stdlib-only, no dependencies to install
+    bench_args: list[str] = ["--output", "bench_output.json"]
+
+    if Path(BENCH_BASELINE).exists():
+        log.info(f"Comparing benchmarks against baseline: {BENCH_BASELINE}")
+        bench_args += ["--baseline", BENCH_BASELINE]
+
+    log.info("Running benchmarks")
+
+    session.run("python", BENCH_SCRIPT, *bench_args, *session.posargs)
+
+
 @nox.session(python=PY_VERSIONS, name="pre-commit-all", tags=["repo", "pre-commit"])
 def run_pre_commit_all(session: nox.Session):
     session.install("pre-commit")
@@ -19,32 +19,50 @@ Usage:
 
 from __future__ import annotations
 
-import argparse
+import contextlib
 from contextlib import AbstractContextManager
-from dataclasses import dataclass, field
+import contextvars
+from dataclasses import FrozenInstanceError, dataclass, field, fields
 from decimal import Decimal
 from enum import Enum
+import functools
 import itertools
 import logging
-import multiprocessing
+import os
 import platform as _platform
 import sys
 import threading
 import time
-from types import ModuleType
+from types import MappingProxyType
 import typing as t
 
+if t.TYPE_CHECKING:
+    ## Only needed for annotations. argparse (get_args()) is imported lazily, so
+    #  importing this module as a library does not pay for it.
+    import argparse
+    from array import array
+
 log: logging.Logger = logging.getLogger(__name__)
 
 ## Control which classes, variables, and functions are available for import.
-__all__: list[str] = ["PlatformInfo", "get_platform_info"]
-
-match _platform.system():
-    case "Unix" | "Linux":
+__all__: list[str] = [
+    "PlatformInfo",
+    "get_platform_info",
+    "async_get_platform_info",
+    "get_cached_platform_info",
+    "invalidate_platform_info_cache",
+    "enable_disk_cache",
+    "disable_disk_cache",
+]
+
+## Use sys.platform instead of platform.system() so importing the module does not
+#  probe the platform (platform.system() calls & caches uname()).
+match sys.platform:
+    case "linux":
         __all__.append("PlatformLinuxInfo")
-    case "Darwin":
+    case "darwin":
         __all__.append("PlatformMacInfo")
-    case "Windows":
+    case "win32":
         __all__.append("PlatformWinInfo")
     case _:
         ## Unknown system, do not export and platform-specific classes.
@@ -53,6 +71,19 @@ match _platform.system():
 ## Generic type for dataclass classes
 T = t.TypeVar("T")
 
+## Default deadline (in seconds) for each blocking probe run by a ProbeCollector
+DEFAULT_PROBE_TIMEOUT: float = 5.0
+
+## Linux CPU info file
+CPUINFO_PATH: str = "/proc/cpuinfo"
+## The process' auxiliary vector, for the CPU's HWCAP feature bits
+AUXV_PATH: str = "/proc/self/auxv"
+## The process' cgroups & mounts, to find its cgroup CPU limits
+CGROUP_PATH: str = "/proc/self/cgroup"
+MOUNTINFO_PATH: str = "/proc/self/mountinfo"
+## Linux sysfs CPU & NUMA node devices, to find the CPU topology
+SYS_DEVICES_SYSTEM_PATH: str = "/sys/devices/system"
+
 ## Valid file size strings for byte conversions
 VALID_FILESIZE_UNITS: list[str] = ["B", "KB", "MB", "GB", "TB", "PB"]
 
@@ -98,8 +129,25 @@ def _set_logging_level(
     log.debug(f"Logging configured")
 
 
+def _positive_float(value: str) -> float:
+    """Parse a CLI option that must be a number greater than 0 (an argparse type)."""
+    import argparse
+
+    try:
+        number: float = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"'{value}' is not a number")
+
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"'{value}' must be greater than 0")
+
+    return number
+
+
 def get_args() -> argparse.Namespace:
     """Handle CLI args for this script."""
+    import argparse
+
     ## Initialize arg parser
     parser = argparse.ArgumentParser()
 
@@ -116,6 +164,65 @@ def get_args() -> argparse.Namespace:
         default=0,
         help="Increase verbosity level (-v, -vv, etc). Max verbosity: -vv",
     )
+    ## Add profiling flag
+    parser.add_argument(
+        "--profile",
+        dest="profile",
+        action="store_true",
+        help="Print how long each probe took to collect, slowest first",
+    )
+    ## Add field selection option
+    parser.add_argument(
+        "--fields",
+        dest="fields",
+        type=lambda value: [path.strip() for path in value.split(",") if path.strip()],
+        default=None,
+        help="Comma-separated dotted paths of the fields to collect & print, i.e. 'system,cpu_count,python.version'",
+    )
+    ## Add output format option
+    parser.add_argument(
+        "--format",
+        dest="format",
+        choices=["text", "json", "ndjson"],
+        default="text",
+        help="Output format. 'json' is indented, 'ndjson' is 1 compact JSON object per line",
+    )
+    ## Add snapshot delta options
+    parser.add_argument(
+        "--delta-from",
+        dest="delta_from",
+        default=None,
+        help="Only print the fields that changed since the JSON snapshot in this file (i.e. from --save-snapshot)",
+    )
+    parser.add_argument(
+        "--save-snapshot",
+        dest="save_snapshot",
+        default=None,
+        help="Write the collected fields to this file as JSON. Pass the same file to --delta-from to print changes since the last run",
+    )
+    ## Add watch mode option
+    parser.add_argument(
+        "--watch",
+        dest="watch",
+        type=_positive_float,
+        default=None,
+        metavar="SECONDS",
+        help="Keep running & re-probe every SECONDS, printing only the fields that changed. Combine with --delta-from/--save-snapshot to resume from a snapshot file",
+    )
+    ## Add pool sizing option
+    parser.add_argument(
+        "--recommend-pools",
+        dest="recommend_pools",
+        action="store_true",
+        help="Print suggested thread & process pool sizes, chunk sizes & a multiprocessing start method for this host",
+    )
+    ## Add disk cache flag
+    parser.add_argument(
+        "--disk-cache",
+        dest="disk_cache",
+        action="store_true",
+        help=f"Cache static probes (architecture, libc version) on disk for later runs. Same as setting {DISK_CACHE_ENV_VAR}=1",
+    )
 
     options: argparse.Namespace = parser.parse_args()
 
@@ -160,7 +267,8 @@ def convert_bytes(
     factor: int = 1024
 
     for unit in VALID_FILESIZE_UNITS:
-        if bytes < factor:
+        ## Counts >= 1024PB stay in PB
+        if bytes < factor or unit == VALID_FILESIZE_UNITS[-1]:
             if as_str:
                 return f"{bytes:.2f}{unit}"
             elif as_obj:
@@ -171,16 +279,113 @@ def convert_bytes(
             bytes /= factor
 
 
-def get_platform_info() -> PlatformInfo:
+## Index into VALID_FILESIZE_UNITS for a byte count, by its int.bit_length(). A count
+#  with N bits is < 1024 ** ((N - 1) // 10 + 1), counts >= 1024PB stay in PB.
+_FILESIZE_UNIT_BY_BIT_LENGTH: bytes = bytes(
+    min(max(bits - 1, 0) // 10, len(VALID_FILESIZE_UNITS) - 1) for bits in range(65)
+)
+
+
+class ConvertedBytesArray(t.NamedTuple):
+    """Byte counts converted by `convert_bytes_batch()`, as 2 parallel arrays."""
+
+    ## array('d') of (unrounded) amounts
+    amounts: array
+    ## array('B') of indexes into VALID_FILESIZE_UNITS
+    units: array
+
+    def unit(self, index: int) -> str:
+        """Return the unit name of the amount at `index`, i.e. 'MB'."""
+        return VALID_FILESIZE_UNITS[self.units[index]]
+
+
+def convert_bytes_batch(
+    values: t.Sequence[int] | array, as_str: bool = False
+) -> t.Union[ConvertedBytesArray, list[str]]:
+    """Scale many byte counts up to their proper unit at once.
+
+    Description:
+        Equivalent to calling `convert_bytes()` for each value, without a loop of
+        divisions or a `Decimal`/`ConvertedBytes` object per value: the unit is
+        looked up from the count's bit length, and the amount is 1 division by a
+        power of 1024.
+
+        Returns a `ConvertedBytesArray` of amounts & unit indexes, or a list of
+        strings formatted like `convert_bytes(as_str=True)` when `as_str=True`.
+
+    Params:
+        values (Sequence[int] | array): Byte counts, i.e. an `array('Q')`. Each count must fit in 64 bits.
+        as_str (bool): Return formatted strings, i.e. `['1.20MB', '1.17GB']`.
+
+    """
+    from array import array
+
+    unit_by_bit_length: bytes = _FILESIZE_UNIT_BY_BIT_LENGTH
+    try:
+        units: array = array(
+            "B", [unit_by_bit_length[value.bit_length()] for value in values]
+        )
+    except IndexError:
+        raise ValueError("Byte counts must fit in 64 bits.") from None
+
+    scales: list[float] = [
+        float(1 << (10 * i)) for i in range(len(VALID_FILESIZE_UNITS))
+    ]
+
+    if as_str:
+        formats: list[str] = [f"%.2f{unit}" for unit in VALID_FILESIZE_UNITS]
+        return [
+            formats[unit] % (value / scales[unit]) for value, unit in zip(values, units)
+        ]
+
+    return ConvertedBytesArray(
+        amounts=array(
+            "d", [value / scales[unit] for value, unit in zip(values, units)]
+        ),
+        units=units,
+    )
+
+
+def get_platform_info(
+    timeout: float = DEFAULT_PROBE_TIMEOUT,
+    timeouts: dict[str, float] | None = None,
+    fields: t.Iterable[str] | None = None,
+    show_spinner: bool = True,
+) -> PlatformInfo:
     """Entrypoint for platform info class.
 
     Description:
         This method initializes a `PlatformInfo` object, handling any exceptions
         and returning a PlatformInfo class where possible.
+
+        Probes are collected concurrently by a `ProbeCollector`. A probe that does
+        not finish before its deadline is left as `None` and listed in the
+        returned object's `unavailable_fields`.
+
+        Pass `fields` to only collect some fields, see `select_probes()`.
+
+    Params:
+        timeout (float): Default deadline (in seconds) for each blocking probe.
+        timeouts (dict[str, float] | None): Per-probe deadlines, keyed by dotted field path.
+        fields (Iterable[str] | None): Dotted paths of the fields to collect, i.e. `['system', 'python.version']`.
+            Fields that are not selected are probed when they are first read. Collects every field when `None`.
+        show_spinner (bool): Show a CLI spinner with the collection's progress. The spinner is only shown
+            when stdout is a TTY; disable it when stdout is parsed (i.e. JSON output) or in library use.
+
     """
-    with CLISpinner(message="Compiling platform information... "):
+    spinner: CLISpinner | None = (
+        CLISpinner(message="Compiling platform information... ")
+        if show_spinner
+        else None
+    )
+
+    with spinner or contextlib.nullcontext():
         try:
-            p_info: PlatformInfo = PlatformInfo()
+            p_info: PlatformInfo = ProbeCollector(
+                timeout=timeout,
+                timeouts=timeouts,
+                progress=spinner and spinner.update,
+            ).collect_platform_info(fields=fields)
 
             return p_info
         except Exception as exc:
@@ -190,19 +395,178 @@ def get_platform_info() -> PlatformInfo:
             raise exc
 
 
+async def async_get_platform_info(
+    timeout: float = DEFAULT_PROBE_TIMEOUT,
+    timeouts: dict[str, float] | None = None,
+    fields: t.Iterable[str] | None = None,
+) -> PlatformInfo:
+    """Async entrypoint for platform info class.
+
+    Description:
+        Collects the same `PlatformInfo` object as `get_platform_info()` without
+        blocking the event loop. Probes run concurrently; subprocesses are spawned
+        with asyncio and blocking reads are offloaded to threads. No spinner is shown.
+
+    Params:
+        timeout (float): Default deadline (in seconds) for each blocking probe.
+        timeouts (dict[str, float] | None): Per-probe deadlines, keyed by dotted field path.
+        fields (Iterable[str] | None): Dotted paths of the fields to collect. Collects every field when `None`.
+
+    """
+    try:
+        return await ProbeCollector(
+            timeout=timeout, timeouts=timeouts
+        ).async_collect_platform_info(fields=fields)
+    except Exception as exc:
+        msg = f"({type(exc)}) Unhandled exception initializing PlatformInfo object. Details: {exc}"
+        log.error(msg)
+
+        raise exc
+
+
+def get_cached_platform_info() -> PlatformInfo:
+    """Return the process-wide, memoized `PlatformInfo` snapshot.
+
+    Description:
+        The returned object is shared between callers and is read-only. Static fields
+        (uname, Python build, libc, architecture, etc) and volatile fields (CPU count,
+        sys.path, etc) are refreshed independently when their TTL expires. Configure
+        the TTLs with `PLATFORM_INFO_CACHE.set_ttl()`.
+    """
+    return PLATFORM_INFO_CACHE.get()
+
+
+def invalidate_platform_info_cache(field_class: EnumFieldClass | None = None) -> None:
+    """Discard the memoized `PlatformInfo` snapshot (or 1 class of its fields)."""
+    PLATFORM_INFO_CACHE.invalidate(field_class=field_class)
+
+
 def get_cpu_count() -> int:
     """Return integer count of CPUs detected."""
-    return multiprocessing.cpu_count()
+    ## Same value as multiprocessing.cpu_count(), without importing multiprocessing
+    cpu_count: int | None = os.cpu_count()
+    if cpu_count is None:
+        raise NotImplementedError("cannot determine number of cpus")
+
+    return cpu_count
+
+
+def get_gil_enabled() -> bool:
+    """Return `False` when running without the GIL, i.e. on a free-threaded CPython 3.13+ build."""
+    ## The GIL can be re-enabled at runtime, i.e. by importing an incompatible extension
+    is_gil_enabled: t.Callable[[], bool] | None = getattr(sys, "_is_gil_enabled", None)
+
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def _format_platform(*parts: str) -> str:
+    """Join platform string parts like `platform.platform()` does, i.e. 'Linux-6.1.0-x86_64'."""
+    platform: str = "-".join(part.strip() for part in parts if part)
+
+    ## Replace filename obstacles
+    platform = platform.replace(" ", "_")
+    for char in '/\\:;"()':
+        platform = platform.replace(char, "-")
+
+    ## Drop 'unknown' parts, fold '--'s & remove trailing '-'s
+    platform = platform.replace("unknown", "")
+    while "--" in platform:
+        platform = platform.replace("--", "-")
+
+    return platform.rstrip("-")
+
+
+def build_platform_string(
+    aliased: bool = False,
+    terse: bool = False,
+    processor: str | None = None,
+    architecture: t.Tuple[str, str] | None = None,
+) -> str:
+    """Build the same string as `platform.platform()`, without running a subprocess.
+
+    Description:
+        `platform.platform()` reads `uname().processor`, which runs `uname -p`, and
+        on some systems `platform.architecture()`, which runs `file`. This follows
+        the same logic with the memoized probes instead: libc from
+        `get_libc_version()`, the processor from `get_processor()` & the
+        architecture from `get_architecture()`.
+
+        On Linux, `uname -p` only reports the machine type (or 'unknown'), which
+        `platform.platform()` drops, so the processor is not needed at all. The
+        processor & architecture are only read on other systems (i.e. macOS, BSD),
+        and not when `terse`.
+
+    Params:
+        aliased (bool): Use common system names, see `platform.system_alias()`.
+        terse (bool): Only return the minimum information to identify the platform.
+        processor (str | None): Processor name, read with `get_processor()` when needed
+            & `None`.
+        architecture (tuple[str, str] | None): `(bits, linkage)`, read with
+            `get_architecture()` when needed & `None`.
+
+    """
+    uname: _platform.uname_result = _platform.uname()
+    ## Read by name, unpacking uname() computes its (subprocess) processor
+    system, release, version, machine = (
+        uname.system,
+        uname.release,
+        uname.version,
+        uname.machine,
+    )
+    if aliased:
+        system, release, version = _platform.system_alias(system, release, version)
+
+    if system == "Darwin":
+        mac_release: str = get_mac_version()[0]
+        if mac_release:
+            system, release = "macOS", mac_release
+
+    if system == "Windows":
+        csd: str = get_win32_version()[2]
+        if terse:
+            return _format_platform(system, release)
+
+        return _format_platform(system, release, version, csd)
+
+    if system == "Linux":
+        ## platform.platform() ignores 'terse' on Linux
+        libc: t.Tuple[str | None, str | None] | None = get_libc_version()
+        lib, lib_version = libc or (None, None)
+
+        return _format_platform(
+            system, release, machine, "with", (lib or "") + (lib_version or "")
+        )
+
+    if terse:
+        return _format_platform(system, release)
+
+    if processor is None:
+        processor = get_processor()
+    bits, linkage = architecture or get_architecture()
+
+    return _format_platform(
+        system,
+        release,
+        machine,
+        "" if processor == machine else processor,
+        bits,
+        linkage,
+    )
+
+
+def get_platform() -> str:
+    """Return platform info, the same string as `platform.platform()`."""
+    return build_platform_string()
 
 
 def get_platform_terse() -> str:
     """Return 'terse' platform info."""
-    return _platform.platform(terse=True)
+    return build_platform_string(terse=True)
 
 
 def get_platform_aliased() -> str:
     """Return aliased platform info (may be the same as un-aliased)."""
-    return _platform.platform(aliased=True)
+    return build_platform_string(aliased=True)
 
 
 def get_platform_uname() -> "PlatformUname":
@@ -215,14 +579,57 @@ def get_platform_python() -> "PlatformPython":
     return PlatformPython()
 
 
+def _get_uname_attr(attr: str) -> t.Callable[[], str]:
+    """Return a default_factory that reads a single attribute from platform.uname()."""
+
+    def _factory() -> str:
+        return getattr(_platform.uname(), attr)
+
+    return _factory
+
+
 def get_python_path() -> list[str]:
     """Return Python's PATH."""
     return sys.path
 
 
-def get_python_modules() -> t.Dict[str, ModuleType]:
-    """Return Python's loaded modules."""
-    return sys.modules
+def get_python_modules() -> ModuleInventory:
+    """Return an inventory of Python's loaded modules."""
+    return ModuleInventory.capture()
+
+
+def get_architecture() -> t.Tuple[str, str]:
+    """Return the (bits, linkage) architecture of the Python executable, i.e. `('64bit', 'ELF')`."""
+    return _architecture()
+
+
+def get_cpu_info() -> CPUInfo | None:
+    """Return CPU model & topology info parsed from /proc/cpuinfo (Linux only)."""
+    return _cpu_info()
+
+
+def get_cpu_features() -> CPUFeatures | None:
+    """Return the CPU's feature bitset, from /proc/cpuinfo or the HWCAPs (Linux only)."""
+    return _cpu_features()
+
+
+def get_processor() -> str:
+    """Return the processor name.
+
+    Description:
+        On Linux, the model name is read from /proc/cpuinfo instead of calling
+        `platform.processor()`, which spawns `uname -p` (and usually only returns
+        the machine type, i.e. 'x86_64', or 'unknown'). If /proc/cpuinfo has no model
+        name (i.e. some ARM CPUs), the machine type is returned.
+    """
+    if sys.platform != "linux":
+        return _processor()
+
+    cpu_info: CPUInfo | None = _cpu_info()
+    if cpu_info is not None and cpu_info.model_name:
+        return cpu_info.model_name
+
+    return _platform.machine()
 
 
 def get_sys_byteorder() -> str:
@@ -240,7 +647,7 @@ def get_os_release() -> dict[str, str]:
         case "Linux" | "Unix":
             return get_freedesktop_release()
         case "Darwin":
-            return EnumMac.VERSION.value
+            return get_mac_version()
         case _:
             log.warning(
                 f"Checking OS release on platform '{_platform.system()}' is not supported."
@@ -259,7 +666,8 @@ def get_libc_version() -> t.Tuple[str]:
         return None
 
     try:
-        libc_ver = EnumUnix.LIBC_VER.value
+        ## Drop the 'source' field, keep the (lib, version) shape of platform.libc_ver()
+        libc_ver = tuple(_libc_ver()[:2])
 
         return libc_ver
     except Exception as exc:
@@ -268,6 +676,116 @@ def get_libc_version() -> t.Tuple[str]:
         return None
 
 
+def get_libc_source() -> str | None:
+    """Return which source answered the libc version lookup, see `resolve_libc_version()`."""
+    if _platform.system() not in ["Linux", "Unix", "Darwin"]:
+        return None
+
+    try:
+        return _libc_ver().source
+    except Exception as exc:
+        log.warning(f"({type(exc)}) Unable to detect libc version. Details: {exc}")
+
+        return None
+
+
+class LibcVersion(t.NamedTuple):
+    """Result of a libc lookup & the source that answered it."""
+
+    lib: str
+    version: str
+    ## One of 'confstr', 'elf', 'musl-loader', 'binary-scan'
+    source: str
+
+
+def _libc_from_elf(dependencies: ElfDependencies) -> str | None:
+    """Identify the libc from an ELF binary's loader & needed libraries."""
+    for name in (dependencies.interpreter, *dependencies.needed):
+        if not name:
+            continue
+
+        name = os.path.basename(name)
+        if "musl" in name:
+            return "musl"
+        elif "uClibc" in name:
+            return "uClibc"
+        elif name.startswith("ld-linux") or name == "libc.so.6":
+            return "glibc"
+
+    return None
+
+
+def resolve_libc_version(executable: str | None = None) -> LibcVersion:
+    """Detect the libc version, trying cheap sources before scanning the executable.
+
+    Description:
+        Sources are tried in order, and the first that answers is reported as `source`:
+            - 'confstr': `os.confstr('CS_GNU_LIBC_VERSION')`, answers instantly on glibc.
+            - 'elf': The PT_INTERP/DT_NEEDED entries of the executable (version is unknown).
+            - 'musl-loader': A musl dynamic loader is installed (version is unknown).
+            - 'binary-scan': `platform.libc_ver()`, which regex-scans the whole executable.
+
+    Params:
+        executable (str | None): Binary to inspect. Defaults to `sys.executable`.
+
+    """
+    executable = executable or sys.executable
+
+    return _quick_libc_version(executable) or _scan_libc_version(executable)
+
+
+def _quick_libc_version(executable: str) -> LibcVersion | None:
+    """Detect the libc version without scanning the executable, see `resolve_libc_version()`."""
+    try:
+        parts: list[str] = os.confstr("CS_GNU_LIBC_VERSION").split(maxsplit=1)
+        if len(parts) == 2:
+            return LibcVersion(lib=parts[0], version=parts[1], source="confstr")
+    except (AttributeError, ValueError, OSError):
+        ## Not glibc, or os.confstr() is not available on this platform
+        pass
+
+    dependencies: ElfDependencies | None = read_elf_dependencies(executable)
+    if dependencies is not None:
+        lib: str | None = _libc_from_elf(dependencies)
+        if lib is not None:
+            return LibcVersion(lib=lib, version="", source="elf")
+
+    try:
+        if any(name.startswith("ld-musl-") for name in os.listdir("/lib")):
+            return LibcVersion(lib="musl", version="", source="musl-loader")
+    except OSError:
+        pass
+
+    return None
+
+
+def _scan_libc_version(executable: str | None = None) -> LibcVersion:
+    """Detect the libc version with `platform.libc_ver()`, which scans the executable."""
+    lib, version = _platform.libc_ver(executable or sys.executable)
+
+    return LibcVersion(lib=lib, version=version, source="binary-scan")
+
+
+def get_mac_version() -> t.Tuple[str, t.Tuple[str, str, str], str]:
+    """Return macOS version info, i.e. `('14.5', ('', '', ''), 'arm64')`."""
+    return _mac_ver()
+
+
+def get_win32_version() -> t.Tuple[str, str, str, str]:
+    """Return Windows version info (release, version, csd, ptype)."""
+    return _win32_ver()
+
+
+def get_win32_edition() -> str | None:
+    """Return Windows edition, i.e. 'Professional'."""
+    return _win32_edition()
+
+
+def get_win32_is_iot() -> bool:
+    """Return `True` if the Windows edition is an IoT edition."""
+    return _win32_is_iot()
+
+
 def get_freedesktop_release() -> dict[str, str] | None:
     """Return Linux freedesktop version."""
     match _platform.system():
@@ -406,330 +924,5256 @@ class EnumSystemTypes(Enum):
     JAVA: str = "Java"
 
 
-class EnumMac(Enum):
-    """Mac-specific platform info."""
+class EnumFieldClass(Enum):
+    """Classes of PlatformInfo fields, grouped by how often their values change."""
 
-    VERSION: t.Tuple[str] = _platform.mac_ver()
+    STATIC: str = "static"
+    VOLATILE: str = "volatile"
 
 
-class EnumWin32(Enum):
-    """Windows-spectific platform info."""
+############################################################
+# Memoized probes                                          #
+# -------------------------------------------------------- #
+# Values that do not change for the life of the process.   #
+#  Computed on first call instead of at import time, so    #
+#  importing this module does not probe the platform.      #
+############################################################
 
-    VERSION: t.Tuple[str] = _platform.win32_ver()
-    EDITION: str = _platform.win32_edition()
-    IS_IOT: bool = _platform.win32_is_iot()
 
+def _memoized_probe(func: t.Callable[[], T]) -> t.Callable[[], T]:
+    """Memoize a 0-argument probe with functools.cache, noting cache hits in probe stats.
 
-class EnumUnix(Enum):
-    LIBC_VER: t.Tuple[str] = _platform.libc_ver()
+    Description:
+        The wrapper keeps the functools.cache API (`cache_clear()` & `cache_info()`),
+        and adds `cache_set(value)` to memoize a value computed elsewhere, i.e. by
+        the probe's async version.
+    """
+    ## A value passed to cache_set(), returned by the next computation instead of func()
+    seeded: list[T] = []
 
+    def _compute() -> T:
+        return seeded.pop() if seeded else func()
 
-#######################################
-# Classes                             #
-# ----------------------------------- #
-# Classes to assist with initializing #
-#  PlatformInfo class object.         #
-#######################################
+    cached: t.Callable[[], T] = functools.cache(_compute)
 
+    @functools.wraps(func)
+    def wrapper() -> T:
+        if cached.cache_info().currsize:
+            _note_probe(cached=True)
 
-class CLISpinner(AbstractContextManager):
-    """Show a CLI spinner in a new thread (disappears when context manager exits).
+        return cached()
 
-    Description:
-        Wrap a function call in `with CLISpinner(message="..."):` to show a spinner in the CLI as the operation runs.
-        When the operation completes, the spinner will disappear.
+    def cache_set(value: T) -> None:
+        if not cached.cache_info().currsize:
+            seeded[:] = [value]
+            cached()
 
-        Useful for providing feedback to user on longer running operations.
-    """
+    wrapper.cache_clear = cached.cache_clear
+    wrapper.cache_info = cached.cache_info
+    wrapper.cache_set = cache_set
 
-    def __init__(self, message: str = "Processing..."):
-        self.message = message
-        self.stop_event = threading.Event()
-        self.spinner_thread = threading.Thread(target=self._spin)
+    return wrapper
 
-    def __enter__(self):
-        self.spinner_thread.start()
-        return self
 
-    def __exit__(self, exc_type, exc_value, traceback):
-        self.stop_event.set()
-        self.spinner_thread.join()
-        # Clear the line after the spinner stops
-        sys.stdout.write("\r" + " " * (len(self.message) + 4) + "\r")
-        sys.stdout.flush()
+@_memoized_probe
+def _mac_ver() -> t.Tuple[str, t.Tuple[str, str, str], str]:
+    return _platform.mac_ver()
 
-    def _spin(self):
-        spinner_cycle = itertools.cycle(["|", "/", "-", "\\"])
-        while not self.stop_event.is_set():
-            sys.stdout.write(f"\r{self.message} {next(spinner_cycle)}")
-            sys.stdout.flush()
-            time.sleep(0.1)
 
+@_memoized_probe
+def _win32_ver() -> t.Tuple[str, str, str, str]:
+    return _platform.win32_ver()
 
-@dataclass
-class DictMixin:
-    """Mixin class to add "as_dict()" method to classes. Equivalent to .__dict__.
 
-    Add a .as_dict() method to classes that inherit from this mixin. For example,
-    to add .as_dict() method to a parent class, where all children inherit the .as_dict()
-    function, declare parent as:
+@_memoized_probe
+def _win32_edition() -> str | None:
+    return _platform.win32_edition()
 
-    @dataclass
-    class Parent(DictMixin):
-        ...
 
-    and call like:
+@_memoized_probe
+def _win32_is_iot() -> bool:
+    return _platform.win32_is_iot()
 
-        p = Parent()
-        p_dict = p.as_dict()
-    """
 
-    def as_dict(self: t.Generic[T]) -> dict[str, t.Any]:
-        """Return dict representation of a dataclass instance."""
-        try:
-            return self.__dict__.copy()
+@_memoized_probe
+def _libc_ver() -> LibcVersion:
+    ## Only the binary scan is slow enough to be worth the disk cache. The other
+    #  sources answer quickly, & confstr() reports the system glibc, which can be
+    #  upgraded without the interpreter binary (the disk cache key) changing.
+    libc: LibcVersion | None = _quick_libc_version(sys.executable)
+    if libc is not None:
+        return libc
 
-        except Exception as exc:
-            raise Exception(
-                f"Unhandled exception converting class instance to dict. Details: {exc}"
-            )
+    return LibcVersion(*_disk_cached("libc", _scan_libc_version))
 
 
-@dataclass
-class PlatformUname(DictMixin):
-    system: str = _platform.uname().system
-    node: str = _platform.uname().node
-    release: str = _platform.uname().release
-    version: str = _platform.uname().version
-    machine: str = _platform.uname().machine
+@_memoized_probe
+def _cpu_info() -> CPUInfo | None:
+    if sys.platform != "linux":
+        return None
 
+    try:
+        ## 1 buffered read, /proc files are generated on each read
+        with open(CPUINFO_PATH, "r", encoding="utf-8", errors="replace") as f:
+            cpuinfo: str = f.read()
+    except OSError as exc:
+        log.warning(f"Unable to read '{CPUINFO_PATH}'. Details: {exc}")
+        return None
 
-@dataclass
-class PlatformPython(DictMixin):
-    """Information about the Python implementation for the platform."""
+    return parse_cpuinfo(cpuinfo)
 
-    build: t.Tuple[str, str] = field(default_factory=_platform.python_build)
-    compiler: str = field(default_factory=_platform.python_compiler)
-    branch: str = field(default_factory=_platform.python_branch)
-    implementation: str = field(default_factory=_platform.python_implementation)
-    revision: str = field(default_factory=_platform.python_revision)
-    version: str = field(default_factory=_platform.python_version)
-    version_tuple: t.Tuple[str, str, str] = field(
-        default_factory=_platform.python_version_tuple
-    )
-    path: t.List[str] = field(default_factory=get_python_path)
-    modules: t.Dict[str, ModuleType] = field(default_factory=get_python_modules)
-    base_prefix: str = field(default=sys.base_prefix)
-    exec_prefix: str = field(default=sys.exec_prefix)
-    copyright: str = field(default=sys.copyright)
-    dont_write_bytecode: bool = field(default=sys.dont_write_bytecode)
-    executable: str = field(default=sys.executable)
-    flags: t.Tuple[t.Union[int, bool]] = field(default=sys.flags)
-    float_info: t.Tuple[t.Union[int, float]] = field(default=sys.float_info)
-    default_encoding: str = field(default_factory=sys.getdefaultencoding)
-    int_max_str_digits: int = field(default_factory=sys.get_int_max_str_digits)
-    recursion_limit: int = field(default_factory=sys.getrecursionlimit)
-    maxsize: int = field(default=sys.maxsize)
-    maxunicode: int = field(default=sys.maxunicode)
 
+@_memoized_probe
+def _cpu_features() -> CPUFeatures | None:
+    if sys.platform != "linux":
+        return None
 
-@dataclass
-class PlatformSpecificInfo(DictMixin):
-    """Base class for platform-specific (i.e. Windows, Mac, Linux) info.
+    ## Every processor block repeats the features, only read the first one
+    lines: list[str] = []
+    try:
+        with open(CPUINFO_PATH, "r", encoding="utf-8", errors="replace") as f:
+            for line in f:
+                if not line.strip() and lines:
+                    break
 
-    Description:
-        Some of the platform module's functions are only available when a
-        specific platform is detected. This class serves as a base for
-        platform-specific "extra" data.
+                lines.append(line)
+    except OSError as exc:
+        log.debug(f"Unable to read '{CPUINFO_PATH}'. Details: {exc}")
 
-    """
+    features: CPUFeatures | None = parse_cpuinfo_features("".join(lines))
+    if features is not None or os.uname().machine not in ("aarch64", "arm64"):
+        return features
 
-    os: str = field(default_factory=_platform.system)
+    ## i.e. a sandbox without /proc/cpuinfo; the kernel still passes the HWCAPs
+    try:
+        with open(AUXV_PATH, "rb") as f:
+            auxv: bytes = f.read()
+    except OSError as exc:
+        log.debug(f"Unable to read '{AUXV_PATH}'. Details: {exc}")
+        return None
 
+    return aarch64_features_from_hwcaps(*parse_auxv_hwcaps(auxv))
 
-@dataclass
-class PlatformWinInfo(PlatformSpecificInfo):
-    """Windows-specific platform info."""
 
-    win32_ver: t.Tuple = field(default=EnumWin32.VERSION.value)
-    win32_edition: str = field(default=EnumWin32.EDITION.value)
-    win32_is_iot: bool = field(default=EnumWin32.IS_IOT.value)
+@_memoized_probe
+def _processor() -> str:
+    ## Runs 'uname -p' (off Windows), unless platform.uname() is already cached
+    return _platform.processor()
 
 
-@dataclass
-class PlatformUnixInfoBase(PlatformSpecificInfo):
-    """Unix-specific platform info."""
+@_memoized_probe
+def _architecture() -> t.Tuple[str, str]:
+    arch: t.Tuple[str, str] | None = _static_architecture()
+    if arch is not None:
+        return arch
 
-    libc_ver: t.Tuple[str] = field(default=get_libc_version)
+    ## Not an ELF binary (i.e. Mach-O, PE), let the platform module work it out. Runs
+    #  'file' (off Windows & OpenVMS).
+    arch = _platform.architecture()
+    _disk_cache_set("arch", arch)
 
+    return arch
 
-@dataclass
-class PlatformMacInfo(PlatformUnixInfoBase):
-    """Mac-specific platform info."""
 
-    mac_ver: t.Tuple[str] = field(default=get_os_release)
+def _static_architecture() -> t.Tuple[str, str] | None:
+    """Return the architecture from the disk cache or the executable's ELF header.
 
+    Description:
+        Shared by `get_architecture()` & `async_get_architecture()`. Returns `None`
+        when the executable is not an ELF binary & the caller has to fall back to
+        `platform.architecture()`, or run `file` itself.
+    """
+    arch: t.Tuple[str, str] | None = _disk_cache_get("arch")
+    if arch is not None:
+        return arch
 
-@dataclass
-class PlatformLinuxInfo(PlatformUnixInfoBase):
-    """Linux-specific platform info."""
+    elf_header: ElfHeader | None = read_elf_header(sys.executable)
+    if elf_header is None:
+        return None
 
-    os_release: dict[str, str] = field(default_factory=get_os_release)
+    arch = elf_header.architecture
+    _disk_cache_set("arch", arch)
 
+    return arch
 
-######################
+
+############################################################
+# Disk cache                                               #
+# -------------------------------------------------------- #
+# Persist expensive static probes between processes. The   #
+#  cache is keyed by the identity of the Python executable #
+#  & the kernel release, so a new interpreter binary or a  #
+#  kernel upgrade starts a new cache entry.                #
+############################################################
+
+## Set to a truthy value to enable the disk cache for every process
+DISK_CACHE_ENV_VAR: str = "PLATFORM_INFO_DISK_CACHE"
+## Override the directory the disk cache is stored in
+DISK_CACHE_DIR_ENV_VAR: str = "PLATFORM_INFO_CACHE_DIR"
+## Version of the cached values' format, stored in each cache file. Bump it when a
+#  value's shape changes (i.e. 'libc' gained a 'source'); files written with another
+#  version are treated as a cache miss.
+DISK_CACHE_SCHEMA_VERSION: int = 2
+
+## Active disk cache, configured from the environment on first use
+_disk_cache: InterpreterDiskCache | None = None
+_disk_cache_configured: bool = False
+
+
+def get_user_cache_dir() -> str:
+    """Return the platform's per-user cache directory for this script."""
+    match sys.platform:
+        case "win32":
+            base: str = os.environ.get("LOCALAPPDATA") or os.path.expanduser(
+                "~\\AppData\\Local"
+            )
+        case "darwin":
+            base: str = os.path.expanduser("~/Library/Caches")
+        case _:
+            base: str = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser(
+                "~/.cache"
+            )
+
+    return os.path.join(base, "platform_info")
+
+
+def enable_disk_cache(cache_dir: str | None = None) -> InterpreterDiskCache:
+    """Persist static probes (architecture, libc version) to disk for later processes."""
+    global _disk_cache, _disk_cache_configured
+
+    _disk_cache = InterpreterDiskCache(cache_dir=cache_dir)
+    _disk_cache_configured = True
+
+    return _disk_cache
+
+
+def disable_disk_cache() -> None:
+    """Stop reading & writing static probes from/to disk in this process."""
+    global _disk_cache, _disk_cache_configured
+
+    _disk_cache = None
+    _disk_cache_configured = True
+
+
+def get_disk_cache() -> InterpreterDiskCache | None:
+    """Return the active disk cache, or `None` when the disk cache is disabled."""
+    global _disk_cache, _disk_cache_configured
+
+    if not _disk_cache_configured:
+        _disk_cache_configured = True
+
+        if os.environ.get(DISK_CACHE_ENV_VAR, "").lower() in ("1", "true", "yes", "on"):
+            _disk_cache = InterpreterDiskCache(
+                cache_dir=os.environ.get(DISK_CACHE_DIR_ENV_VAR)
+            )
+
+    return _disk_cache
+
+
+def _disk_cached(name: str, probe: t.Callable[[], t.Tuple]) -> t.Tuple:
+    """Return a tuple-valued probe's result from the disk cache, or run & store it."""
+    value: t.Tuple | None = _disk_cache_get(name)
+    if value is not None:
+        return value
+
+    value = probe()
+    _disk_cache_set(name, value)
+
+    return value
+
+
+def _disk_cache_get(name: str) -> t.Tuple | None:
+    """Return a tuple-valued probe's result from the disk cache, if it is enabled & set."""
+    cache: InterpreterDiskCache | None = get_disk_cache()
+    if cache is None:
+        return None
+
+    value: list | None = cache.get(name)
+    if value is None:
+        return None
+
+    log.debug(f"Loaded '{name}' from disk cache: {cache.path}")
+    _note_probe(cached=True)
+
+    return tuple(value)
+
+
+def _disk_cache_set(name: str, value: t.Tuple) -> None:
+    """Store a tuple-valued probe's result in the disk cache, if it is enabled."""
+    cache: InterpreterDiskCache | None = get_disk_cache()
+    if cache is not None:
+        cache.set(name, value)
+
+
+class InterpreterDiskCache:
+    """Store static probe results in a JSON file keyed by interpreter identity.
+
+    Description:
+        The key is built from the Python executable's real path, inode, size & mtime,
+        plus the kernel release. When any of them change, a different file is used,
+        so stale results are never read. A file written with another
+        `DISK_CACHE_SCHEMA_VERSION` is ignored. Reading & writing are best-effort;
+        any `OSError` or corrupt file is treated as a cache miss.
+
+    Params:
+        cache_dir (str | None): Directory to store cache files in. Defaults to `get_user_cache_dir()`.
+        executable (str | None): Interpreter to key the cache on. Defaults to `sys.executable`.
+
+    """
+
+    def __init__(self, cache_dir: str | None = None, executable: str | None = None):
+        self.cache_dir: str = cache_dir or get_user_cache_dir()
+        self.executable: str = executable or sys.executable
+
+        self._key: str | None = None
+        self._entries: dict[str, t.Any] | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def key(self) -> str:
+        """Hash of the interpreter's identity & the kernel release."""
+        if self._key is None:
+            import hashlib
+
+            executable: str = os.path.realpath(self.executable)
+            stat: os.stat_result = os.stat(executable)
+            identity: str = "|".join(
+                str(part)
+                for part in (
+                    executable,
+                    stat.st_ino,
+                    stat.st_size,
+                    stat.st_mtime_ns,
+                    _platform.uname().release,
+                )
+            )
+            self._key = hashlib.sha256(identity.encode()).hexdigest()[:32]
+
+        return self._key
+
+    @property
+    def path(self) -> str:
+        return os.path.join(self.cache_dir, f"interpreter-{self.key}.json")
+
+    def _load(self) -> dict[str, t.Any]:
+        if self._entries is None:
+            import json
+
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    entries: t.Any = json.load(f)
+            except (OSError, ValueError) as exc:
+                log.debug(f"Disk cache miss ({type(exc).__name__}): {self.path}")
+                entries = {}
+
+            if (
+                not isinstance(entries, dict)
+                or entries.get("_schema") != DISK_CACHE_SCHEMA_VERSION
+            ):
+                entries = {"_schema": DISK_CACHE_SCHEMA_VERSION}
+
+            self._entries = entries
+
+        return self._entries
+
+    def get(self, name: str) -> t.Any | None:
+        """Return a cached value, or `None` if it is not cached."""
+        with self._lock:
+            return self._load().get(name)
+
+    def set(self, name: str, value: t.Any) -> None:
+        """Store a value & write the cache file (atomically replacing the old one)."""
+        import json
+
+        with self._lock:
+            entries: dict[str, t.Any] = self._load()
+            entries[name] = value
+
+            tmp_path: str = f"{self.path}.{os.getpid()}.tmp"
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(entries, f)
+                os.replace(tmp_path, self.path)
+            except OSError as exc:
+                log.debug(f"Unable to write disk cache '{self.path}'. Details: {exc}")
+
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
+    def clear(self) -> None:
+        """Delete this interpreter's cache file."""
+        with self._lock:
+            self._entries = None
+
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+
+
+############################################################
+# ELF parsing                                              #
+# -------------------------------------------------------- #
+# Read executable metadata from ELF headers (see elf(5))   #
+#  instead of spawning the 'file' utility.                 #
+############################################################
+
+ELF_MAGIC: bytes = b"\x7fELF"
+## Size of the ELF identification + header fields up to & including e_machine
+_ELF_PREFIX_SIZE: int = 20
+
+## EI_CLASS values
+_ELF_CLASSES: dict[int, str] = {1: "32bit", 2: "64bit"}
+## EI_DATA values
+_ELF_BYTEORDERS: dict[int, str] = {1: "little", 2: "big"}
+## Common e_machine values
+_ELF_MACHINES: dict[int, str] = {
+    3: "x86",
+    8: "mips",
+    20: "ppc",
+    21: "ppc64",
+    22: "s390",
+    40: "arm",
+    62: "x86_64",
+    183: "aarch64",
+    243: "riscv",
+    258: "loongarch",
+}
+
+
+class ElfHeader(t.NamedTuple):
+    """Fields from the identification & header of an ELF binary."""
+
+    bits: str
+    byteorder: str
+    machine: int
+
+    @property
+    def machine_name(self) -> str:
+        return _ELF_MACHINES.get(self.machine, f"unknown({self.machine})")
+
+    @property
+    def architecture(self) -> t.Tuple[str, str]:
+        """Return the bits & linkage, in the same shape as `platform.architecture`."""
+        return self.bits, "ELF"
+
+
+def _parse_elf_header(buf: t.Any) -> ElfHeader | None:
+    """Parse the ELF identification & e_machine from the start of a buffer."""
+    if len(buf) < _ELF_PREFIX_SIZE or buf[:4] != ELF_MAGIC:
+        return None
+
+    ei_class: int = buf[4]
+    byteorder: str | None = _ELF_BYTEORDERS.get(buf[5])
+    if ei_class not in _ELF_CLASSES or byteorder is None:
+        return None
+
+    ## e_machine is a 2-byte int at offset 18, in the binary's byte order
+    machine: int = int.from_bytes(buf[18:20], byteorder)
+
+    return ElfHeader(bits=_ELF_CLASSES[ei_class], byteorder=byteorder, machine=machine)
+
+
+def read_elf_header(path: str) -> ElfHeader | None:
+    """Parse the ELF header of a binary from a small memory-mapped prefix.
+
+    Returns `None` if the file cannot be read or is not an ELF binary.
+    """
+    import mmap
+
+    if not path:
+        return None
+
+    try:
+        with open(os.path.realpath(path), "rb") as f:
+            size: int = os.fstat(f.fileno()).st_size
+            if size < _ELF_PREFIX_SIZE:
+                return None
+
+            with mmap.mmap(
+                f.fileno(), _ELF_PREFIX_SIZE, access=mmap.ACCESS_READ
+            ) as prefix:
+                return _parse_elf_header(prefix)
+
+    except (OSError, ValueError) as exc:
+        log.debug(f"Unable to read ELF header from '{path}'. Details: {exc}")
+        return None
+
+
+## Program header types
+_PT_LOAD: int = 1
+_PT_DYNAMIC: int = 2
+_PT_INTERP: int = 3
+## Dynamic section tags
+_DT_NULL: int = 0
+_DT_NEEDED: int = 1
+_DT_STRTAB: int = 5
+
+
+class ElfDependencies(t.NamedTuple):
+    """Dynamic linking info of an ELF binary."""
+
+    ## Program interpreter (dynamic loader) from PT_INTERP, i.e. '/lib64/ld-linux-x86-64.so.2'
+    interpreter: str | None
+    ## Shared libraries from DT_NEEDED entries, i.e. ('libc.so.6',)
+    needed: t.Tuple[str, ...]
+
+
+def read_elf_dependencies(path: str) -> ElfDependencies | None:
+    """Read the PT_INTERP & DT_NEEDED entries of an ELF binary.
+
+    Description:
+        The binary is memory-mapped & only the header, program headers, dynamic
+        section & the needed strings are touched, so only a few pages are read no
+        matter how big the binary is. Returns `None` for non-ELF or unreadable files.
+    """
+    import mmap
+    import struct
+
+    if not path:
+        return None
+
+    try:
+        with open(os.path.realpath(path), "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                header: ElfHeader | None = _parse_elf_header(buf)
+                if header is None:
+                    return None
+
+                is_64bit: bool = header.bits == "64bit"
+                endian: str = "<" if header.byteorder == "little" else ">"
+
+                ## e_phoff, e_phentsize & e_phnum
+                if is_64bit:
+                    (phoff,) = struct.unpack_from(f"{endian}Q", buf, 0x20)
+                    phentsize, phnum = struct.unpack_from(f"{endian}HH", buf, 0x36)
+                    ## p_type, p_offset, p_vaddr, p_filesz
+                    phdr_fmt: str = f"{endian}I4xQQ8xQ"
+                    dyn_fmt: str = f"{endian}qQ"
+                else:
+                    (phoff,) = struct.unpack_from(f"{endian}I", buf, 0x1C)
+                    phentsize, phnum = struct.unpack_from(f"{endian}HH", buf, 0x2A)
+                    phdr_fmt = f"{endian}IIII"
+                    dyn_fmt = f"{endian}iI"
+
+                interpreter: str | None = None
+                dynamic: t.Tuple[int, int] | None = None
+                ## (p_vaddr, p_offset, p_filesz) of loadable segments
+                loads: list[t.Tuple[int, int, int]] = []
+
+                for index in range(phnum):
+                    p_type, p_offset, p_vaddr, p_filesz = struct.unpack_from(
+                        phdr_fmt, buf, phoff + index * phentsize
+                    )
+
+                    if p_type == _PT_INTERP:
+                        interpreter = (
+                            bytes(buf[p_offset : p_offset + p_filesz])
+                            .rstrip(b"\x00")
+                            .decode("utf-8", "replace")
+                        )
+                    elif p_type == _PT_DYNAMIC:
+                        dynamic = (p_offset, p_filesz)
+                    elif p_type == _PT_LOAD:
+                        loads.append((p_vaddr, p_offset, p_filesz))
+
+                needed: list[str] = []
+                if dynamic is not None:
+                    needed_offsets: list[int] = []
+                    strtab_vaddr: int | None = None
+                    dyn_size: int = struct.calcsize(dyn_fmt)
+
+                    for offset in range(dynamic[0], sum(dynamic), dyn_size):
+                        d_tag, d_val = struct.unpack_from(dyn_fmt, buf, offset)
+                        if d_tag == _DT_NULL:
+                            break
+                        elif d_tag == _DT_NEEDED:
+                            needed_offsets.append(d_val)
+                        elif d_tag == _DT_STRTAB:
+                            strtab_vaddr = d_val
+
+                    ## DT_STRTAB is a virtual address, map it to a file offset
+                    strtab: int | None = None
+                    for p_vaddr, p_offset, p_filesz in loads:
+                        if (
+                            strtab_vaddr is not None
+                            and p_vaddr <= strtab_vaddr < p_vaddr + p_filesz
+                        ):
+                            strtab = strtab_vaddr - p_vaddr + p_offset
+                            break
+
+                    if strtab is not None:
+                        for name_offset in needed_offsets:
+                            start: int = strtab + name_offset
+                            end: int = buf.find(b"\x00", start)
+                            needed.append(
+                                bytes(buf[start:end]).decode("utf-8", "replace")
+                            )
+
+    except (OSError, ValueError, struct.error) as exc:
+        log.debug(f"Unable to read ELF dependencies from '{path}'. Details: {exc}")
+        return None
+
+    return ElfDependencies(interpreter=interpreter, needed=tuple(needed))
+
+
+############################################################
+# Module inventory                                         #
+# -------------------------------------------------------- #
+# A compact copy of sys.modules: module names & where they #
+#  were loaded from, without references to module objects. #
+############################################################
+
+## ModuleRecord.kind values
+MODULE_KIND_BUILTIN: str = "builtin"
+MODULE_KIND_FROZEN: str = "frozen"
+MODULE_KIND_EXTENSION: str = "extension"
+MODULE_KIND_SOURCE: str = "source"
+MODULE_KIND_NAMESPACE: str = "namespace"
+## i.e. __main__ when running `python -c`, or objects inserted into sys.modules
+MODULE_KIND_OTHER: str = "other"
+
+
+class ModuleRecord(t.NamedTuple):
+    """A module loaded by the interpreter, see `ModuleInventory`."""
+
+    name: str
+    ## File the module was loaded from, `None` for builtin & namespace modules
+    origin: str | None
+    ## The module's `__version__`, when it is set (i.e. on top-level packages)
+    version: str | None
+    ## One of the MODULE_KIND_* values
+    kind: str
+
+
+class ModuleInventoryDiff(t.NamedTuple):
+    """Modules added, removed & changed (i.e. reloaded from another file) between 2 inventories."""
+
+    added: t.Tuple[ModuleRecord, ...]
+    removed: t.Tuple[ModuleRecord, ...]
+    changed: t.Tuple[ModuleRecord, ...]
+
+
+@functools.cache
+def _extension_suffixes() -> t.Tuple[str, ...]:
+    import importlib.machinery
+
+    return tuple(importlib.machinery.EXTENSION_SUFFIXES)
+
+
+def _module_record(name: str, module: t.Any) -> ModuleRecord:
+    """Describe a module from the values in its namespace.
+
+    Attributes are read from the module's `__dict__`, so a module-level `__getattr__`
+    (i.e. a lazy loader or a deprecation warning) is never called.
+    """
+    namespace: dict[str, t.Any] = getattr(module, "__dict__", None) or {}
+    spec: t.Any = namespace.get("__spec__")
+
+    origin: t.Any = namespace.get("__file__")
+    if not isinstance(origin, str):
+        origin = None
+    version: t.Any = namespace.get("__version__")
+    if not isinstance(version, str):
+        version = None
+
+    spec_origin: t.Any = getattr(spec, "origin", None)
+    if spec_origin == "built-in":
+        kind: str = MODULE_KIND_BUILTIN
+    elif spec_origin == "frozen":
+        kind = MODULE_KIND_FROZEN
+    elif origin is not None:
+        kind = (
+            MODULE_KIND_EXTENSION
+            if origin.endswith(_extension_suffixes())
+            else MODULE_KIND_SOURCE
+        )
+    elif getattr(spec, "submodule_search_locations", None) is not None:
+        kind = MODULE_KIND_NAMESPACE
+    else:
+        kind = MODULE_KIND_OTHER
+
+    return ModuleRecord(
+        name=sys.intern(name), origin=origin, version=version, kind=kind
+    )
+
+
+def _record_name(record: ModuleRecord) -> str:
+    return record.name
+
+
+## 1-character codes for ModuleRecord.kind, ModuleInventory stores 1 per module
+_MODULE_KIND_CODES: dict[str, str] = {
+    MODULE_KIND_BUILTIN: "b",
+    MODULE_KIND_FROZEN: "f",
+    MODULE_KIND_EXTENSION: "e",
+    MODULE_KIND_SOURCE: "s",
+    MODULE_KIND_NAMESPACE: "n",
+    MODULE_KIND_OTHER: "o",
+}
+_MODULE_KINDS_BY_CODE: dict[str, str] = {
+    code: kind for kind, code in _MODULE_KIND_CODES.items()
+}
+
+
+class ModuleInventory:
+    """Immutable inventory of loaded modules, sorted by name.
+
+    Description:
+        Describes each module with a `ModuleRecord` (name, origin, version & kind)
+        instead of holding the module objects, so an inventory does not keep modules
+        alive, has a short `repr()` & can be serialized. Build one from `sys.modules`
+        with `ModuleInventory.capture()`.
+
+        Records are stored by column: tuples of (interned) names & origins, 1
+        character per module for its kind, and only the versions that are set. Records
+        are built when they are read.
+
+        Iterating an inventory yields module names, and `inventory[name]` returns a
+        module's record. Use `filter()` to select modules by name prefix & `diff()` to
+        see which modules were imported between 2 inventories, i.e.:
+
+            before = ModuleInventory.capture()
+            import json
+            ModuleInventory.capture().diff(before).added
+
+    Params:
+        records (Iterable[ModuleRecord]): The inventory's records, in any order.
+
+    """
+
+    __slots__ = ("_names", "_origins", "_versions", "_kinds")
+
+    def __init__(self, records: t.Iterable[ModuleRecord] = ()):
+        ordered: list[ModuleRecord] = sorted(records, key=_record_name)
+
+        self._names: t.Tuple[str, ...] = tuple(
+            sys.intern(record.name) for record in ordered
+        )
+        self._origins: t.Tuple[str | None, ...] = tuple(
+            None if record.origin is None else sys.intern(record.origin)
+            for record in ordered
+        )
+        ## {index: version}, most modules do not set a version
+        self._versions: dict[int, str] = {
+            index: record.version
+            for index, record in enumerate(ordered)
+            if record.version is not None
+        }
+        self._kinds: str = "".join(
+            _MODULE_KIND_CODES[record.kind] for record in ordered
+        )
+
+    @classmethod
+    def capture(cls, modules: t.Mapping[str, t.Any] | None = None) -> ModuleInventory:
+        """Build an inventory of `modules` (default: `sys.modules`)."""
+        if modules is None:
+            modules = sys.modules
+
+        ## Copy the items first, another thread may import a module while we iterate
+        return cls(
+            _module_record(name, module)
+            for name, module in list(modules.items())
+            if module is not None
+        )
+
+    @property
+    def records(self) -> t.Tuple[ModuleRecord, ...]:
+        return tuple(self._record(index) for index in range(len(self._names)))
+
+    def _record(self, index: int) -> ModuleRecord:
+        return ModuleRecord(
+            name=self._names[index],
+            origin=self._origins[index],
+            version=self._versions.get(index),
+            kind=_MODULE_KINDS_BY_CODE[self._kinds[index]],
+        )
+
+    def _index(self, name: str) -> int:
+        import bisect
+
+        return bisect.bisect_left(self._names, name)
+
+    def get(self, name: str, default: t.Any = None) -> ModuleRecord | t.Any:
+        index: int = self._index(name)
+        if index < len(self._names) and self._names[index] == name:
+            return self._record(index)
+
+        return default
+
+    def names(self) -> t.Tuple[str, ...]:
+        return self._names
+
+    def filter(self, prefix: str) -> ModuleInventory:
+        """Return the modules whose name starts with `prefix`.
+
+        Pass a package name with a trailing dot (i.e. 'json.') to only select its
+        submodules.
+        """
+        start: int = self._index(prefix)
+        end: int = start
+        while end < len(self._names) and self._names[end].startswith(prefix):
+            end += 1
+
+        inventory: ModuleInventory = type(self).__new__(type(self))
+        inventory._names = self._names[start:end]
+        inventory._origins = self._origins[start:end]
+        inventory._versions = {
+            index - start: version
+            for index, version in self._versions.items()
+            if start <= index < end
+        }
+        inventory._kinds = self._kinds[start:end]
+
+        return inventory
+
+    def diff(self, other: ModuleInventory) -> ModuleInventoryDiff:
+        """Compare this inventory against an `other` (older) inventory.
+
+        `added` are modules in this inventory but not in `other`, `removed` are
+        modules only in `other`, and `changed` are this inventory's records for modules
+        whose origin, version or kind differ.
+        """
+        previous: dict[str, ModuleRecord] = {
+            record.name: record for record in other.records
+        }
+        added: list[ModuleRecord] = []
+        changed: list[ModuleRecord] = []
+
+        for record in self.records:
+            old: ModuleRecord | None = previous.pop(record.name, None)
+            if old is None:
+                added.append(record)
+            elif old != record:
+                changed.append(record)
+
+        return ModuleInventoryDiff(
+            added=tuple(added), removed=tuple(previous.values()), changed=tuple(changed)
+        )
+
+    def __getitem__(self, name: str) -> ModuleRecord:
+        record: ModuleRecord | None = self.get(name)
+        if record is None:
+            raise KeyError(name)
+
+        return record
+
+    def __contains__(self, name: object) -> bool:
+        if not isinstance(name, str):
+            return False
+
+        index: int = self._index(name)
+        return index < len(self._names) and self._names[index] == name
+
+    def __iter__(self) -> t.Iterator[str]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ModuleInventory):
+            return NotImplemented
+
+        return (self._names, self._origins, self._versions, self._kinds) == (
+            other._names,
+            other._origins,
+            other._versions,
+            other._kinds,
+        )
+
+    def __hash__(self) -> int:
+        return hash((self._names, self._origins, self._kinds))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self._names)} modules)"
+
+
+#######################################
+# Classes                             #
+# ----------------------------------- #
+# Classes to assist with initializing #
+#  PlatformInfo class object.         #
+#######################################
+
+
+class CLISpinner(AbstractContextManager):
+    """Show a CLI spinner in a new thread (disappears when context manager exits).
+
+    Description:
+        Wrap a function call in `with CLISpinner(message="..."):` to show a spinner in the CLI as the operation runs.
+        When the operation completes, the spinner will disappear.
+
+        Useful for providing feedback to user on longer running operations. The spinner
+        shows the elapsed time, and the progress reported with `update()`, i.e.
+        'Compiling platform information... | 12/25 probes 0.3s'.
+
+        The spinner is skipped entirely (no thread is started & nothing is written)
+        when the stream is not a TTY, i.e. when output is piped or captured. Exiting
+        wakes the spinner thread immediately, so it adds no latency to the wrapped call.
+
+    Params:
+        message (str): Message to show before the spinner.
+        stream (TextIO | None): Stream to write to. Defaults to `sys.stdout`.
+        interval (float): Seconds between spinner frames.
+        enabled (bool | None): Force the spinner on/off. Defaults to on when `stream` is a TTY.
+
+    """
+
+    def __init__(
+        self,
+        message: str = "Processing...",
+        stream: t.TextIO | None = None,
+        interval: float = 0.1,
+        enabled: bool | None = None,
+    ):
+        self.message = message
+        self.stream = stream
+        self.interval = interval
+        self.enabled = enabled
+        self.stop_event = threading.Event()
+        self.spinner_thread: threading.Thread | None = None
+        self.started: float | None = None
+        self.done: int = 0
+        self.total: int | None = None
+        ## Length of the last line written, to clear it on exit
+        self._width: int = 0
+
+    def _is_enabled(self, stream: t.TextIO) -> bool:
+        if self.enabled is not None:
+            return self.enabled
+
+        try:
+            return stream.isatty()
+        except (AttributeError, ValueError):
+            ## Closed or file-like streams
+            return False
+
+    def __enter__(self):
+        stream: t.TextIO = self.stream or sys.stdout
+        self.started = time.monotonic()
+
+        if self._is_enabled(stream):
+            self.stream = stream
+            ## Daemon, so an unexited spinner cannot keep the interpreter alive
+            self.spinner_thread = threading.Thread(
+                target=self._spin, name="platform_info_spinner", daemon=True
+            )
+            self.spinner_thread.start()
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.spinner_thread is None:
+            return
+
+        self.stop_event.set()
+        self.spinner_thread.join()
+        self.spinner_thread = None
+        # Clear the line after the spinner stops
+        self.stream.write("\r" + " " * self._width + "\r")
+        self.stream.flush()
+
+    def update(self, done: int, total: int | None = None) -> None:
+        """Report progress, i.e. the number of probes that finished out of `total`."""
+        self.done = done
+        if total is not None:
+            self.total = total
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the spinner was entered."""
+        return 0.0 if self.started is None else time.monotonic() - self.started
+
+    def status(self) -> str:
+        """Return the progress & elapsed time shown after the spinner."""
+        progress: str = f"{self.done}/{self.total} probes " if self.total else ""
+        return f"{progress}{self.elapsed:.1f}s"
+
+    def _spin(self):
+        spinner_cycle = itertools.cycle(["|", "/", "-", "\\"])
+        while True:
+            line: str = f"{self.message} {next(spinner_cycle)} {self.status()}"
+            self._width = max(self._width, len(line))
+            self.stream.write(f"\r{line}")
+            self.stream.flush()
+
+            ## Returns as soon as __exit__() sets the event
+            if self.stop_event.wait(self.interval):
+                break
+
+
+class DictMixin:
+    """Mixin class to add "as_dict()" method to classes. Equivalent to .__dict__.
+
+    Add a .as_dict() method to classes that inherit from this mixin. For example,
+    to add .as_dict() method to a parent class, where all children inherit the .as_dict()
+    function, declare parent as:
+
+    @dataclass
+    class Parent(DictMixin):
+        ...
+
+    and call like:
+
+        p = Parent()
+        p_dict = p.as_dict()
+    """
+
+    def as_dict(self: t.Generic[T]) -> dict[str, t.Any]:
+        """Return dict representation of a dataclass instance."""
+        try:
+            ## Skip private attributes, i.e. ReadOnlyMixin's flag
+            return {k: v for k, v in self.__dict__.items() if not k.startswith("_")}
+
+        except Exception as exc:
+            raise Exception(
+                f"Unhandled exception converting class instance to dict. Details: {exc}"
+            )
+
+
+class ReadOnlyMixin:
+    """Mixin class to allow locking a dataclass instance after it is initialized.
+
+    Once `make_read_only()` is called, assigning to or deleting an attribute raises
+    a `dataclasses.FrozenInstanceError`. Nested `ReadOnlyMixin` fields are locked too,
+    and dict fields (i.e. 'os_release') are replaced with a read-only
+    `MappingProxyType` of a copy. Used for snapshots that are shared between callers.
+    """
+
+    ## Not annotated, so dataclasses do not treat it as a field
+    _read_only = False
+
+    def __setattr__(self, name: str, value: t.Any) -> None:
+        if self._read_only:
+            raise FrozenInstanceError(
+                f"Cannot assign to field '{name}', {type(self).__name__} instance is read-only."
+            )
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name: str) -> None:
+        if self._read_only:
+            raise FrozenInstanceError(
+                f"Cannot delete field '{name}', {type(self).__name__} instance is read-only."
+            )
+        super().__delattr__(name)
+
+    def make_read_only(self) -> None:
+        """Lock this instance, any nested ReadOnlyMixin fields & any dict fields."""
+        for name, value in list(self.__dict__.items()):
+            self.__dict__[name] = _read_only_value(name, value)
+
+        object.__setattr__(self, "_read_only", True)
+
+
+def _read_only_value(name: str, value: t.Any) -> t.Any:
+    """Lock a field value of a read-only object: nested objects are locked, and public
+    dict fields are copied to a read-only mapping.
+    """
+    if isinstance(value, ReadOnlyMixin):
+        value.make_read_only()
+    elif isinstance(value, dict) and not name.startswith("_"):
+        return MappingProxyType(dict(value))
+
+    return value
+
+
+class LazyField:
+    """Descriptor for a dataclass field that is computed the first time it is read.
+
+    Description:
+        Declare a field as `name: str = LazyField(factory)` on a class that inherits
+        from `LazyFieldsMixin`. Until the field is read (or a value is passed to
+        `__init__`), it is "pending" & `factory` is not called. On the first read,
+        the value is computed & stored in the instance's `__dict__`. LazyField is a
+        non-data descriptor, so later reads are plain attribute lookups.
+
+    Params:
+        factory (Callable[[], Any]): Function that computes the field's value.
+
+    """
+
+    def __init__(self, factory: t.Callable[[], t.Any]):
+        self.factory = factory
+        self.name: str | None = None
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, obj: t.Any, objtype: type | None = None) -> t.Any:
+        if obj is None:
+            ## Class access, i.e. dataclasses reading the field's default
+            return self
+
+        value: t.Any = self.factory()
+        ## Values computed after a snapshot was locked are locked too
+        if obj.__dict__.get("_read_only"):
+            value = _read_only_value(self.name, value)
+
+        obj.__dict__[self.name] = value
+
+        return value
+
+    def __repr__(self) -> str:
+        return f"LazyField({getattr(self.factory, '__qualname__', self.factory)!r})"
+
+
+@functools.cache
+def _lazy_field_names(cls: type) -> t.Tuple[str, ...]:
+    return tuple(
+        _field.name for _field in fields(cls) if isinstance(_field.default, LazyField)
+    )
+
+
+class LazyFieldsMixin:
+    """Mixin class for dataclasses with `LazyField` fields.
+
+    Description:
+        The dataclass' `__init__` assigns each field's default, which for a lazy field
+        is the `LazyField` itself; those assignments are skipped so the field stays
+        pending. `repr()` & `as_dict(compute=False)` show pending fields without
+        computing them.
+
+        Subclasses are declared with `@dataclass(repr=False)`, so the generated
+        `__repr__` does not replace this mixin's.
+    """
+
+    def __setattr__(self, name: str, value: t.Any) -> None:
+        if isinstance(value, LazyField):
+            return
+        super().__setattr__(name, value)
+
+    def pending_fields(self) -> list[str]:
+        """Return the names of lazy fields that have not been computed yet."""
+        return [
+            name for name in _lazy_field_names(type(self)) if name not in self.__dict__
+        ]
+
+    def compute_fields(self) -> None:
+        """Compute every pending field."""
+        for name in self.pending_fields():
+            getattr(self, name)
+
+    def as_dict(self, compute: bool = True) -> dict[str, t.Any]:
+        """Return dict representation of a dataclass instance.
+
+        Params:
+            compute (bool): Compute pending fields first. When `False`, only the fields
+                that were already computed are returned.
+
+        """
+        if compute:
+            self.compute_fields()
+
+        return super().as_dict()
+
+    def __repr__(self) -> str:
+        values: list[str] = []
+        for _field in fields(self):
+            if not _field.repr:
+                continue
+
+            if _field.name in self.__dict__:
+                values.append(f"{_field.name}={self.__dict__[_field.name]!r}")
+            else:
+                values.append(f"{_field.name}=<pending>")
+
+        return f"{type(self).__qualname__}({', '.join(values)})"
+
+
+@dataclass(repr=False)
+class PlatformUname(LazyFieldsMixin, ReadOnlyMixin, DictMixin):
+    system: str = LazyField(_get_uname_attr("system"))
+    node: str = LazyField(_get_uname_attr("node"))
+    release: str = LazyField(_get_uname_attr("release"))
+    version: str = LazyField(_get_uname_attr("version"))
+    machine: str = LazyField(_get_uname_attr("machine"))
+
+
+@dataclass
+class CPUInfo(ReadOnlyMixin, DictMixin):
+    """CPU model & topology, parsed from /proc/cpuinfo."""
+
+    model_name: str | None = field(default=None)
+    vendor: str | None = field(default=None)
+    family: int | None = field(default=None)
+    model: int | None = field(default=None)
+    stepping: int | None = field(default=None)
+    microcode: str | None = field(default=None)
+    sockets: int | None = field(default=None)
+    cores: int | None = field(default=None)
+    threads: int | None = field(default=None)
+
+
+def _parse_cpuinfo_int(value: str | None) -> int | None:
+    if value is None:
+        return None
+
+    try:
+        return int(value, 0)
+    except ValueError:
+        return None
+
+
+def parse_cpuinfo(cpuinfo: str) -> CPUInfo:
+    """Parse the contents of /proc/cpuinfo into a CPUInfo object.
+
+    Description:
+        The model fields are read from the first processor block. Sockets are counted
+        from unique 'physical id' values, cores from unique ('physical id', 'core id')
+        pairs & threads from 'processor' entries. Architectures that do not report a
+        field (i.e. ARM has no 'model name') leave it as `None`.
+    """
+    first: dict[str, str] = {}
+    threads: int = 0
+    sockets: set[str] = set()
+    cores: set[t.Tuple[str, str]] = set()
+    physical_id: str = "0"
+
+    for line in cpuinfo.splitlines():
+        key, sep, value = line.partition(":")
+        if not sep:
+            continue
+
+        key = key.strip()
+        value = value.strip()
+
+        match key:
+            case "processor":
+                threads += 1
+            case "physical id":
+                physical_id = value
+                sockets.add(value)
+            case "core id":
+                cores.add((physical_id, value))
+
+        if threads <= 1:
+            first.setdefault(key, value)
+
+    return CPUInfo(
+        ## x86: 'model name', 32-bit ARM: 'Processor', MIPS: 'cpu model', POWER: 'cpu'
+        model_name=(
+            first.get("model name")
+            or first.get("Processor")
+            or first.get("cpu model")
+            or first.get("cpu")
+        ),
+        vendor=first.get("vendor_id") or first.get("CPU implementer"),
+        family=_parse_cpuinfo_int(first.get("cpu family")),
+        model=_parse_cpuinfo_int(first.get("model")),
+        stepping=_parse_cpuinfo_int(first.get("stepping")),
+        microcode=first.get("microcode"),
+        sockets=len(sockets) or (1 if threads else None),
+        cores=len(cores) or threads or None,
+        threads=threads or None,
+    )
+
+
+################
+# CPU features #
+################
+
+## Known CPU feature names; a feature's bit in `CPUFeatures.bits` is its index here.
+#  x86 names are /proc/cpuinfo 'flags', ARM names are /proc/cpuinfo 'Features' (the
+#  kernel's HWCAP names). Only append to this tuple, so serialized bitsets keep
+#  their meaning.
+CPU_FEATURE_NAMES: t.Tuple[str, ...] = (
+    ## x86
+    "fpu",
+    "cx8",
+    "cmov",
+    "mmx",
+    "fxsr",
+    "sse",
+    "sse2",
+    "syscall",
+    "lm",
+    "pni",
+    "ssse3",
+    "sse4_1",
+    "sse4_2",
+    "cx16",
+    "popcnt",
+    "lahf_lm",
+    "movbe",
+    "abm",
+    "bmi1",
+    "bmi2",
+    "fma",
+    "f16c",
+    "xsave",
+    "avx",
+    "avx2",
+    "aes",
+    "pclmulqdq",
+    "vaes",
+    "vpclmulqdq",
+    "sha_ni",
+    "rdrand",
+    "rdseed",
+    "adx",
+    "gfni",
+    "erms",
+    "fsrm",
+    "avx_vnni",
+    "avx512f",
+    "avx512dq",
+    "avx512cd",
+    "avx512bw",
+    "avx512vl",
+    "avx512ifma",
+    "avx512vbmi",
+    "avx512_vbmi2",
+    "avx512_vnni",
+    "avx512_bitalg",
+    "avx512_vpopcntdq",
+    "avx512_bf16",
+    "avx512_fp16",
+    "amx_tile",
+    "amx_int8",
+    "amx_bf16",
+    "hypervisor",
+    ## 32-bit ARM
+    "vfp",
+    "vfpv3",
+    "vfpv4",
+    "neon",
+    "idiva",
+    ## 64-bit ARM, AT_HWCAP bits 0-31 (in order), then AT_HWCAP2 bits 0-17
+    "fp",
+    "asimd",
+    "evtstrm",
+    "pmull",
+    "sha1",
+    "sha2",
+    "crc32",
+    "atomics",
+    "fphp",
+    "asimdhp",
+    "cpuid",
+    "asimdrdm",
+    "jscvt",
+    "fcma",
+    "lrcpc",
+    "dcpop",
+    "sha3",
+    "sm3",
+    "sm4",
+    "asimddp",
+    "sha512",
+    "sve",
+    "asimdfhm",
+    "dit",
+    "uscat",
+    "ilrcpc",
+    "flagm",
+    "ssbs",
+    "sb",
+    "paca",
+    "pacg",
+    "dcpodp",
+    "sve2",
+    "sveaes",
+    "svepmull",
+    "svebitperm",
+    "svesha3",
+    "svesm4",
+    "flagm2",
+    "frint",
+    "svei8mm",
+    "svef32mm",
+    "svef64mm",
+    "svebf16",
+    "i8mm",
+    "bf16",
+    "dgh",
+    "rng",
+    "bti",
+)
+
+## {feature name: bit}
+_CPU_FEATURE_BITS: dict[str, int] = {
+    name: 1 << index for index, name in enumerate(CPU_FEATURE_NAMES)
+}
+
+## Common spellings of features, i.e. 'SSE4.2' or 'AVX-512': {alias: {architecture
+#  family ('x86', 'arm' or 'aarch64', '' for every family): feature name}}
+_CPU_FEATURE_ALIASES: dict[str, dict[str, str]] = {
+    "sse3": {"": "pni"},
+    "sse4.1": {"": "sse4_1"},
+    "sse4.2": {"": "sse4_2"},
+    "lzcnt": {"": "abm"},
+    "avx512": {"": "avx512f"},
+    "avx-512": {"": "avx512f"},
+    "sha": {"x86": "sha_ni", "arm": "sha2", "aarch64": "sha2"},
+    ## 64-bit ARM reports NEON as 'asimd'
+    "neon": {"arm": "neon", "aarch64": "asimd"},
+}
+
+## 64-bit ARM AT_HWCAP & AT_HWCAP2 names, by bit (arch/arm64/include/uapi/asm/hwcap.h)
+_AARCH64_HWCAP_NAMES: t.Tuple[str, ...] = (
+    "fp",
+    "asimd",
+    "evtstrm",
+    "aes",
+    "pmull",
+    "sha1",
+    "sha2",
+    "crc32",
+    "atomics",
+    "fphp",
+    "asimdhp",
+    "cpuid",
+    "asimdrdm",
+    "jscvt",
+    "fcma",
+    "lrcpc",
+    "dcpop",
+    "sha3",
+    "sm3",
+    "sm4",
+    "asimddp",
+    "sha512",
+    "sve",
+    "asimdfhm",
+    "dit",
+    "uscat",
+    "ilrcpc",
+    "flagm",
+    "ssbs",
+    "sb",
+    "paca",
+    "pacg",
+)
+_AARCH64_HWCAP2_NAMES: t.Tuple[str, ...] = (
+    "dcpodp",
+    "sve2",
+    "sveaes",
+    "svepmull",
+    "svebitperm",
+    "svesha3",
+    "svesm4",
+    "flagm2",
+    "frint",
+    "svei8mm",
+    "svef32mm",
+    "svef64mm",
+    "svebf16",
+    "i8mm",
+    "bf16",
+    "dgh",
+    "rng",
+    "bti",
+)
+## auxv entry types
+_AT_HWCAP: int = 16
+_AT_HWCAP2: int = 26
+
+
+def _cpu_feature_family(machine: str) -> str:
+    """Return the architecture family of a machine type, i.e. 'x86' for 'AMD64'."""
+    machine = machine.lower()
+    if machine in ("aarch64", "arm64"):
+        return "aarch64"
+    if machine.startswith("arm"):
+        return "arm"
+    if machine in ("x86_64", "amd64", "x86", "i386", "i486", "i586", "i686"):
+        return "x86"
+
+    return machine
+
+
+def _cpu_feature_names(feature: str) -> t.Tuple[str, ...]:
+    """Return the names a feature (or alias) stands for, on any architecture."""
+    name: str = feature.lower()
+    names: t.Tuple[str, ...] = (
+        tuple(_CPU_FEATURE_ALIASES[name].values())
+        if name in _CPU_FEATURE_ALIASES
+        else (name,)
+    )
+    if any(alias not in _CPU_FEATURE_BITS for alias in names):
+        raise ValueError(f"Unknown CPU feature: '{feature}'")
+
+    return names
+
+
+def cpu_feature_mask(*features: str, machine: str | None = None) -> int:
+    """Return the bitset of CPU features, i.e. to test many features with 1 `&`.
+
+    Description:
+        Names are case-insensitive, and can be aliases like 'SSE4.2' or 'AVX-512'.
+        Build a mask once, then test it against `CPUFeatures.bits`:
+        `features.has_mask(cpu_feature_mask("avx2", "fma"))`.
+
+        Aliases that are spelled differently on each architecture (i.e. 'neon' is
+        'asimd' on 64-bit ARM) are resolved for `machine`. An alias with no
+        feature on that architecture (i.e. 'neon' on x86) never matches.
+
+    Params:
+        features (str): Feature names, see `CPU_FEATURE_NAMES`.
+        machine (str | None): Machine type the mask is for, i.e. 'aarch64'. Defaults
+            to this host's `platform.machine()`.
+
+    Raises:
+        ValueError: When a feature name is not known.
+
+    """
+    mask: int = 0
+    family: str | None = None
+    for feature in features:
+        names: t.Tuple[str, ...] = _cpu_feature_names(feature)
+        aliases: dict[str, str] | None = _CPU_FEATURE_ALIASES.get(feature.lower())
+        if aliases and len(names) > 1:
+            ## Only look up the machine when an alias depends on it
+            if family is None:
+                family = _cpu_feature_family(machine or _platform.machine())
+
+            resolved: str | None = aliases.get(family) or aliases.get("")
+            ## Features of other architectures are never set, so the mask never matches
+            names = (resolved,) if resolved else names
+
+        for name in names:
+            mask |= _CPU_FEATURE_BITS[name]
+
+    return mask
+
+
+## Features required by each x86-64 microarchitecture level (x86-64 psABI)
+_X86_64_LEVEL_MASKS: t.Tuple[int, ...] = (
+    cpu_feature_mask(
+        "lm", "cmov", "cx8", "fpu", "fxsr", "mmx", "syscall", "sse", "sse2"
+    ),
+    cpu_feature_mask("cx16", "lahf_lm", "popcnt", "pni", "sse4_1", "sse4_2", "ssse3"),
+    cpu_feature_mask(
+        "avx", "avx2", "bmi1", "bmi2", "f16c", "fma", "abm", "movbe", "xsave"
+    ),
+    cpu_feature_mask("avx512f", "avx512bw", "avx512cd", "avx512dq", "avx512vl"),
+)
+
+
+class CPUFeatures(t.NamedTuple):
+    """The CPU's features (i.e. SIMD instruction sets), as a bitset.
+
+    Description:
+        Bit `i` of `bits` is set when the CPU has feature `CPU_FEATURE_NAMES[i]`.
+        Features that are not in `CPU_FEATURE_NAMES` are not kept.
+    """
+
+    bits: int
+    ## Where the features were read from: 'cpuinfo' or 'auxv'
+    source: str
+
+    @classmethod
+    def from_names(cls, names: t.Iterable[str], source: str) -> CPUFeatures:
+        """Build a bitset from feature names. Unknown names are skipped."""
+        bits: int = 0
+        for name in names:
+            bits |= _CPU_FEATURE_BITS.get(name.lower(), 0)
+
+        return cls(bits=bits, source=source)
+
+    @property
+    def names(self) -> t.Tuple[str, ...]:
+        """The names of the features that are set, in `CPU_FEATURE_NAMES` order."""
+        return tuple(name for name, bit in _CPU_FEATURE_BITS.items() if self.bits & bit)
+
+    def has_feature(self, feature: str) -> bool:
+        """Return `True` if the CPU has a feature.
+
+        Description:
+            Names are case-insensitive, i.e. 'avx2' or 'SSE4.2'. An alias matches
+            if the feature it stands for on any architecture is set, i.e. 'neon'
+            matches 'asimd' on 64-bit ARM.
+
+        Raises:
+            ValueError: When the feature name is not known.
+
+        """
+        return any(
+            self.bits & _CPU_FEATURE_BITS[name] for name in _cpu_feature_names(feature)
+        )
+
+    def has_mask(self, mask: int) -> bool:
+        """Return `True` if the CPU has every feature in a `cpu_feature_mask()`.
+
+        Description:
+            Build masks for another host's features with its machine type, i.e.
+            `cpu_feature_mask("neon", machine="aarch64")`.
+        """
+        return self.bits & mask == mask
+
+    @property
+    def x86_64_level(self) -> int | None:
+        """The highest x86-64 microarchitecture level (1-4) the CPU supports.
+
+        `None` when the CPU does not support the x86-64 baseline (v1), i.e. on ARM.
+        """
+        level: int = 0
+        for mask in _X86_64_LEVEL_MASKS:
+            if self.bits & mask != mask:
+                break
+
+            level += 1
+
+        return level or None
+
+
+def parse_cpuinfo_features(cpuinfo: str) -> CPUFeatures | None:
+    """Parse the first processor's features from /proc/cpuinfo.
+
+    Description:
+        Reads the 'flags' (x86) or 'Features' (ARM) line. Returns `None` when there
+        is no feature line.
+    """
+    for line in cpuinfo.splitlines():
+        key, sep, value = line.partition(":")
+        if sep and key.strip() in ("flags", "Features"):
+            return CPUFeatures.from_names(value.split(), source="cpuinfo")
+
+    return None
+
+
+def parse_auxv_hwcaps(auxv: bytes) -> t.Tuple[int, int]:
+    """Return the (AT_HWCAP, AT_HWCAP2) values of a process' auxiliary vector.
+
+    Params:
+        auxv (bytes): Contents of /proc/self/auxv, (type, value) pairs of native
+            unsigned longs.
+
+    """
+    import struct
+
+    entry_size: int = struct.calcsize("@LL")
+    hwcap: int = 0
+    hwcap2: int = 0
+    for key, value in struct.iter_unpack(
+        "@LL", auxv[: len(auxv) - len(auxv) % entry_size]
+    ):
+        if key == _AT_HWCAP:
+            hwcap = value
+        elif key == _AT_HWCAP2:
+            hwcap2 = value
+        elif key == 0:
+            ## AT_NULL ends the vector
+            break
+
+    return hwcap, hwcap2
+
+
+def aarch64_features_from_hwcaps(hwcap: int, hwcap2: int) -> CPUFeatures:
+    """Build a CPUFeatures bitset from 64-bit ARM AT_HWCAP & AT_HWCAP2 values."""
+    return CPUFeatures.from_names(
+        [name for bit, name in enumerate(_AARCH64_HWCAP_NAMES) if hwcap >> bit & 1]
+        + [name for bit, name in enumerate(_AARCH64_HWCAP2_NAMES) if hwcap2 >> bit & 1],
+        source="auxv",
+    )
+
+
+##############
+# CPU limits #
+##############
+
+
+class CPULimits(t.NamedTuple):
+    """CPUs this process can use: logical CPUs limited by affinity, cpuset & cgroup quota.
+
+    Limits that do not apply (or cannot be read) are `None`. `quota` is in CPUs, i.e.
+    `1.5` for a cgroup limited to 150ms of CPU time per 100ms.
+    """
+
+    ## os.cpu_count(), the host's CPUs
+    logical: int | None
+    ## CPUs in the process' scheduler affinity mask (os.sched_getaffinity())
+    affinity: int | None
+    ## CPUs in the cgroup's effective cpuset
+    cpuset: int | None
+    ## cgroup CPU bandwidth limit, in CPUs
+    quota: float | None
+    ## cgroup version the limits were read from (1 or 2)
+    cgroup_version: int | None
+
+    @property
+    def effective(self) -> int:
+        """The number of CPUs to size pools with: the lowest limit, at least 1.
+
+        A fractional quota is rounded down, so a pool does not oversubscribe it.
+        """
+        limits: list[int] = [
+            limit
+            for limit in (self.logical, self.affinity, self.cpuset)
+            if limit is not None
+        ]
+        if self.quota is not None:
+            limits.append(int(self.quota))
+
+        return max(min(limits, default=1), 1)
+
+
+## (cgroup version, cpu controller directory, cpuset controller directory). The cpu
+#  directory has cpu.max (v2) or cpu.cfs_quota_us & cpu.cfs_period_us (v1), the
+#  cpuset directory has cpuset.cpus.effective (v2) or cpuset.effective_cpus (v1).
+CgroupCPUDirs = t.Tuple[int, t.Optional[str], t.Optional[str]]
+
+## Characters the kernel octal-escapes in /proc/self/mountinfo paths
+_MOUNTINFO_ESCAPES: dict[str, str] = {
+    "\\040": " ",
+    "\\011": "\t",
+    "\\012": "\n",
+    "\\134": "\\",
+}
+
+
+def _unescape_mountinfo(value: str) -> str:
+    if "\\" not in value:
+        return value
+
+    for escaped, char in _MOUNTINFO_ESCAPES.items():
+        value = value.replace(escaped, char)
+
+    return value
+
+
+def _cgroup_dir(mount: t.Tuple[str, str], path: str) -> str:
+    """Join a /proc/self/cgroup path to the (root, mount point) of its hierarchy."""
+    root, mount_point = mount
+    relative: str = os.path.relpath(path, root)
+    if relative.startswith(".."):
+        ## i.e. in a container without a cgroup namespace, the process' cgroup is
+        #  mounted as the root of the hierarchy
+        return mount_point
+
+    return os.path.normpath(os.path.join(mount_point, relative))
+
+
+def parse_cgroup_cpu_dirs(cgroup: str, mountinfo: str) -> CgroupCPUDirs | None:
+    """Find the cgroup directories of the cpu & cpuset controllers.
+
+    Description:
+        Matches the process' cgroups (the contents of /proc/self/cgroup) with the
+        cgroup mounts in /proc/self/mountinfo. cgroup v1 controllers are preferred,
+        since on 'hybrid' hosts the v2 hierarchy has no controllers. Returns `None`
+        when neither controller is mounted, i.e. outside of Linux.
+
+    Params:
+        cgroup (str): Contents of /proc/self/cgroup, i.e. '0::/kubepods/pod1/abc'.
+        mountinfo (str): Contents of /proc/self/mountinfo.
+
+    """
+    ## {controller: path}, '' for the cgroup v2 hierarchy
+    paths: dict[str, str] = {}
+    for line in cgroup.splitlines():
+        if line.count(":") < 2:
+            continue
+
+        _, controllers, path = line.split(":", 2)
+        for controller in controllers.split(",") if controllers else [""]:
+            paths[controller] = path
+
+    ## {controller: (root, mount point)}, '' for the cgroup v2 mount
+    mounts: dict[str, t.Tuple[str, str]] = {}
+    for line in mountinfo.splitlines():
+        left, _, right = line.partition(" - ")
+        mount_fields: list[str] = left.split()
+        right_fields: list[str] = right.split()
+        if len(mount_fields) < 5 or len(right_fields) < 3:
+            continue
+
+        mount: t.Tuple[str, str] = (
+            _unescape_mountinfo(mount_fields[3]),
+            _unescape_mountinfo(mount_fields[4]),
+        )
+        if right_fields[0] == "cgroup2":
+            mounts.setdefault("", mount)
+        elif right_fields[0] == "cgroup":
+            for option in right_fields[2].split(","):
+                if option in ("cpu", "cpuset"):
+                    mounts.setdefault(option, mount)
+
+    cpu_dir, cpuset_dir = (
+        (
+            _cgroup_dir(mounts[controller], paths[controller])
+            if controller in mounts and controller in paths
+            else None
+        )
+        for controller in ("cpu", "cpuset")
+    )
+    if cpu_dir or cpuset_dir:
+        return (1, cpu_dir, cpuset_dir)
+
+    if "" in mounts and "" in paths:
+        directory: str = _cgroup_dir(mounts[""], paths[""])
+        return (2, directory, directory)
+
+    return None
+
+
+@functools.cache
+def get_cgroup_cpu_dirs() -> CgroupCPUDirs | None:
+    """Return this process' cgroup CPU directories. Looked up once, then cached."""
+    if sys.platform != "linux":
+        return None
+
+    try:
+        with open(CGROUP_PATH, "r", encoding="utf-8") as f:
+            cgroup: str = f.read()
+        with open(MOUNTINFO_PATH, "r", encoding="utf-8") as f:
+            mountinfo: str = f.read()
+    except OSError as exc:
+        log.debug(f"Unable to read the process' cgroups. Details: {exc}")
+        return None
+
+    return parse_cgroup_cpu_dirs(cgroup, mountinfo)
+
+
+def _read_sys_file(directory: str | None, name: str) -> str | None:
+    if directory is None:
+        return None
+
+    try:
+        with open(os.path.join(directory, name), "r", encoding="utf-8") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def parse_cpu_list(cpu_list: str) -> int:
+    """Count the CPUs in a kernel CPU list, i.e. '0-3,8,10-11' => 7."""
+    count: int = 0
+    for part in cpu_list.split(","):
+        if not part.strip():
+            continue
+
+        first, _, last = part.partition("-")
+        count += int(last) - int(first) + 1 if last else 1
+
+    return count
+
+
+def expand_cpu_list(cpu_list: str) -> t.Tuple[int, ...]:
+    """Expand a kernel CPU list into CPU numbers, i.e. '0-2,8' => (0, 1, 2, 8)."""
+    cpus: list[int] = []
+    for part in cpu_list.split(","):
+        if not part.strip():
+            continue
+
+        first, _, last = part.partition("-")
+        cpus.extend(range(int(first), int(last or first) + 1))
+
+    return tuple(cpus)
+
+
+def read_cgroup_cpu_quota(dirs: CgroupCPUDirs) -> float | None:
+    """Return the cgroup's CPU bandwidth limit in CPUs, or `None` if it is unlimited."""
+    version, cpu_dir, _ = dirs
+    if version == 2:
+        ## i.e. 'max 100000' or '200000 100000'
+        cpu_max: str | None = _read_sys_file(cpu_dir, "cpu.max")
+        if not cpu_max:
+            return None
+
+        quota, _, period = cpu_max.partition(" ")
+    else:
+        quota = _read_sys_file(cpu_dir, "cpu.cfs_quota_us")
+        period = _read_sys_file(cpu_dir, "cpu.cfs_period_us")
+
+    ## v1 uses -1 for no limit
+    if not quota or not period or quota in ("max", "-1"):
+        return None
+
+    try:
+        return int(quota) / int(period)
+    except (ValueError, ZeroDivisionError):
+        return None
+
+
+def read_cgroup_cpuset(dirs: CgroupCPUDirs) -> int | None:
+    """Return the number of CPUs in the cgroup's effective cpuset."""
+    version, _, cpuset_dir = dirs
+    name: str = "cpuset.cpus.effective" if version == 2 else "cpuset.effective_cpus"
+    cpu_list: str | None = _read_sys_file(cpuset_dir, name)
+    if not cpu_list:
+        return None
+
+    try:
+        return parse_cpu_list(cpu_list) or None
+    except ValueError:
+        return None
+
+
+def get_cpu_limits() -> CPULimits:
+    """Return the logical CPU count, & the affinity, cpuset & cgroup quota limits on it.
+
+    Description:
+        `os.cpu_count()` (like `multiprocessing.cpu_count()`) returns the host's CPUs,
+        i.e. 64 in a container limited to 2 CPUs. Use `CPULimits.effective` (or
+        `get_effective_cpu_count()`) to size thread & process pools.
+
+        The cgroup directories are looked up once, the limits are read on every call.
+    """
+    try:
+        affinity: int | None = len(os.sched_getaffinity(0))
+    except (AttributeError, OSError):
+        ## Not available on Windows & macOS
+        affinity = None
+
+    dirs: CgroupCPUDirs | None = get_cgroup_cpu_dirs()
+
+    return CPULimits(
+        logical=os.cpu_count(),
+        affinity=affinity,
+        cpuset=None if dirs is None else read_cgroup_cpuset(dirs),
+        quota=None if dirs is None else read_cgroup_cpu_quota(dirs),
+        cgroup_version=None if dirs is None else dirs[0],
+    )
+
+
+def get_effective_cpu_count() -> int:
+    """Return the number of CPUs this process can use, see `CPULimits.effective`."""
+    return get_cpu_limits().effective
+
+
+################
+# CPU topology #
+################
+
+
+class NUMANode(t.NamedTuple):
+    """A NUMA node: its CPUs & local memory."""
+
+    node: int
+    ## Online CPUs in the node
+    cpus: t.Tuple[int, ...]
+    ## Memory attached to the node, in bytes
+    memory_total: int | None
+
+
+class CPUTopology(t.NamedTuple):
+    """Which socket, NUMA node & core each online CPU (hardware thread) belongs to.
+
+    Description:
+        Each CPU is stored as a `(cpu, socket, node, core)` tuple, sorted by CPU. Core
+        numbers are only unique within a socket. `as_tree()` returns the same CPUs as
+        a socket -> node -> core -> SMT threads mapping.
+
+        The `*_cpus()` methods return CPU sets for pinning with `os.sched_setaffinity()`,
+        i.e. `os.sched_setaffinity(0, topology.primary_threads(topology.node_cpus(0)))`
+        runs the process on 1 thread of each core in NUMA node 0.
+    """
+
+    ## (cpu, socket, node, core) for each online CPU
+    cpus: t.Tuple[t.Tuple[int, int, int, int], ...]
+    nodes: t.Tuple[NUMANode, ...]
+
+    @classmethod
+    def from_json_dict(cls, data: dict[str, t.Any]) -> CPUTopology:
+        """Load a CPUTopology from its JSON dict (lists instead of tuples)."""
+        return cls(
+            cpus=tuple(tuple(cpu) for cpu in data.get("cpus") or ()),
+            nodes=tuple(
+                NUMANode(
+                    node=node["node"],
+                    cpus=tuple(node["cpus"]),
+                    memory_total=node.get("memory_total"),
+                )
+                for node in data.get("nodes") or ()
+            ),
+        )
+
+    @property
+    def sockets(self) -> t.Tuple[int, ...]:
+        """The socket (physical package) numbers."""
+        return tuple(sorted({socket for _, socket, _, _ in self.cpus}))
+
+    def as_tree(self) -> dict[int, dict[int, dict[int, t.Tuple[int, ...]]]]:
+        """Return the CPUs as {socket: {node: {core: (SMT thread CPUs, ...)}}}."""
+        tree: dict[int, dict[int, dict[int, t.Tuple[int, ...]]]] = {}
+        for cpu, socket, node, core in self.cpus:
+            cores: dict[int, t.Tuple[int, ...]] = tree.setdefault(
+                socket, {}
+            ).setdefault(node, {})
+            cores[core] = cores.get(core, ()) + (cpu,)
+
+        return tree
+
+    def socket_cpus(self, socket: int) -> frozenset[int]:
+        """Return the CPUs in a socket."""
+        return frozenset(cpu for cpu, _socket, _, _ in self.cpus if _socket == socket)
+
+    def node_cpus(self, node: int) -> frozenset[int]:
+        """Return the CPUs in a NUMA node."""
+        return frozenset(cpu for cpu, _, _node, _ in self.cpus if _node == node)
+
+    def core_cpus(self, cpu: int) -> frozenset[int]:
+        """Return a CPU's SMT siblings: the CPUs that share its core (including itself)."""
+        core_key: t.Tuple[int, int] | None = next(
+            ((socket, core) for _cpu, socket, _, core in self.cpus if _cpu == cpu),
+            None,
+        )
+
+        return frozenset(
+            _cpu for _cpu, socket, _, core in self.cpus if (socket, core) == core_key
+        )
+
+    def primary_threads(self, cpus: t.Iterable[int] | None = None) -> frozenset[int]:
+        """Return 1 CPU (the lowest numbered thread) per core.
+
+        Description:
+            Pin latency-critical workers to these CPUs so no 2 workers share a core.
+
+        Params:
+            cpus (Iterable[int] | None): Only consider these CPUs, i.e.
+                `node_cpus(0)`. Defaults to every online CPU.
+
+        """
+        allowed: frozenset[int] | None = None if cpus is None else frozenset(cpus)
+        ## {(socket, core): lowest cpu}
+        primary: dict[t.Tuple[int, int], int] = {}
+        for cpu, socket, _, core in self.cpus:
+            if allowed is None or cpu in allowed:
+                primary.setdefault((socket, core), cpu)
+
+        return frozenset(primary.values())
+
+
+def _read_sys_int(directory: str, name: str) -> int | None:
+    value: str | None = _read_sys_file(directory, name)
+    try:
+        return int(value) if value else None
+    except ValueError:
+        return None
+
+
+def _read_node_memory_total(node_dir: str) -> int | None:
+    ## i.e. 'Node 0 MemTotal:        4423416 kB'
+    meminfo: str | None = _read_sys_file(node_dir, "meminfo")
+    for line in (meminfo or "").splitlines():
+        fields: list[str] = line.split()
+        if len(fields) >= 4 and fields[2] == "MemTotal:":
+            try:
+                return int(fields[3]) * 1024
+            except ValueError:
+                return None
+
+    return None
+
+
+def read_cpu_topology(root: str = SYS_DEVICES_SYSTEM_PATH) -> CPUTopology | None:
+    """Read the CPU & NUMA topology from sysfs, in 1 pass.
+
+    Description:
+        Reads the online CPUs, each online CPU's topology/physical_package_id &
+        topology/core_id, and each online NUMA node's cpulist & meminfo. Every file
+        is read once. Kernels built without NUMA have no node directory; their CPUs
+        are reported in 1 node (0) of unknown size. A CPU without topology files is
+        reported as its own core in socket 0.
+
+        Returns `None` when the CPUs cannot be read, i.e. outside of Linux.
+
+    Params:
+        root (str): The sysfs 'system' devices directory, /sys/devices/system by default.
+
+    """
+    online: str | None = _read_sys_file(os.path.join(root, "cpu"), "online")
+    if not online:
+        return None
+
+    try:
+        cpus: t.Tuple[int, ...] = expand_cpu_list(online)
+    except ValueError:
+        return None
+
+    ## {cpu: node}
+    cpu_nodes: dict[int, int] = {}
+    nodes: list[NUMANode] = []
+    nodes_online: str | None = _read_sys_file(os.path.join(root, "node"), "online")
+    try:
+        node_ids: t.Tuple[int, ...] = expand_cpu_list(nodes_online or "")
+    except ValueError:
+        node_ids = ()
+
+    for node in node_ids:
+        node_dir: str = os.path.join(root, "node", f"node{node}")
+        try:
+            node_cpus: t.Tuple[int, ...] = expand_cpu_list(
+                _read_sys_file(node_dir, "cpulist") or ""
+            )
+        except ValueError:
+            node_cpus = ()
+
+        cpu_nodes.update(dict.fromkeys(node_cpus, node))
+        nodes.append(
+            NUMANode(
+                node=node,
+                cpus=tuple(cpu for cpu in node_cpus if cpu in cpus),
+                memory_total=_read_node_memory_total(node_dir),
+            )
+        )
+
+    if not nodes:
+        nodes.append(NUMANode(node=0, cpus=cpus, memory_total=None))
+
+    topology: list[t.Tuple[int, int, int, int]] = []
+    for cpu in cpus:
+        topology_dir: str = os.path.join(root, "cpu", f"cpu{cpu}", "topology")
+        socket: int | None = _read_sys_int(topology_dir, "physical_package_id")
+        core: int | None = _read_sys_int(topology_dir, "core_id")
+        topology.append(
+            (
+                cpu,
+                0 if socket is None else socket,
+                cpu_nodes.get(cpu, 0),
+                cpu if core is None else core,
+            )
+        )
+
+    return CPUTopology(cpus=tuple(topology), nodes=tuple(nodes))
+
+
+def get_cpu_topology() -> CPUTopology | None:
+    """Return the host's CPU & NUMA topology, see `read_cpu_topology()`."""
+    if sys.platform != "linux":
+        return None
+
+    return read_cpu_topology()
+
+
+@dataclass(repr=False)
+class PlatformPython(LazyFieldsMixin, ReadOnlyMixin, DictMixin):
+    """Information about the Python implementation for the platform."""
+
+    build: t.Tuple[str, str] = LazyField(_platform.python_build)
+    compiler: str = LazyField(_platform.python_compiler)
+    branch: str = LazyField(_platform.python_branch)
+    implementation: str = LazyField(_platform.python_implementation)
+    revision: str = LazyField(_platform.python_revision)
+    version: str = LazyField(_platform.python_version)
+    version_tuple: t.Tuple[str, str, str] = LazyField(_platform.python_version_tuple)
+    path: t.List[str] = LazyField(get_python_path)
+    modules: ModuleInventory = LazyField(get_python_modules)
+    base_prefix: str = field(default=sys.base_prefix)
+    exec_prefix: str = field(default=sys.exec_prefix)
+    copyright: str = field(default=sys.copyright)
+    dont_write_bytecode: bool = field(default=sys.dont_write_bytecode)
+    executable: str = field(default=sys.executable)
+    flags: t.Tuple[t.Union[int, bool]] = field(default=sys.flags)
+    float_info: t.Tuple[t.Union[int, float]] = field(default=sys.float_info)
+    default_encoding: str = LazyField(sys.getdefaultencoding)
+    int_max_str_digits: int = LazyField(sys.get_int_max_str_digits)
+    recursion_limit: int = LazyField(sys.getrecursionlimit)
+    gil_enabled: bool = LazyField(get_gil_enabled)
+    maxsize: int = field(default=sys.maxsize)
+    maxunicode: int = field(default=sys.maxunicode)
+
+
+@dataclass(repr=False)
+class PlatformSpecificInfo(LazyFieldsMixin, ReadOnlyMixin, DictMixin):
+    """Base class for platform-specific (i.e. Windows, Mac, Linux) info.
+
+    Description:
+        Some of the platform module's functions are only available when a
+        specific platform is detected. This class serves as a base for
+        platform-specific "extra" data.
+
+    """
+
+    os: str = LazyField(_platform.system)
+
+
+@dataclass(repr=False)
+class PlatformWinInfo(PlatformSpecificInfo):
+    """Windows-specific platform info."""
+
+    win32_ver: t.Tuple = LazyField(get_win32_version)
+    win32_edition: str = LazyField(get_win32_edition)
+    win32_is_iot: bool = LazyField(get_win32_is_iot)
+
+
+@dataclass(repr=False)
+class PlatformUnixInfoBase(PlatformSpecificInfo):
+    """Unix-specific platform info."""
+
+    libc_ver: t.Tuple[str] = LazyField(get_libc_version)
+    libc_source: str | None = LazyField(get_libc_source)
+
+
+@dataclass(repr=False)
+class PlatformMacInfo(PlatformUnixInfoBase):
+    """Mac-specific platform info."""
+
+    mac_ver: t.Tuple[str] = LazyField(get_mac_version)
+
+
+@dataclass(repr=False)
+class PlatformLinuxInfo(PlatformUnixInfoBase):
+    """Linux-specific platform info."""
+
+    os_release: dict[str, str] = LazyField(get_os_release)
+
+
+######################
 # PlatformInfo Class #
 ######################
 
+## Returned by _json_value() for values that cannot be serialized
+_JSON_SKIP: object = object()
+
+## Nested dataclass fields to rebuild when loading JSON
+_JSON_NESTED_TYPES: dict[str, type] = {
+    "uname": PlatformUname,
+    "python": PlatformPython,
+    "cpu": CPUInfo,
+}
+
+
+def _json_value(value: t.Any) -> t.Any:
+    """Convert a value to JSON-serializable types, or return _JSON_SKIP."""
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+
+    if isinstance(value, DictMixin):
+        value = value.as_dict()
+    elif isinstance(value, ModuleInventory):
+        value = value.records
+    elif isinstance(value, tuple) and hasattr(type(value), "__match_args__"):
+        ## Named tuples & struct sequences (i.e. sys.flags)
+        value = dict(zip(type(value).__match_args__, value))
+
+    if isinstance(value, (dict, MappingProxyType)):
+        items: dict[str, t.Any] = {}
+        for key, item in value.items():
+            item = _json_value(item)
+            if item is not _JSON_SKIP:
+                items[str(key)] = item
+
+        ## i.e. a dict where no value can be serialized
+        if value and not items:
+            return _JSON_SKIP
+
+        return items
+
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [
+            item
+            for item in (_json_value(item) for item in value)
+            if item is not _JSON_SKIP
+        ]
+
+    return _JSON_SKIP
+
+
+## Decoders of record types that are serialized as JSON lists/dicts, by field type
+_JSON_FIELD_DECODERS: dict[type, t.Callable[[t.Any], t.Any]] = {
+    ModuleInventory: lambda value: ModuleInventory(
+        ModuleRecord(**record) for record in value
+    ),
+    CPULimits: lambda value: CPULimits(
+        **{name: value.get(name) for name in CPULimits._fields}
+    ),
+    CPUFeatures: lambda value: CPUFeatures(
+        bits=value.get("bits") or 0, source=value.get("source")
+    ),
+    CPUTopology: CPUTopology.from_json_dict,
+}
+
+
+@functools.cache
+def _json_field_types(cls: type) -> dict[str, t.Any]:
+    """Return a dataclass' field types, with `None` removed from optional types.
+
+    Annotations are resolved with `typing.get_type_hints()`, so `X | None` and
+    `t.Optional[X]` both resolve to `X`.
+    """
+    import types
+
+    field_types: dict[str, t.Any] = {}
+    for name, hint in t.get_type_hints(cls).items():
+        if t.get_origin(hint) in (t.Union, types.UnionType):
+            args: list[t.Any] = [
+                arg for arg in t.get_args(hint) if arg is not type(None)
+            ]
+            hint = args[0] if len(args) == 1 else hint
+
+        field_types[name] = hint
+
+    return field_types
+
+
+def _json_field_value(field_type: t.Any, value: t.Any) -> t.Any:
+    """Convert a JSON value back to a dataclass field's type (lists to tuples).
+
+    Named tuples & struct sequences (i.e. sys.flags) without a decoder in
+    `_JSON_FIELD_DECODERS` are serialized as dicts, and are loaded as dicts.
+    """
+    decoder: t.Callable[[t.Any], t.Any] | None = _JSON_FIELD_DECODERS.get(field_type)
+    if decoder is not None and isinstance(value, (list, dict)):
+        return decoder(value)
+    if isinstance(value, list) and (
+        field_type is tuple or t.get_origin(field_type) is tuple
+    ):
+        return _json_to_tuple(value)
+
+    return value
+
+
+def _json_to_tuple(value: list) -> tuple:
+    return tuple(
+        _json_to_tuple(item) if isinstance(item, list) else item for item in value
+    )
+
+
+def _dataclass_from_json_dict(cls: type[T], data: dict[str, t.Any]) -> T:
+    """Build a dataclass from a JSON dict. Missing fields are set to `None`."""
+    field_types: dict[str, t.Any] = _json_field_types(cls)
+
+    return cls(
+        **{
+            _field.name: _json_field_value(
+                field_types.get(_field.name), data.get(_field.name)
+            )
+            for _field in fields(cls)
+            if _field.init
+        }
+    )
+
+
+def _platform_info_from_json_dict(data: dict[str, t.Any]) -> PlatformInfo:
+    values: dict[str, t.Any] = dict(data)
+
+    for name, cls in _JSON_NESTED_TYPES.items():
+        if isinstance(values.get(name), dict):
+            values[name] = _dataclass_from_json_dict(cls, values[name])
+
+    info: PlatformInfo = _dataclass_from_json_dict(PlatformInfo, values)
+
+    platform_extra_cls: type[PlatformSpecificInfo] | None = get_platform_specific_class(
+        info.system
+    )
+    if platform_extra_cls is not None and isinstance(
+        data.get("platform_specific_info"), dict
+    ):
+        object.__setattr__(
+            info,
+            "_platform_specific_info",
+            _dataclass_from_json_dict(
+                platform_extra_cls, data["platform_specific_info"]
+            ),
+        )
+    object.__setattr__(
+        info, "_unavailable_fields", frozenset(data.get("unavailable_fields", ()))
+    )
+
+    return info
+
+
+def write_json(
+    data: t.Any, fp: t.TextIO | None = None, indent: int | None = None
+) -> str | None:
+    """Serialize JSON-serializable data. Every JSON/NDJSON output goes through this writer.
+
+    Params:
+        data (Any): Data to serialize, i.e. from `PlatformInfo.to_json_dict()`.
+        fp (TextIO | None): Write the JSON to this file object (in 1 write) instead of returning it.
+        indent (int | None): Indent level. When `None`, compact JSON is written on 1 line.
+
+    """
+    import json
+
+    serialized: str = json.dumps(
+        data,
+        indent=indent,
+        separators=None if indent is not None else (",", ":"),
+        ensure_ascii=False,
+    )
+    if fp is None:
+        return serialized
+
+    fp.write(serialized)
+
+    return None
+
+
+def write_ndjson(
+    infos: t.Iterable[PlatformInfo],
+    fp: t.TextIO,
+    fields: t.Iterable[str] | None = None,
+) -> None:
+    """Write PlatformInfo objects as newline-delimited JSON, 1 compact object per line."""
+    for info in infos:
+        write_json(info.to_json_dict(fields=fields), fp=fp)
+        fp.write("\n")
+        fp.flush()
+
+
+class SystemChecksMixin:
+    """Mixin class to add is_linux()/is_64bit()/etc checks to classes with
+    'system' & 'arch' attributes.
+    """
+
+    ## Keep slotted subclasses (i.e. PlatformSnapshot) free of a __dict__
+    __slots__ = ()
+
+    def is_linux(self) -> bool:
+        if self.system == EnumSystemTypes.LINUX.value:
+            return True
+        else:
+            return False
+
+    def is_unix(self) -> bool:
+        if self.system in [EnumSystemTypes.LINUX.value, EnumSystemTypes.MAC.value]:
+            return True
+        else:
+            return False
+
+    def is_win(self) -> bool:
+        if self.system == EnumSystemTypes.WINDOWS.value:
+            return True
+        else:
+            return False
+
+    def is_mac(self) -> bool:
+        if self.system == EnumSystemTypes.MAC.value:
+            return True
+        else:
+            return False
+
+    def is_java(self) -> bool:
+        if self.system == EnumSystemTypes.JAVA.value:
+            return True
+        else:
+            return False
+
+    def is_32bit(self) -> bool:
+        if "32bit" in self.arch:
+            return True
+        else:
+            return False
+
+    def is_64bit(self) -> bool:
+        if "64bit" in self.arch:
+            return True
+        else:
+            return False
+
+
+@dataclass(repr=False)
+class PlatformInfoBase(SystemChecksMixin, LazyFieldsMixin, ReadOnlyMixin, DictMixin):
+    """Base class for platform information.
+
+    Description:
+        Compile platform data common across all OSes to serve as a base for
+        building platform-specific classes.
+
+        Fields are computed the first time they are read, see `LazyField`.
+    """
+
+    platform: str = LazyField(get_platform)
+    platform_terse: str = LazyField(get_platform_terse)
+    platform_aliased: str = LazyField(get_platform_aliased)
+    machine: str = LazyField(_platform.machine)
+    system: str = LazyField(_platform.system)
+    release: str = LazyField(_platform.release)
+    version: str = LazyField(_platform.version)
+    processor: str | None = LazyField(get_processor)
+    cpu_count: int = LazyField(get_cpu_count)
+    cpu_limits: CPULimits = LazyField(get_cpu_limits)
+    cpu_topology: CPUTopology | None = LazyField(get_cpu_topology)
+    cpu: CPUInfo | None = LazyField(get_cpu_info)
+    cpu_features: CPUFeatures | None = LazyField(get_cpu_features)
+    arch: t.Tuple[str, str] = LazyField(get_architecture)
+    uname: PlatformUname = LazyField(get_platform_uname)
+    python: PlatformPython = LazyField(get_platform_python)
+    byteorder: str = LazyField(get_sys_byteorder)
+
+
+@dataclass(repr=False)
+class PlatformInfo(PlatformInfoBase):
+    """Compile information about the OS running this script.
+
+    Description:
+        Each field is probed the first time it is read. Pass `fields` (dotted paths,
+        i.e. `PlatformInfo(fields=["system", "uname.node", "python.version"])`) to
+        collect the fields up front, running only the probes those fields need. The
+        other fields stay pending until they are read.
+    """
+
+    ## dataclass() keeps an __init__ defined in the class body
+    def __init__(self, *args, fields: t.Iterable[str] | None = None, **kwargs):
+        if fields is None:
+            super().__init__(*args, **kwargs)
+            return
+
+        results: ProbeResults = ProbeCollector().collect(select_probes(fields))
+
+        top_level, platform_specific = _assemble_fields(results.values)
+        super().__init__(**top_level)
+        _attach_collection_state(
+            self,
+            platform_specific=platform_specific,
+            unavailable=results.unavailable,
+            collection_stats=results.collection_stats,
+            collected_fields=results.values.keys(),
+        )
+
+    @property
+    def platform_specific_info(
+        self,
+    ) -> t.Union[PlatformWinInfo, PlatformMacInfo, PlatformLinuxInfo]:
+        """Detect OS and return platform-specific class with additional platform info.
+
+        Built once (its fields are computed on first read), or set when the object
+        was built by a ProbeCollector.
+        """
+        platform_specific: PlatformSpecificInfo | str | None = self.__dict__.get(
+            "_platform_specific_info"
+        )
+        if platform_specific is not None:
+            return platform_specific
+
+        platform_extra_cls: type[PlatformSpecificInfo] | None = (
+            get_platform_specific_class(self.system)
+        )
+        if platform_extra_cls is None:
+            log.error(f"Unknown OS: {self.system}")
+
+            platform_specific = f"<UNKNOWN_OS:'{self.system}'>"
+        else:
+            platform_specific = platform_extra_cls()
+            ## Built after a snapshot was locked, i.e. by get_cached_platform_info()
+            if self.__dict__.get("_read_only"):
+                platform_specific.make_read_only()
+
+        object.__setattr__(self, "_platform_specific_info", platform_specific)
+
+        return platform_specific
+
+    @property
+    def unavailable_fields(self) -> frozenset[str]:
+        """Dotted paths of fields whose probe timed out or failed during collection."""
+        return self.__dict__.get("_unavailable_fields", frozenset())
+
+    @property
+    def collected_fields(self) -> frozenset[str] | None:
+        """Dotted paths of the probes that were run, or `None` if every field was collected."""
+        return self.__dict__.get("_collected_fields")
+
+    @property
+    def collection_stats(self) -> CollectionStats:
+        """Per-probe timing from the collection that built this object.
+
+        Empty if the object was initialized directly, i.e. `PlatformInfo()`.
+        """
+        return self.__dict__.get("_collection_stats", CollectionStats())
+
+    @property
+    def ascii_art(self) -> str:
+        _ascii: str = get_os_ascii(os=self.system)
+
+        return _ascii
+
+    def freeze(self) -> PlatformSnapshot:
+        """Return a compact, immutable copy of this object, see `PlatformSnapshot`.
+
+        Pending fields are computed first.
+        """
+        return PlatformSnapshot.from_platform_info(self)
+
+    def to_json_dict(self, fields: t.Iterable[str] | None = None) -> dict[str, t.Any]:
+        """Return a dict of this object's fields that can be passed to `json.dumps()`.
+
+        Description:
+            Nested objects & named tuples become dicts, other tuples become lists.
+            Values that cannot be serialized are skipped. Pending fields are
+            computed.
+
+        Params:
+            fields (Iterable[str] | None): Only include these dotted paths, i.e.
+                `['system', 'uname.node']`, nested like the full output.
+
+        """
+        if fields is not None:
+            data: dict[str, t.Any] = {}
+            for path in fields:
+                value: t.Any = _json_value(get_field_value(self, path))
+                if value is _JSON_SKIP:
+                    continue
+
+                *parents, name = path.split(".")
+                target: dict[str, t.Any] = data
+                for parent in parents:
+                    target = target.setdefault(parent, {})
+                target[name] = value
+
+            return data
+
+        data = _json_value(self)
+
+        platform_specific: PlatformSpecificInfo | str = self.platform_specific_info
+        if isinstance(platform_specific, PlatformSpecificInfo):
+            data["platform_specific_info"] = _json_value(platform_specific)
+        data["unavailable_fields"] = sorted(self.unavailable_fields)
+
+        return data
+
+    def to_json(
+        self,
+        fp: t.TextIO | None = None,
+        indent: int | None = None,
+        fields: t.Iterable[str] | None = None,
+    ) -> str | None:
+        """Serialize this object to JSON, see `to_json_dict()`.
+
+        Params:
+            fp (TextIO | None): Write the JSON to this file object instead of returning it.
+            indent (int | None): Indent level. When `None`, compact JSON is written on 1 line.
+            fields (Iterable[str] | None): Only include these dotted paths.
+
+        """
+        return write_json(self.to_json_dict(fields=fields), fp=fp, indent=indent)
+
+    def to_binary(self, fields: t.Iterable[str] | None = None) -> bytes:
+        """Encode this object (or only some `fields`) in a compact binary format.
+
+        The encoded values are the same as `to_json_dict()`. Decode with `from_binary()`,
+        or read single fields lazily with `decode_binary()`.
+        """
+        return encode_binary(self.to_json_dict(fields=fields))
+
+    @classmethod
+    def from_binary(cls, data: bytes | bytearray | memoryview) -> PlatformInfo:
+        """Load a PlatformInfo object encoded with `to_binary()`."""
+        return decode_binary(data).to_platform_info()
+
+    @classmethod
+    def from_json(cls, data: str | bytes) -> PlatformInfo:
+        """Load a PlatformInfo object serialized with `to_json()`.
+
+        Fields missing from the JSON (i.e. skipped or not collected) are set to `None`,
+        so they are never probed on the machine loading the JSON.
+        """
+        import json
+
+        return _platform_info_from_json_dict(json.loads(data))
+
+    def display_info(self, simplified: bool = True):
+        if simplified:
+            usable_cpus: str = (
+                f" ({self.cpu_limits.effective} usable)"
+                if self.cpu_limits is not None
+                else ""
+            )
+
+            msg: str = f"""[ Platform Information ]
+OS:
+    Type: {self.system}
+    Release: {self.release}
+    Version: {self.version}
+    Hostname: {self.uname.node}
+    Kernel release: {self.uname.release}
+CPU Architecture:
+    Model: {self.processor}
+    x86/x64: {self.machine}
+    CPU count: {self.cpu_count}{usable_cpus}
+Python:
+    Version: {self.python.version}
+    Executable location: {self.python.exec_prefix}
+    Default encoding: {self.python.default_encoding}
+    'PYTHONDONTWRITEBYTECODE' environment variable: {self.python.dont_write_bytecode}
+"""
+
+        else:
+            cpu_topology: str = (
+                f"{self.cpu.sockets}/{self.cpu.cores}/{self.cpu.threads}"
+                if self.cpu is not None
+                else "unknown"
+            )
+            cpu_limits: str = (
+                f"{self.cpu_limits.effective} usable (affinity: {self.cpu_limits.affinity}, "
+                f"cpuset: {self.cpu_limits.cpuset}, quota: {self.cpu_limits.quota})"
+                if self.cpu_limits is not None
+                else "unknown"
+            )
+            cpu_features: str = (
+                f"{len(self.cpu_features.names)} known"
+                + (
+                    f", x86-64-v{self.cpu_features.x86_64_level}"
+                    if self.cpu_features.x86_64_level
+                    else ""
+                )
+                if self.cpu_features is not None
+                else "unknown"
+            )
+            numa_nodes: str = (
+                ", ".join(
+                    f"node {node.node}: {len(node.cpus)} CPUs"
+                    + (
+                        f", {convert_bytes(node.memory_total, as_str=True)}"
+                        if node.memory_total is not None
+                        else ""
+                    )
+                    for node in self.cpu_topology.nodes
+                )
+                if self.cpu_topology is not None
+                else "unknown"
+            )
+
+            msg: str = f"""[ Platform Information ]
+OS:
+    Type: {self.system}
+    Release: {self.release}
+    Version: {self.version}
+    Platform: {self.platform}
+    Uname:
+        Node (hostname): {self.uname.node}
+        Kernel release: {self.uname.release}
+CPU Architecture:
+    Model: {self.processor}
+    x86/x64: {self.machine}
+    CPU count: {self.cpu_count}
+    CPU limits: {cpu_limits}
+    Sockets/cores/threads: {cpu_topology}
+    NUMA nodes: {numa_nodes}
+    CPU features: {cpu_features}
+Python:
+    Implementation: {self.python.implementation}
+    Version: {self.python.version}
+    Executable location: {self.python.exec_prefix}
+    Base prefix: {self.python.base_prefix}
+    Build: {self.python.build}
+    Revision: {self.python.revision}
+    Compiler: {self.python.compiler}
+    Flags: {self.python.flags}
+    Default encoding: {self.python.default_encoding}
+    'PYTHONDONTWRITEBYTECODE' environment variable: {self.python.dont_write_bytecode}
+
+"""
+
+        print(msg)
+
+
+#############
+# Snapshots #
+#############
+
+
+def _freeze_value(value: t.Any) -> t.Any:
+    """Return an immutable, compact copy of a value for a PlatformSnapshot.
+
+    Strings are interned, so snapshots of similar hosts share 1 copy of values like
+    'Linux' or 'x86_64'. Lists become tuples & dicts become tuples of (key, value)
+    pairs. Other values (i.e. sys.flags) are returned as-is.
+    """
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, list) or type(value) is tuple:
+        return tuple(_freeze_value(item) for item in value)
+    if isinstance(value, (dict, MappingProxyType)):
+        return tuple(
+            (_freeze_value(key), _freeze_value(item)) for key, item in value.items()
+        )
+
+    return value
+
+
+def _freeze_fields(cls: type[T], obj: t.Any, **overrides: t.Any) -> T | None:
+    """Build a snapshot NamedTuple from the same-named attributes of an object.
+
+    Returns `None` if `obj` is `None`, i.e. for a field that was unavailable.
+    """
+    if obj is None:
+        return None
+
+    return cls(
+        *(
+            overrides[name] if name in overrides else _freeze_value(getattr(obj, name))
+            for name in cls._fields
+        )
+    )
+
+
+class UnameSnapshot(t.NamedTuple):
+    """Immutable copy of a PlatformUname object."""
+
+    system: str
+    node: str
+    release: str
+    version: str
+    machine: str
+
+
+class CPUSnapshot(t.NamedTuple):
+    """Immutable copy of a CPUInfo object."""
+
+    model_name: str | None
+    vendor: str | None
+    family: int | None
+    model: int | None
+    stepping: int | None
+    microcode: str | None
+    sockets: int | None
+    cores: int | None
+    threads: int | None
+
+
+class PythonSnapshot(t.NamedTuple):
+    """Immutable copy of a PlatformPython object.
+
+    `path` is a tuple instead of a reference to the live `sys.path`. `modules` is
+    the (immutable) ModuleInventory.
+    """
+
+    build: t.Tuple[str, str]
+    compiler: str
+    branch: str
+    implementation: str
+    revision: str
+    version: str
+    version_tuple: t.Tuple[str, str, str]
+    path: t.Tuple[str, ...]
+    modules: ModuleInventory | None
+    base_prefix: str
+    exec_prefix: str
+    copyright: str
+    dont_write_bytecode: bool
+    executable: str
+    flags: t.Tuple[t.Union[int, bool]]
+    float_info: t.Tuple[t.Union[int, float]]
+    default_encoding: str
+    int_max_str_digits: int
+    recursion_limit: int
+    gil_enabled: bool
+    maxsize: int
+    maxunicode: int
+
+
+@dataclass(frozen=True, slots=True)
+class PlatformSnapshot(SystemChecksMixin):
+    """Compact, immutable copy of a PlatformInfo object.
+
+    Description:
+        Meant for holding many snapshots (i.e. 1 per host) in memory. The snapshot
+        and its nested values have no per-instance `__dict__`, strings are interned
+        & it holds no references to live interpreter state. Build one with
+        `PlatformInfo.freeze()`.
+
+        Platform-specific info is stored as (name, value) pairs; dict values (i.e.
+        'os_release') are stored as (key, value) pairs too.
+    """
+
+    platform: str
+    platform_terse: str
+    platform_aliased: str
+    machine: str
+    system: str
+    release: str
+    version: str
+    processor: str | None
+    cpu_count: int
+    cpu_limits: CPULimits | None
+    cpu_topology: CPUTopology | None
+    cpu: CPUSnapshot | None
+    cpu_features: CPUFeatures | None
+    arch: t.Tuple[str, str]
+    uname: UnameSnapshot | None
+    python: PythonSnapshot | None
+    byteorder: str
+    platform_specific: t.Tuple[t.Tuple[str, t.Any], ...] = ()
+    unavailable_fields: frozenset[str] = frozenset()
+
+    @classmethod
+    def from_platform_info(cls, info: PlatformInfo) -> PlatformSnapshot:
+        """Freeze a PlatformInfo object. Pending fields are computed first."""
+        ## The ModuleInventory is immutable & holds no module objects, so it is shared
+        python: PythonSnapshot | None = _freeze_fields(PythonSnapshot, info.python)
+
+        platform_specific: PlatformSpecificInfo | str = info.platform_specific_info
+        if isinstance(platform_specific, PlatformSpecificInfo):
+            platform_specific_pairs: t.Tuple[t.Tuple[str, t.Any], ...] = _freeze_value(
+                platform_specific.as_dict()
+            )
+        else:
+            platform_specific_pairs = ()
+
+        return cls(
+            platform=_freeze_value(info.platform),
+            platform_terse=_freeze_value(info.platform_terse),
+            platform_aliased=_freeze_value(info.platform_aliased),
+            machine=_freeze_value(info.machine),
+            system=_freeze_value(info.system),
+            release=_freeze_value(info.release),
+            version=_freeze_value(info.version),
+            processor=_freeze_value(info.processor),
+            cpu_count=info.cpu_count,
+            ## Immutable & only hold numbers
+            cpu_limits=info.cpu_limits,
+            cpu_topology=info.cpu_topology,
+            cpu=_freeze_fields(CPUSnapshot, info.cpu),
+            cpu_features=info.cpu_features,
+            arch=_freeze_value(info.arch),
+            uname=_freeze_fields(UnameSnapshot, info.uname),
+            python=python,
+            byteorder=_freeze_value(info.byteorder),
+            platform_specific=platform_specific_pairs,
+            unavailable_fields=frozenset(info.unavailable_fields),
+        )
+
+    @property
+    def platform_specific_info(self) -> dict[str, t.Any]:
+        """Return the platform-specific info as a dict."""
+        return dict(self.platform_specific)
+
+    def as_dict(self) -> dict[str, t.Any]:
+        """Return dict representation of the snapshot (nested values are not converted)."""
+        return {_field.name: getattr(self, _field.name) for _field in fields(self)}
+
+
+###################
+# Binary encoding #
+###################
+
+## First bytes of a binary-encoded PlatformInfo
+BINARY_MAGIC: bytes = b"PINF"
+## Bump when the layout changes. Decoding rejects other versions.
+BINARY_FORMAT_VERSION: int = 1
+
+## Value type tags
+_BIN_NONE: int = 0
+_BIN_FALSE: int = 1
+_BIN_TRUE: int = 2
+## Zigzag-encoded varint
+_BIN_INT: int = 3
+## 8-byte IEEE 754 double
+_BIN_FLOAT: int = 4
+## Varint item count, then the items
+_BIN_LIST: int = 5
+## Varint item count, then (varint key string index, value) pairs
+_BIN_DICT: int = 6
+## Varint string table index
+_BIN_STR: int = 7
+## Varint byte length & UTF-8 bytes, for strings that cannot go in the string table
+_BIN_STR_INLINE: int = 8
+## Tags from this value up reference string (tag - _BIN_STR_SMALL), so the first
+#  240 strings in the string table are referenced with 1 byte
+_BIN_STR_SMALL: int = 16
+
+## Separates strings in the string table. Values that contain it are stored inline.
+_BIN_STRING_SEPARATOR: str = "\x00"
+
+
+@functools.cache
+def _binary_structs() -> t.Tuple[t.Any, t.Any]:
+    """Return the (header, float) structs. struct is imported on first use, like the ELF readers."""
+    import struct
+
+    ## magic, format version, values offset, string table offset
+    return struct.Struct("<4sBII"), struct.Struct("<d")
+
+
+def _write_uvarint(out: bytearray, value: int) -> None:
+    """Append an unsigned LEB128 varint."""
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_uvarint(buffer: memoryview, offset: int) -> t.Tuple[int, int]:
+    """Read an unsigned LEB128 varint, returning it & the offset after it."""
+    result: int = 0
+    shift: int = 0
+
+    while True:
+        byte: int = buffer[offset]
+        offset += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, offset
+        shift += 7
+
+
+class _BinaryEncoder:
+    """Encode a JSON-style dict (see `PlatformInfo.to_json_dict()`) to bytes.
+
+    Description:
+        Layout (counts, lengths, indexes & offsets are LEB128 varints):
+            - Header: magic, format version & the offsets of the values & string table.
+            - Index: the top-level field count, then (key string index, value offset)
+              for each field, so a decoder can read 1 field without decoding the others.
+            - Values: a 1-byte type tag, followed by the value. Strings are stored as an
+              index into the string table, so repeated strings (i.e. 'Linux', dict keys)
+              are stored once.
+            - String table: the string count, then the NUL-separated UTF-8 strings.
+    """
+
+    def __init__(self):
+        self.strings: dict[str, int] = {}
+        self.values: bytearray = bytearray()
+
+    def string_index(self, value: str) -> int:
+        if _BIN_STRING_SEPARATOR in value:
+            raise ValueError(
+                f"Cannot add a string containing NUL to the table: {value!r}"
+            )
+
+        index: int | None = self.strings.get(value)
+        if index is None:
+            index = self.strings[value] = len(self.strings)
+
+        return index
+
+    def write_value(self, value: t.Any) -> None:
+        out: bytearray = self.values
+
+        if isinstance(value, str):
+            if _BIN_STRING_SEPARATOR in value:
+                encoded: bytes = value.encode("utf-8")
+                out.append(_BIN_STR_INLINE)
+                _write_uvarint(out, len(encoded))
+                out += encoded
+                return
+
+            index: int = self.string_index(value)
+            if index < 256 - _BIN_STR_SMALL:
+                out.append(_BIN_STR_SMALL + index)
+            else:
+                out.append(_BIN_STR)
+                _write_uvarint(out, index)
+        elif value is None:
+            out.append(_BIN_NONE)
+        elif value is True:
+            out.append(_BIN_TRUE)
+        elif value is False:
+            out.append(_BIN_FALSE)
+        elif isinstance(value, int):
+            out.append(_BIN_INT)
+            ## Zigzag encoding keeps small negative ints small
+            _write_uvarint(out, value * 2 if value >= 0 else -value * 2 - 1)
+        elif isinstance(value, float):
+            out.append(_BIN_FLOAT)
+            out += _binary_structs()[1].pack(value)
+        elif isinstance(value, (list, tuple)):
+            out.append(_BIN_LIST)
+            _write_uvarint(out, len(value))
+            for item in value:
+                self.write_value(item)
+        elif isinstance(value, (dict, MappingProxyType)):
+            out.append(_BIN_DICT)
+            _write_uvarint(out, len(value))
+            for key, item in value.items():
+                _write_uvarint(out, self.string_index(key))
+                self.write_value(item)
+        else:
+            raise TypeError(f"Cannot binary-encode value of type {type(value)}")
+
+    def encode(self, data: dict[str, t.Any]) -> bytes:
+        header, _ = _binary_structs()
+
+        index: bytearray = bytearray()
+        _write_uvarint(index, len(data))
+        for key, value in data.items():
+            _write_uvarint(index, self.string_index(key))
+            _write_uvarint(index, len(self.values))
+            self.write_value(value)
+
+        values_offset: int = header.size + len(index)
+        string_table_offset: int = values_offset + len(self.values)
+
+        out: bytearray = bytearray(
+            header.pack(
+                BINARY_MAGIC, BINARY_FORMAT_VERSION, values_offset, string_table_offset
+            )
+        )
+        out += index
+        out += self.values
+        _write_uvarint(out, len(self.strings))
+        out += _BIN_STRING_SEPARATOR.join(self.strings).encode("utf-8")
+
+        return bytes(out)
+
+
+class BinarySnapshot:
+    """Lazily decoded view of a binary-encoded PlatformInfo, see `decode_binary()`.
+
+    Description:
+        Decoding reads the header, the field index & the string table (in 1 UTF-8
+        decode) from a memoryview; the buffer is not copied. Each top-level field is
+        decoded the first time it is read (as an attribute, or with `get()`). Values
+        have the same shape as `PlatformInfo.to_json_dict()`.
+    """
+
+    __slots__ = ("_buffer", "_values_offset", "_index", "_strings", "_values")
+
+    def __init__(self, data: bytes | bytearray | memoryview):
+        buffer: memoryview = memoryview(data).cast("B")
+        header, _ = _binary_structs()
+
+        if len(buffer) < header.size:
+            raise ValueError("Data is too short to be a binary-encoded PlatformInfo")
+
+        magic, version, values_offset, string_table_offset = header.unpack_from(
+            buffer, 0
+        )
+        if magic != BINARY_MAGIC:
+            raise ValueError("Data is not a binary-encoded PlatformInfo (bad magic)")
+        if version != BINARY_FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported binary format version {version}, expected {BINARY_FORMAT_VERSION}"
+            )
+
+        string_count, offset = _read_uvarint(buffer, string_table_offset)
+        self._strings: list[str] = (
+            str(buffer[offset:], "utf-8").split(_BIN_STRING_SEPARATOR)
+            if string_count
+            else []
+        )
+        if len(self._strings) != string_count:
+            raise ValueError("Binary-encoded PlatformInfo has a corrupt string table")
+
+        self._buffer: memoryview = buffer
+        self._values_offset: int = values_offset
+        self._values: dict[str, t.Any] = {}
+        self._index: dict[str, int] = {}
+
+        field_count, offset = _read_uvarint(buffer, header.size)
+        for _ in range(field_count):
+            key_index, offset = _read_uvarint(buffer, offset)
+            value_offset, offset = _read_uvarint(buffer, offset)
+            self._index[self._strings[key_index]] = values_offset + value_offset
+
+    def _read(self, offset: int) -> t.Tuple[t.Any, int]:
+        """Decode the value at `offset`, returning it & the offset after it."""
+        buffer: memoryview = self._buffer
+        tag: int = buffer[offset]
+        offset += 1
+
+        if tag >= _BIN_STR_SMALL:
+            return self._strings[tag - _BIN_STR_SMALL], offset
+
+        match tag:
+            case 0:  # _BIN_NONE
+                return None, offset
+            case 1:  # _BIN_FALSE
+                return False, offset
+            case 2:  # _BIN_TRUE
+                return True, offset
+            case 3:  # _BIN_INT
+                zigzag, offset = _read_uvarint(buffer, offset)
+                return (zigzag >> 1) ^ -(zigzag & 1), offset
+            case 4:  # _BIN_FLOAT
+                return _binary_structs()[1].unpack_from(buffer, offset)[0], offset + 8
+            case 5:  # _BIN_LIST
+                count, offset = _read_uvarint(buffer, offset)
+                items: list[t.Any] = []
+                for _ in range(count):
+                    item, offset = self._read(offset)
+                    items.append(item)
+                return items, offset
+            case 6:  # _BIN_DICT
+                count, offset = _read_uvarint(buffer, offset)
+                mapping: dict[str, t.Any] = {}
+                for _ in range(count):
+                    key_index, offset = _read_uvarint(buffer, offset)
+                    mapping[self._strings[key_index]], offset = self._read(offset)
+                return mapping, offset
+            case 7:  # _BIN_STR
+                index, offset = _read_uvarint(buffer, offset)
+                return self._strings[index], offset
+            case 8:  # _BIN_STR_INLINE
+                length, offset = _read_uvarint(buffer, offset)
+                return str(buffer[offset : offset + length], "utf-8"), offset + length
+            case _:
+                raise ValueError(
+                    f"Unknown binary value tag {tag} at offset {offset - 1}"
+                )
+
+    def keys(self) -> list[str]:
+        return list(self._index)
+
+    def get(self, name: str, default: t.Any = None) -> t.Any:
+        """Return a top-level field's value, decoding it on first use."""
+        if name in self._values:
+            return self._values[name]
+
+        offset: int | None = self._index.get(name)
+        if offset is None:
+            return default
+
+        value, _ = self._read(offset)
+        self._values[name] = value
+
+        return value
+
+    def __getattr__(self, name: str) -> t.Any:
+        ## Only called for names that are not slots/methods
+        if name.startswith("_") or name not in self._index:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+
+        return self.get(name)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._index
+
+    def as_dict(self) -> dict[str, t.Any]:
+        """Decode every field."""
+        return {name: self.get(name) for name in self._index}
+
+    def to_platform_info(self) -> PlatformInfo:
+        """Decode every field into a PlatformInfo object, like `PlatformInfo.from_json()`."""
+        return _platform_info_from_json_dict(self.as_dict())
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(fields={self.keys()!r}, size={len(self._buffer)})"
+        )
+
+
+def encode_binary(data: dict[str, t.Any]) -> bytes:
+    """Encode a JSON-style dict (i.e. from `PlatformInfo.to_json_dict()`) to bytes."""
+    return _BinaryEncoder().encode(data)
+
+
+def decode_binary(data: bytes | bytearray | memoryview) -> BinarySnapshot:
+    """Return a lazily decoded view of binary-encoded data, see `BinarySnapshot`.
+
+    Raises:
+        ValueError: When the data is not binary-encoded PlatformInfo, or has an
+            unsupported format version.
+
+    """
+    return BinarySnapshot(data)
+
+
+##################
+# Snapshot delta #
+##################
+
+
+class PlatformInfoDelta(t.NamedTuple):
+    """The fields that changed between 2 serialized PlatformInfo objects.
+
+    Description:
+        Returned by `diff_platform_info()`. Paths are dotted, like `--fields`, and
+        nested dicts are compared key by key, so a changed `os_release` value is 1
+        path (i.e. `platform_specific_info.os_release.VERSION_ID`). Lists of records
+        with a 'name' (i.e. `python.modules`) are compared record by record, with
+        paths like `python.modules[json.decoder]`. Other values (i.e. lists) are
+        compared & stored whole.
+
+    """
+
+    ## {dotted path: new value} for added & changed fields
+    changed: dict[str, t.Any]
+    ## Dotted paths of fields that were removed
+    removed: t.Tuple[str, ...]
+
+    def paths(self) -> t.Tuple[str, ...]:
+        """Return every changed & removed path, sorted."""
+        return tuple(sorted((*self.changed, *self.removed)))
+
+    @classmethod
+    def from_json_dict(cls, data: dict[str, t.Any]) -> PlatformInfoDelta:
+        return cls(
+            changed=dict(data.get("changed", {})),
+            removed=tuple(data.get("removed", ())),
+        )
+
+
+def _is_named_record_list(value: t.Any) -> bool:
+    """Check if a value is a list of dicts with a 'name', i.e. a serialized ModuleInventory."""
+    return (
+        isinstance(value, list)
+        and bool(value)
+        and all(
+            isinstance(item, dict) and isinstance(item.get("name"), str)
+            for item in value
+        )
+    )
+
+
+def _flatten_json_dict(data: dict[str, t.Any], prefix: str = "") -> dict[str, t.Any]:
+    """Return {dotted path: value} for every leaf of a nested dict.
+
+    Empty dicts are leaves, and each record in a list of named records is a leaf
+    (`path[name]`).
+    """
+    flat: dict[str, t.Any] = {}
+
+    for key, value in data.items():
+        path: str = f"{prefix}{key}"
+        if isinstance(value, dict) and value:
+            flat.update(_flatten_json_dict(value, f"{path}."))
+        elif _is_named_record_list(value):
+            flat.update((f"{path}[{item['name']}]", item) for item in value)
+        else:
+            flat[path] = value
+
+    return flat
+
+
+def _split_delta_path(path: str) -> t.Tuple[list[str], str, str | None]:
+    """Split a delta path into (parent keys, key, record name), i.e. 'python.modules[os.path]'."""
+    record: str | None = None
+    if path.endswith("]"):
+        path, _, record = path[:-1].partition("[")
+
+    *parents, name = path.split(".")
+
+    return parents, name, record
+
+
+def _copy_json_dicts(data: dict[str, t.Any]) -> dict[str, t.Any]:
+    """Copy a nested dict, so it can be changed without changing the original. Other values are shared."""
+    return {
+        key: _copy_json_dicts(value) if isinstance(value, dict) else value
+        for key, value in data.items()
+    }
+
+
+def _as_json_dict(value: PlatformInfo | dict[str, t.Any]) -> dict[str, t.Any]:
+    if isinstance(value, PlatformInfo):
+        return value.to_json_dict()
+
+    return value
+
+
+def diff_platform_info(
+    old: PlatformInfo | dict[str, t.Any],
+    new: PlatformInfo | dict[str, t.Any],
+    fields: t.Iterable[str] | None = None,
+) -> PlatformInfoDelta:
+    """Return the fields that changed from `old` to `new`.
+
+    Params:
+        old (PlatformInfo | dict): The previous object, or its `to_json_dict()`.
+        new (PlatformInfo | dict): The current object, or its `to_json_dict()`.
+        fields (Iterable[str] | None): Only compare these dotted paths (& the
+            paths nested under them).
+
+    Returns:
+        (PlatformInfoDelta): The changed & removed paths. Pass it to
+            `apply_platform_info_delta()` with `old` to rebuild `new`.
+
+    """
+    old_flat: dict[str, t.Any] = _flatten_json_dict(_as_json_dict(old))
+    new_flat: dict[str, t.Any] = _flatten_json_dict(_as_json_dict(new))
+
+    if fields is not None:
+        prefixes: t.Tuple[str, ...] = tuple(
+            f"{path}{separator}" for path in fields for separator in ".["
+        )
+        paths: frozenset[str] = frozenset(fields)
+
+        def _selected(path: str) -> bool:
+            return path in paths or path.startswith(prefixes)
+
+        old_flat = {path: value for path, value in old_flat.items() if _selected(path)}
+        new_flat = {path: value for path, value in new_flat.items() if _selected(path)}
+
+    return PlatformInfoDelta(
+        changed={
+            path: value
+            for path, value in new_flat.items()
+            if path not in old_flat or old_flat[path] != value
+        },
+        removed=tuple(path for path in old_flat if path not in new_flat),
+    )
+
+
+def apply_platform_info_delta(
+    base: PlatformInfo | dict[str, t.Any], delta: PlatformInfoDelta
+) -> PlatformInfo | dict[str, t.Any]:
+    """Apply a delta from `diff_platform_info()` to `base`, the inverse of the diff.
+
+    Returns a new object of the same type as `base`, `base` is not changed.
+    """
+    data: dict[str, t.Any] = _copy_json_dicts(_as_json_dict(base))
+
+    ## Removals first: a path can be removed & replaced by a parent/child path
+    for path in delta.removed:
+        parents, name, record = _split_delta_path(path)
+        chain: list[dict[str, t.Any]] = [data]
+        for parent in parents:
+            target: t.Any = chain[-1].get(parent)
+            if not isinstance(target, dict):
+                break
+            chain.append(target)
+        else:
+            if record is not None:
+                ## Build a new list, the old one is shared with `base`
+                chain[-1][name] = [
+                    item
+                    for item in chain[-1].get(name) or ()
+                    if item.get("name") != record
+                ]
+                continue
+
+            chain[-1].pop(name, None)
+            ## Drop parents that are now empty, they were not leaves in the old dict
+            for parent, container in zip(reversed(parents), reversed(chain[:-1])):
+                if container[parent]:
+                    break
+                del container[parent]
+
+    ## {id(list): list} of named record lists changed below, re-sorted at the end
+    record_lists: dict[int, list[dict[str, t.Any]]] = {}
+    for path, value in delta.changed.items():
+        parents, name, record = _split_delta_path(path)
+        target = data
+        for parent in parents:
+            if not isinstance(target.get(parent), dict):
+                target[parent] = {}
+            target = target[parent]
+
+        if record is None:
+            target[name] = value
+            continue
+
+        items: t.Any = target.get(name)
+        if not isinstance(items, list) or id(items) not in record_lists:
+            ## Build a new list, the old one is shared with `base`
+            items = target[name] = list(items) if isinstance(items, list) else []
+            record_lists[id(items)] = items
+        items[:] = [item for item in items if item.get("name") != record]
+        items.append(value)
+
+    ## Named records are serialized sorted by name, like a ModuleInventory
+    for items in record_lists.values():
+        items.sort(key=lambda item: item["name"])
+
+    if isinstance(base, PlatformInfo):
+        return _platform_info_from_json_dict(data)
+
+    return data
+
+
+##########
+# Probes #
+##########
+
+## Nested dataclass fields that are collected field-by-field, because they hold
+#  both static & volatile values.
+_SPLIT_FIELDS: dict[str, type] = {"python": PlatformPython}
+
+
+def _probe_platform_uname() -> PlatformUname:
+    """Return a PlatformUname with every field computed, for the 'uname' probe."""
+    uname: PlatformUname = PlatformUname()
+    uname.compute_fields()
+
+    return uname
+
+
+## Probe functions to use instead of a field's LazyField factory. The factory of a
+#  nested lazy object only creates it, so its probe computes the fields, keeping the
+#  real work inside the probe's timing & deadline.
+_PROBE_FUNCS: dict[str, t.Callable[[], t.Any]] = {"uname": _probe_platform_uname}
+
+## Prefix for probes of the platform-specific class' fields
+PLATFORM_SPECIFIC_PREFIX: str = "platform_specific_info"
+
+## Dotted paths of probes that block on I/O or a subprocess. These run on the
+#  ProbeCollector's thread pool, every other probe runs inline.
+BLOCKING_PROBES: frozenset[str] = frozenset(
+    {
+        "platform",
+        "platform_terse",
+        "platform_aliased",
+        "processor",
+        "cpu",
+        "cpu_features",
+        "cpu_topology",
+        "arch",
+        f"{PLATFORM_SPECIFIC_PREFIX}.libc_ver",
+        f"{PLATFORM_SPECIFIC_PREFIX}.libc_source",
+        f"{PLATFORM_SPECIFIC_PREFIX}.os_release",
+        f"{PLATFORM_SPECIFIC_PREFIX}.mac_ver",
+        f"{PLATFORM_SPECIFIC_PREFIX}.win32_ver",
+        f"{PLATFORM_SPECIFIC_PREFIX}.win32_edition",
+        f"{PLATFORM_SPECIFIC_PREFIX}.win32_is_iot",
+    }
+)
+
+
+## Fields (by top-level name) that other fields need to be computed. The platform-specific
+#  class is picked from 'system'.
+FIELD_DEPENDENCIES: dict[str, t.Tuple[str, ...]] = {
+    PLATFORM_SPECIFIC_PREFIX: ("system",),
+}
+
+
+class Probe(t.NamedTuple):
+    """A single function that computes the value of 1 PlatformInfo field.
+
+    Params:
+        path (str): Dotted path of the field the probe computes, i.e. 'python.version'.
+        func (Callable[[], Any]): Function that returns the field's value.
+        blocking (bool): `True` if the probe blocks on I/O or a subprocess.
+
+    """
+
+    path: str
+    func: t.Callable[[], t.Any]
+    blocking: bool = False
+
+
+def get_platform_specific_class(system: str) -> type[PlatformSpecificInfo] | None:
+    """Return the platform-specific info class for a platform.system() value."""
+    match system:
+        case EnumSystemTypes.LINUX.value:
+            return PlatformLinuxInfo
+        case EnumSystemTypes.WINDOWS.value:
+            return PlatformWinInfo
+        case EnumSystemTypes.MAC.value:
+            return PlatformMacInfo
+        case _:
+            return None
+
+
+def _field_probe(path: str, _field: t.Any) -> Probe:
+    """Build a Probe from a dataclass field's LazyField/default/default_factory."""
+    if path in _PROBE_FUNCS:
+        func: t.Callable[[], t.Any] = _PROBE_FUNCS[path]
+    elif isinstance(_field.default, LazyField):
+        func = _field.default.factory
+    elif callable(_field.default_factory):
+        func = _field.default_factory
+    else:
+        func = functools.partial(_identity, _field.default)
+
+    return Probe(path=path, func=func, blocking=path in BLOCKING_PROBES)
+
+
+def _identity(value: T) -> T:
+    return value
+
+
+def get_probes(system: str | None = None) -> list[Probe]:
+    """Return a Probe for every PlatformInfo field on a platform (defaults to this one)."""
+    return list(_build_probes(system or _platform.system()))
+
+
+@functools.cache
+def _build_probes(system: str) -> t.Tuple[Probe, ...]:
+    """Build the (immutable) probes for a platform once, they are the same on every call."""
+    probes: list[Probe] = []
+
+    for _field in fields(PlatformInfo):
+        if _field.name in _SPLIT_FIELDS:
+            for nested in fields(_SPLIT_FIELDS[_field.name]):
+                probes.append(_field_probe(f"{_field.name}.{nested.name}", nested))
+        else:
+            probes.append(_field_probe(_field.name, _field))
+
+    platform_extra_cls: type[PlatformSpecificInfo] | None = get_platform_specific_class(
+        system
+    )
+    if platform_extra_cls is not None:
+        for nested in fields(platform_extra_cls):
+            probes.append(
+                _field_probe(f"{PLATFORM_SPECIFIC_PREFIX}.{nested.name}", nested)
+            )
+
+    return tuple(probes)
+
+
+def _match_probe_paths(path: str, probe_paths: t.Iterable[str]) -> list[str]:
+    """Return the probe paths that compute a dotted field path.
+
+    A probe's own path matches itself, a group (i.e. 'python') matches every probe
+    in the group & an attribute of a field (i.e. 'uname.node') matches the field's probe.
+    """
+    probe_paths = list(probe_paths)
+
+    if path in probe_paths:
+        return [path]
+
+    group: list[str] = [
+        probe_path for probe_path in probe_paths if probe_path.startswith(f"{path}.")
+    ]
+    if group:
+        return group
+
+    parent: str = path
+    while "." in parent:
+        parent = parent.rpartition(".")[0]
+        if parent in probe_paths:
+            return [parent]
+
+    return []
+
+
+def select_probes(fields: t.Iterable[str], system: str | None = None) -> list[Probe]:
+    """Return only the probes needed to compute some PlatformInfo fields.
+
+    Description:
+        Fields are dotted paths, i.e. 'system', 'uname.node' or 'python.version'. A
+        field's dependencies (see `FIELD_DEPENDENCIES`) are selected too. Probes are
+        returned in the same order as `get_probes()`.
+
+    Raises:
+        ValueError: When a field does not match any probe.
+
+    """
+    probes: dict[str, Probe] = {probe.path: probe for probe in get_probes(system)}
+    selected: set[str] = set()
+    pending: list[str] = [fields] if isinstance(fields, str) else list(fields)
+
+    while pending:
+        path: str = pending.pop()
+        matched: list[str] = _match_probe_paths(path, probes)
+        if not matched:
+            raise ValueError(f"Unknown PlatformInfo field: '{path}'")
+
+        for probe_path in matched:
+            if probe_path in selected:
+                continue
+
+            selected.add(probe_path)
+            pending.extend(FIELD_DEPENDENCIES.get(probe_path.partition(".")[0], ()))
+
+    return [probe for path, probe in probes.items() if path in selected]
+
+
+def get_field_value(info: PlatformInfo, path: str) -> t.Any:
+    """Return the value of a dotted field path from a PlatformInfo object, i.e. 'uname.node'."""
+    value: t.Any = info
+    for name in path.split("."):
+        if value is None:
+            return None
+
+        value = (
+            value.get(name)
+            if isinstance(value, (dict, MappingProxyType))
+            else getattr(value, name)
+        )
+
+    return value
+
+
+def _assemble_fields(
+    values: dict[str, t.Any],
+) -> t.Tuple[dict[str, t.Any], dict[str, t.Any]]:
+    """Split probe values into PlatformInfo & platform-specific init kwargs.
+
+    Fields without a value stay pending, see `LazyField`.
+    """
+    top_level: dict[str, t.Any] = {}
+    nested: dict[str, dict[str, t.Any]] = {
+        name: {} for name in (*_SPLIT_FIELDS, PLATFORM_SPECIFIC_PREFIX)
+    }
+
+    for path, value in values.items():
+        parent, _, name = path.partition(".")
+        if name:
+            nested[parent][name] = value
+        else:
+            top_level[parent] = value
+
+    for name, cls in _SPLIT_FIELDS.items():
+        if nested[name]:
+            top_level[name] = cls(**nested[name])
+
+    return top_level, nested[PLATFORM_SPECIFIC_PREFIX]
+
+
+def _attach_collection_state(
+    info: PlatformInfo,
+    platform_specific: dict[str, t.Any],
+    unavailable: t.Iterable[str] = (),
+    collection_stats: CollectionStats | None = None,
+    collected_fields: t.Iterable[str] | None = None,
+) -> None:
+    """Attach the platform-specific info & collection details to a PlatformInfo object."""
+    platform_extra_cls: type[PlatformSpecificInfo] | None = get_platform_specific_class(
+        info.system
+    )
+    if platform_extra_cls is not None and platform_specific:
+        object.__setattr__(
+            info, "_platform_specific_info", platform_extra_cls(**platform_specific)
+        )
+
+    object.__setattr__(info, "_unavailable_fields", frozenset(unavailable))
+    if collection_stats is not None:
+        object.__setattr__(info, "_collection_stats", collection_stats)
+    if collected_fields is not None:
+        object.__setattr__(info, "_collected_fields", frozenset(collected_fields))
+
+
+def build_platform_info(
+    values: dict[str, t.Any],
+    unavailable: t.Iterable[str] = (),
+    collection_stats: CollectionStats | None = None,
+    fields: t.Iterable[str] | None = None,
+) -> PlatformInfo:
+    """Assemble a PlatformInfo object from probe values keyed by dotted field path.
+
+    When `fields` is set, `values` only hold the selected probes & every other field
+    stays pending until it is read.
+    """
+    top_level, platform_specific = _assemble_fields(values)
+
+    info: PlatformInfo = PlatformInfo(**top_level)
+    _attach_collection_state(
+        info,
+        platform_specific=platform_specific,
+        unavailable=unavailable,
+        collection_stats=collection_stats,
+        collected_fields=None if fields is None else values.keys(),
+    )
+
+    return info
+
+
+class ProbeStats(t.NamedTuple):
+    """Timing of a single probe run.
+
+    Params:
+        path (str): Dotted path of the field the probe computes.
+        wall_ns (int): Wall time of the probe, in nanoseconds.
+        subprocess (bool): `True` if the probe spawned a subprocess, detected with an
+            audit hook.
+        cached (bool): `True` if the value came from a cache (memoized or on disk).
+        status (str): 'ok', or 'timeout'/'error' for unavailable probes.
+
+    """
+
+    path: str
+    wall_ns: int
+    subprocess: bool = False
+    cached: bool = False
+    status: str = "ok"
+
+
+@dataclass
+class CollectionStats(DictMixin):
+    """Timing of every probe in a PlatformInfo collection."""
+
+    probes: t.Tuple[ProbeStats, ...] = field(default=())
+    ## Wall time of the whole collection. Less than the sum of the probes when they run concurrently.
+    wall_ns: int = field(default=0)
+
+    def slowest(self) -> list[ProbeStats]:
+        """Return probe stats, slowest first."""
+        return sorted(self.probes, key=lambda stats: stats.wall_ns, reverse=True)
+
+    def format_table(self) -> str:
+        """Return a table of probe timings, sorted slowest first."""
+        width: int = max((len(stats.path) for stats in self.probes), default=5)
+        lines: list[str] = [
+            f"[ Collection profile ] Total: {self.wall_ns / 1e6:.3f}ms ({len(self.probes)} probes)",
+            f"{'Probe':<{width}}  {'Time (ms)':>10}  Subprocess  Cached  Status",
+        ]
+
+        for stats in self.slowest():
+            lines.append(
+                f"{stats.path:<{width}}  {stats.wall_ns / 1e6:>10.3f}  "
+                f"{'yes' if stats.subprocess else 'no':<10}  "
+                f"{'yes' if stats.cached else 'no':<6}  {stats.status}"
+            )
+
+        return "\n".join(lines)
+
+
+## Notes about the probe running in the current context, filled in by _note_probe().
+#  A ContextVar (instead of threading.local) so notes also work in asyncio tasks.
+_probe_notes: contextvars.ContextVar[dict[str, bool] | None] = contextvars.ContextVar(
+    "platform_info_probe_notes", default=None
+)
+
+
+## Audit events raised when a process is spawned, see `_audit_subprocess()`
+_SUBPROCESS_AUDIT_EVENTS: frozenset[str] = frozenset(
+    {
+        "subprocess.Popen",
+        "os.posix_spawn",
+        "os.spawn",
+        "os.system",
+        "os.fork",
+        "os.forkpty",
+        "os.startfile",
+    }
+)
+_subprocess_audit_installed: bool = False
+_subprocess_audit_lock: threading.Lock = threading.Lock()
+
+
+def _audit_subprocess(event: str, args: t.Tuple) -> None:
+    """Audit hook that notes a spawned process on the timed probe running in this context.
+
+    Description:
+        Audit events are raised on the thread (& in the context) that spawns the
+        process, so a subprocess run by any library a probe calls (i.e. the platform
+        module, or asyncio) is detected, without patching `subprocess.Popen`.
+    """
+    if event in _SUBPROCESS_AUDIT_EVENTS:
+        _note_probe(subprocess=True)
+
+
+def _install_subprocess_audit() -> None:
+    """Install `_audit_subprocess()` the first time a probe is timed.
+
+    Description:
+        Audit hooks cannot be removed, so the hook is only installed once, & only
+        when probe stats are collected. Outside of a timed probe it returns after
+        a set lookup.
+    """
+    global _subprocess_audit_installed
+
+    if _subprocess_audit_installed:
+        return
+
+    with _subprocess_audit_lock:
+        if not _subprocess_audit_installed:
+            sys.addaudithook(_audit_subprocess)
+            _subprocess_audit_installed = True
+
+
+def _note_probe(subprocess: bool = False, cached: bool = False) -> None:
+    """Record that the running probe spawned a subprocess or hit a cache."""
+    notes: dict[str, bool] | None = _probe_notes.get()
+    if notes is None:
+        ## Not called from a timed probe
+        return
+
+    if subprocess:
+        notes["subprocess"] = True
+    if cached:
+        notes["cached"] = True
+
+
+def run_timed_probe(probe: Probe) -> t.Tuple[t.Any, ProbeStats]:
+    """Run a probe, returning its value & timing stats."""
+    _install_subprocess_audit()
+    notes: dict[str, bool] = {}
+    token: contextvars.Token = _probe_notes.set(notes)
+    started_ns: int = time.perf_counter_ns()
+
+    try:
+        value: t.Any = probe.func()
+    finally:
+        wall_ns: int = time.perf_counter_ns() - started_ns
+        _probe_notes.reset(token)
+
+    return value, ProbeStats(path=probe.path, wall_ns=wall_ns, **notes)
+
+
+async def async_run_timed_probe(
+    path: str, async_func: t.Callable[[], t.Awaitable[t.Any]]
+) -> t.Tuple[t.Any, ProbeStats]:
+    """Await an async probe, returning its value & timing stats."""
+    _install_subprocess_audit()
+    notes: dict[str, bool] = {}
+    token: contextvars.Token = _probe_notes.set(notes)
+    started_ns: int = time.perf_counter_ns()
+
+    try:
+        value: t.Any = await async_func()
+    finally:
+        wall_ns: int = time.perf_counter_ns() - started_ns
+        _probe_notes.reset(token)
+
+    return value, ProbeStats(path=path, wall_ns=wall_ns, **notes)
+
+
+@dataclass
+class ProbeResults:
+    """Values, unavailable probes & timing stats from a ProbeCollector run."""
+
+    values: dict[str, t.Any] = field(default_factory=dict)
+    unavailable: set[str] = field(default_factory=set)
+    stats: list[ProbeStats] = field(default_factory=list)
+    wall_ns: int = field(default=0)
+    ## Probes being collected, & a callback for progress(finished, total)
+    total: int = field(default=0)
+    progress: t.Callable[[int, int], None] | None = field(
+        default=None, repr=False, compare=False
+    )
+
+    def add(self, value: t.Any, stats: ProbeStats) -> None:
+        self.values[stats.path] = value
+        self.stats.append(stats)
+
+        if self.progress is not None:
+            self.progress(len(self.stats), self.total)
+
+    @property
+    def collection_stats(self) -> CollectionStats:
+        return CollectionStats(probes=tuple(self.stats), wall_ns=self.wall_ns)
+
+    def to_platform_info(self, fields: t.Iterable[str] | None = None) -> PlatformInfo:
+        return build_platform_info(
+            self.values,
+            unavailable=self.unavailable,
+            collection_stats=self.collection_stats,
+            fields=fields,
+        )
+
+
+class _DaemonProbePool:
+    """Run blocking probes on a fixed number of daemon threads.
+
+    Description:
+        `ThreadPoolExecutor` joins its workers when the interpreter exits, so a probe
+        that missed its deadline (i.e. waiting on a hung subprocess) would still
+        delay exit until it returned. Daemon threads are abandoned at exit instead.
+
+    Params:
+        probes (list[Probe]): Probes to run, started in order.
+        max_workers (int): Max threads to run probes on.
+
+    """
+
+    def __init__(self, probes: list[Probe], max_workers: int):
+        self._pending: t.Iterator[Probe] = iter(probes)
+        self._lock: threading.Lock = threading.Lock()
+        self._shutdown: bool = False
+        self._done: dict[str, threading.Event] = {
+            probe.path: threading.Event() for probe in probes
+        }
+        ## A probe's (value, stats), or the exception it raised
+        self._results: dict[str, t.Tuple[t.Any, ProbeStats] | BaseException] = {}
+
+        for worker in range(min(max_workers, len(probes))):
+            threading.Thread(
+                target=self._work, name=f"platform_info_probe_{worker}", daemon=True
+            ).start()
+
+    def _work(self) -> None:
+        while True:
+            with self._lock:
+                probe: Probe | None = (
+                    None if self._shutdown else next(self._pending, None)
+                )
+            if probe is None:
+                return
+
+            try:
+                self._results[probe.path] = run_timed_probe(probe)
+            except BaseException as exc:
+                self._results[probe.path] = exc
+            self._done[probe.path].set()
+
+    def result(self, path: str, timeout: float) -> t.Tuple[t.Any, ProbeStats]:
+        """Wait up to `timeout` seconds for a probe, returning its value & stats.
+
+        Raises:
+            TimeoutError: When the probe has not finished within `timeout`.
+
+        """
+        if not self._done[path].wait(timeout):
+            raise TimeoutError(f"Probe '{path}' did not finish within {timeout}s")
+
+        result: t.Tuple[t.Any, ProbeStats] | BaseException = self._results[path]
+        if isinstance(result, BaseException):
+            raise result
+
+        return result
+
+    def shutdown(self) -> None:
+        """Stop starting queued probes. Running probes finish in the background."""
+        with self._lock:
+            self._shutdown = True
+
+
+async def _to_daemon_thread(func: t.Callable[..., T], *args: t.Any) -> T:
+    """Like `asyncio.to_thread()`, on a daemon thread instead of the loop's executor.
+
+    Description:
+        `asyncio.run()` waits for the default executor's threads when it closes the
+        loop, so a probe that missed its deadline would block it until it returned.
+        The daemon thread is abandoned instead, & its result discarded.
+    """
+    import asyncio
+
+    loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+    future: asyncio.Future = loop.create_future()
+    context: contextvars.Context = contextvars.copy_context()
+
+    def _resolve(result: t.Any, exc: BaseException | None) -> None:
+        ## The awaiting task may have been cancelled, i.e. by its deadline
+        if future.done():
+            return
+
+        if exc is None:
+            future.set_result(result)
+        else:
+            future.set_exception(exc)
+
+    def _run() -> None:
+        result: t.Any = None
+        exc: BaseException | None = None
+        try:
+            result = context.run(func, *args)
+        except BaseException as error:
+            exc = error
+
+        try:
+            loop.call_soon_threadsafe(_resolve, result, exc)
+        except RuntimeError:
+            ## The loop was closed, nobody is waiting on the result
+            pass
+
+    threading.Thread(target=_run, name="platform_info_probe", daemon=True).start()
+
+    return await future
+
+
+class ProbeCollector:
+    """Collect PlatformInfo probes concurrently, with a deadline for each probe.
+
+    Description:
+        Blocking probes (see `BLOCKING_PROBES`) are submitted to a thread pool,
+        while the remaining (cheap) probes run inline on the calling thread. Each
+        blocking probe gets its own deadline, measured from when collection started.
+        A probe that misses its deadline or raises an exception is marked unavailable
+        and its field is left as `None`, instead of stalling the whole snapshot.
+
+        Threads cannot be interrupted, so a timed-out probe keeps running in the
+        background until it returns; its result is discarded. Probes run on daemon
+        threads, so a probe that never returns does not delay interpreter exit.
+
+    Params:
+        timeout (float): Default deadline (in seconds) for each blocking probe.
+        timeouts (dict[str, float] | None): Per-probe deadlines, keyed by dotted field path.
+        max_workers (int | None): Max threads for blocking probes. Defaults to 1 per blocking probe.
+        progress (Callable[[int, int], None] | None): Called with (finished, total) probes each time a probe finishes.
+
+    """
+
+    def __init__(
+        self,
+        timeout: float = DEFAULT_PROBE_TIMEOUT,
+        timeouts: dict[str, float] | None = None,
+        max_workers: int | None = None,
+        progress: t.Callable[[int, int], None] | None = None,
+    ):
+        self.timeout = timeout
+        self.timeouts: dict[str, float] = timeouts or {}
+        self.max_workers = max_workers
+        self.progress = progress
+
+    def get_timeout(self, path: str) -> float:
+        return self.timeouts.get(path, self.timeout)
+
+    def collect(self, probes: t.Iterable[Probe]) -> ProbeResults:
+        """Run probes, returning their values, the unavailable probes & timing stats.
+
+        Values are keyed by dotted field path. Unavailable probes have a value of `None`.
+        """
+        probes = list(probes)
+        blocking: list[Probe] = [probe for probe in probes if probe.blocking]
+
+        results: ProbeResults = ProbeResults(total=len(probes), progress=self.progress)
+        started_ns: int = time.perf_counter_ns()
+
+        started: float = time.monotonic()
+        pool: _DaemonProbePool = _DaemonProbePool(
+            blocking, max_workers=self.max_workers or len(blocking)
+        )
+
+        try:
+            ## Run cheap probes while the blocking probes are in flight
+            self._run_inline(probes, results)
+
+            ## Wait on the probes with the earliest deadline first
+            for path in sorted(
+                (probe.path for probe in blocking), key=self.get_timeout
+            ):
+                remaining: float = started + self.get_timeout(path) - time.monotonic()
+
+                try:
+                    value, stats = pool.result(path, timeout=max(remaining, 0))
+                except Exception as exc:
+                    self._mark_unavailable(path, exc, results, started_ns)
+                else:
+                    results.add(value, stats)
+
+        finally:
+            ## Do not start queued probes, or wait on timed-out probes
+            pool.shutdown()
+
+        results.wall_ns = time.perf_counter_ns() - started_ns
+
+        return results
+
+    async def async_collect(self, probes: t.Iterable[Probe]) -> ProbeResults:
+        """Run probes without blocking the event loop, see `collect()`.
+
+        Description:
+            Blocking probes with a native coroutine (see `ASYNC_PROBES`) spawn their
+            subprocess with `asyncio.create_subprocess_exec`. Other blocking probes
+            are offloaded with `asyncio.to_thread`.
+        """
+        import asyncio
+
+        probes = list(probes)
+
+        results: ProbeResults = ProbeResults(total=len(probes), progress=self.progress)
+        started_ns: int = time.perf_counter_ns()
+
+        async def _run_blocking(probe: Probe) -> t.Tuple[t.Any, ProbeStats]:
+            async_func: t.Callable[[], t.Awaitable[t.Any]] | None = ASYNC_PROBES.get(
+                probe.func
+            )
+            if async_func is not None:
+                return await async_run_timed_probe(probe.path, async_func)
+
+            return await _to_daemon_thread(run_timed_probe, probe)
+
+        ## Each task's deadline starts when it is scheduled
+        tasks: dict[str, asyncio.Future] = {
+            probe.path: asyncio.ensure_future(
+                asyncio.wait_for(
+                    _run_blocking(probe), timeout=self.get_timeout(probe.path)
+                )
+            )
+            for probe in probes
+            if probe.blocking
+        }
+
+        self._run_inline(probes, results)
+
+        for path, task in tasks.items():
+            try:
+                value, stats = await task
+            except Exception as exc:
+                self._mark_unavailable(path, exc, results, started_ns)
+            else:
+                results.add(value, stats)
+
+        results.wall_ns = time.perf_counter_ns() - started_ns
+
+        return results
+
+    def _run_inline(self, probes: list[Probe], results: ProbeResults) -> None:
+        """Run the non-blocking probes on the calling thread."""
+        for probe in probes:
+            if probe.blocking:
+                continue
+
+            started_ns: int = time.perf_counter_ns()
+            try:
+                value, stats = run_timed_probe(probe)
+            except Exception as exc:
+                self._mark_unavailable(probe.path, exc, results, started_ns)
+            else:
+                results.add(value, stats)
+
+    def _mark_unavailable(
+        self,
+        path: str,
+        exc: Exception,
+        results: ProbeResults,
+        started_ns: int,
+    ) -> None:
+        if isinstance(exc, TimeoutError):
+            log.warning(
+                f"Probe '{path}' did not finish within {self.get_timeout(path)}s, marking it unavailable."
+            )
+            status: str = "timeout"
+        else:
+            log.warning(f"({type(exc)}) Probe '{path}' failed. Details: {exc}")
+            status = "error"
+
+        results.unavailable.add(path)
+        results.add(
+            None,
+            ProbeStats(
+                path=path,
+                wall_ns=time.perf_counter_ns() - started_ns,
+                status=status,
+            ),
+        )
+
+    def collect_platform_info(
+        self, fields: t.Iterable[str] | None = None
+    ) -> PlatformInfo:
+        """Collect every probe (or only the probes `fields` need) into a PlatformInfo object."""
+        probes: list[Probe] = get_probes() if fields is None else select_probes(fields)
+
+        return self.collect(probes).to_platform_info(fields=fields)
+
+    async def async_collect_platform_info(
+        self, fields: t.Iterable[str] | None = None
+    ) -> PlatformInfo:
+        """Collect every probe (or only the probes `fields` need) into a PlatformInfo object, asynchronously."""
+        probes: list[Probe] = get_probes() if fields is None else select_probes(fields)
+        results: ProbeResults = await self.async_collect(probes)
+
+        return results.to_platform_info(fields=fields)
+
+
+################
+# Async probes #
+################
+
+
+async def _async_check_output(*args: str) -> str:
+    """Run a command with asyncio & return its stdout. Kills the process if cancelled."""
+    import asyncio
+    import subprocess
+
+    proc = await asyncio.create_subprocess_exec(
+        *args,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        ## Force untranslated output, like the platform module does
+        env={**os.environ, "LC_ALL": "C"},
+    )
+
+    try:
+        stdout, _ = await proc.communicate()
+    except BaseException:
+        if proc.returncode is None:
+            proc.kill()
+        raise
+
+    if proc.returncode:
+        raise OSError(f"Command {args} exited with code {proc.returncode}")
+
+    return stdout.decode("latin-1").strip()
+
+
+def _parse_file_architecture(fileout: str) -> t.Tuple[str, str]:
+    """Parse `file -b` output into a (bits, linkage) tuple, like platform.architecture()."""
+    import struct
+
+    bits: str = f"{struct.calcsize('P') * 8}bit"
+    linkage: str = ""
+
+    if not fileout:
+        ## No output from 'file', use the platform module's defaults
+        default_bits, default_linkage = getattr(
+            _platform, "_default_architecture", {}
+        ).get(sys.platform, ("", ""))
+        return default_bits or bits, default_linkage or linkage
+
+    if "executable" not in fileout and "shared object" not in fileout:
+        return bits, linkage
+
+    if "32-bit" in fileout:
+        bits = "32bit"
+    elif "64-bit" in fileout:
+        bits = "64bit"
+
+    if "ELF" in fileout:
+        linkage = "ELF"
+    elif "PE" in fileout:
+        linkage = "WindowsPE" if "Windows" in fileout else "PE"
+    elif "COFF" in fileout:
+        linkage = "COFF"
+    elif "MS-DOS" in fileout:
+        linkage = "MSDOS"
+
+    return bits, linkage
+
+
+async def async_get_architecture() -> t.Tuple[str, str]:
+    """Async version of `get_architecture()`, runs `file` with asyncio for non-ELF binaries."""
+    import asyncio
+
+    if _architecture.cache_info().currsize or sys.platform in ("win32", "OpenVMS"):
+        ## Memoized, or platform.architecture() does not run 'file' on these platforms
+        return await asyncio.to_thread(get_architecture)
+
+    arch: t.Tuple[str, str] | None = await asyncio.to_thread(_static_architecture)
+    if arch is None:
+        try:
+            fileout: str = await _async_check_output(
+                "file", "-b", os.path.realpath(sys.executable)
+            )
+        except OSError as exc:
+            log.debug(f"Unable to run 'file'. Details: {exc}")
+            fileout = ""
+
+        arch = _parse_file_architecture(fileout)
+        await asyncio.to_thread(_disk_cache_set, "arch", arch)
+
+    _architecture.cache_set(arch)
+
+    return arch
+
+
+async def async_get_processor() -> str:
+    """Async version of `get_processor()`, runs `uname -p` with asyncio where needed."""
+    import asyncio
+
+    if sys.platform in ("linux", "win32") or _processor.cache_info().currsize:
+        ## Read from /proc/cpuinfo or the environment/registry (no subprocess), or memoized
+        return await asyncio.to_thread(get_processor)
+
+    try:
+        processor: str = await _async_check_output("uname", "-p")
+    except OSError as exc:
+        log.debug(f"Unable to run 'uname -p'. Details: {exc}")
+        processor = ""
+
+    processor = "" if processor == "unknown" else processor
+    _processor.cache_set(processor)
+
+    return processor
+
+
+async def async_build_platform_string(
+    aliased: bool = False, terse: bool = False
+) -> str:
+    """Async version of `build_platform_string()`.
+
+    Description:
+        Where the platform string includes the processor & architecture (not on
+        Linux or Windows, and not when `terse`), they are read with
+        `async_get_processor()` & `async_get_architecture()` first, so the
+        `uname -p` & `file` subprocesses do not block a thread.
+    """
+    import asyncio
+
+    processor: str | None = None
+    architecture: t.Tuple[str, str] | None = None
+    if not terse and sys.platform not in ("linux", "win32"):
+        processor, architecture = await asyncio.gather(
+            async_get_processor(), async_get_architecture()
+        )
+
+    return await asyncio.to_thread(
+        build_platform_string, aliased, terse, processor, architecture
+    )
+
+
+async def async_get_platform() -> str:
+    """Async version of `get_platform()`."""
+    return await async_build_platform_string()
+
+
+async def async_get_platform_terse() -> str:
+    """Async version of `get_platform_terse()`."""
+    return await async_build_platform_string(terse=True)
+
+
+async def async_get_platform_aliased() -> str:
+    """Async version of `get_platform_aliased()`."""
+    return await async_build_platform_string(aliased=True)
+
+
+## Coroutines to use instead of a blocking probe's function in async collection
+ASYNC_PROBES: dict[t.Callable[[], t.Any], t.Callable[[], t.Awaitable[t.Any]]] = {
+    get_architecture: async_get_architecture,
+    get_processor: async_get_processor,
+    get_platform: async_get_platform,
+    get_platform_terse: async_get_platform_terse,
+    get_platform_aliased: async_get_platform_aliased,
+}
+
+
+########################
+# PlatformInfo caching #
+########################
+
+## Dotted paths of PlatformInfo fields whose value can change while the process is
+#  running. All other fields are static.
+VOLATILE_FIELDS: frozenset[str] = frozenset(
+    {
+        "cpu_count",
+        "cpu_limits",
+        "python.path",
+        "python.modules",
+        "python.int_max_str_digits",
+        "python.recursion_limit",
+        "python.gil_enabled",
+    }
+)
+
+
+def get_field_class(path: str) -> EnumFieldClass:
+    """Return the field class of a dotted PlatformInfo field path, i.e. 'python.path'."""
+    if path in VOLATILE_FIELDS:
+        return EnumFieldClass.VOLATILE
+
+    return EnumFieldClass.STATIC
+
+
+def _detach_live_values(values: dict[str, t.Any]) -> dict[str, t.Any]:
+    """Copy probe values that reference live interpreter state (i.e. the sys.path list)."""
+    if isinstance(values.get("python.path"), list):
+        values["python.path"] = tuple(values["python.path"])
+
+    return values
+
+
+def _clear_static_probe_caches() -> None:
+    """Clear the memoized static probes, & the platform module's own caches, so they are re-probed."""
+    for probe in (
+        _mac_ver,
+        _win32_ver,
+        _win32_edition,
+        _win32_is_iot,
+        _libc_ver,
+        _architecture,
+        _cpu_info,
+        _cpu_features,
+        _processor,
+        get_cgroup_cpu_dirs,
+    ):
+        probe.cache_clear()
+
+    ## platform caches uname() & freedesktop_os_release() for the life of the process
+    for name in ("_uname_cache", "_os_release_cache"):
+        if hasattr(_platform, name):
+            setattr(_platform, name, None)
+    if isinstance(getattr(_platform, "_platform_cache", None), dict):
+        _platform._platform_cache.clear()
+
+
+def _collect_field_class(
+    field_class: EnumFieldClass, collector: ProbeCollector
+) -> ProbeResults:
+    """Collect every PlatformInfo field in a field class, see `ProbeCollector.collect()`.
+
+    Description:
+        A probe that fails or misses its deadline is listed in the results'
+        `unavailable` set, like in `get_platform_info()`.
+    """
+    results: ProbeResults = collector.collect(
+        probe for probe in get_probes() if get_field_class(probe.path) is field_class
+    )
+
+    ## Shared snapshots must not hold references to live interpreter state
+    _detach_live_values(results.values)
+
+    return results
+
+
+class PlatformInfoCache:
+    """Memoize a read-only `PlatformInfo` snapshot, with a TTL per field class.
 
-@dataclass
-class PlatformInfoBase(DictMixin):
-    """Base class for platform information.
+    Params:
+        static_ttl (float | None): Seconds before static fields are re-probed. `None` never expires.
+        volatile_ttl (float | None): Seconds before volatile fields are re-probed. `None` never expires.
+        clock (Callable[[], float]): Monotonic clock used to expire entries.
+        collector (ProbeCollector | None): Runs the probes. Defaults to `ProbeCollector()`.
 
-    Description:
-        Compile platform data common across all OSes to serve as a base for
-        building platform-specific classes.
     """
 
-    platform: str = field(default_factory=_platform.platform)
-    platform_terse: str = field(default=get_platform_terse)
-    platform_aliased: str = field(default=get_platform_aliased)
-    machine: str = field(default_factory=_platform.machine)
-    system: str = field(default_factory=_platform.system)
-    release: str = field(default_factory=_platform.release)
-    version: str = field(default_factory=_platform.version)
-    processor: str | None = field(default_factory=_platform.processor)
-    cpu_count: int = field(default_factory=get_cpu_count)
-    arch: t.Tuple[str, str] = field(default_factory=_platform.architecture)
-    uname: PlatformUname = field(default_factory=get_platform_uname)
-    python: PlatformPython = field(default_factory=get_platform_python)
-    byteorder: str = field(default_factory=get_sys_byteorder)
+    def __init__(
+        self,
+        static_ttl: float | None = None,
+        volatile_ttl: float | None = 5.0,
+        clock: t.Callable[[], float] = time.monotonic,
+        collector: ProbeCollector | None = None,
+    ):
+        self.ttl: dict[EnumFieldClass, float | None] = {
+            EnumFieldClass.STATIC: static_ttl,
+            EnumFieldClass.VOLATILE: volatile_ttl,
+        }
+        self.clock = clock
+        self.collector: ProbeCollector = collector or ProbeCollector()
+
+        self._lock = threading.Lock()
+        self._values: dict[EnumFieldClass, dict[str, t.Any]] = {}
+        self._unavailable: dict[EnumFieldClass, set[str]] = {}
+        self._expires_at: dict[EnumFieldClass, float] = {}
+        self._snapshot: PlatformInfo | None = None
+
+    def set_ttl(self, field_class: EnumFieldClass, ttl: float | None) -> None:
+        """Set the TTL (in seconds) for a field class. Takes effect on the next refresh."""
+        self.ttl[field_class] = ttl
+
+    def _is_fresh(self, field_class: EnumFieldClass, now: float) -> bool:
+        return now < self._expires_at.get(field_class, float("-inf"))
+
+    def get(self) -> PlatformInfo:
+        """Return the memoized snapshot, re-probing any expired field class."""
+        snapshot: PlatformInfo | None = self._snapshot
+        now: float = self.clock()
+
+        ## Fast path, no lock needed to return a fresh snapshot
+        if snapshot is not None and all(
+            self._is_fresh(field_class, now) for field_class in EnumFieldClass
+        ):
+            return snapshot
+
+        with self._lock:
+            now = self.clock()
+
+            for field_class in EnumFieldClass:
+                if self._is_fresh(field_class, now):
+                    continue
+
+                log.debug(f"Refreshing {field_class.value} PlatformInfo fields")
+                if field_class is EnumFieldClass.STATIC and field_class in self._values:
+                    ## Expired, the memoized static probes would return the same values
+                    _clear_static_probe_caches()
+
+                results: ProbeResults = _collect_field_class(
+                    field_class, self.collector
+                )
+                self._values[field_class] = results.values
+                self._unavailable[field_class] = results.unavailable
+
+                ttl: float | None = self.ttl[field_class]
+                self._expires_at[field_class] = (
+                    float("inf") if ttl is None else now + ttl
+                )
+                self._snapshot = None
+
+            if self._snapshot is None:
+                self._snapshot = self._build_snapshot()
+
+            return self._snapshot
+
+    def _build_snapshot(self) -> PlatformInfo:
+        values: dict[str, t.Any] = {}
+        for class_values in self._values.values():
+            values.update(class_values)
+
+        unavailable: set[str] = set().union(*self._unavailable.values())
+        snapshot: PlatformInfo = build_platform_info(values, unavailable=unavailable)
+        ## Build the platform-specific info first, so it is locked with the rest
+        snapshot.platform_specific_info
+        snapshot.make_read_only()
+
+        return snapshot
+
+    def invalidate(self, field_class: EnumFieldClass | None = None) -> None:
+        """Expire 1 field class, or the whole snapshot when `field_class` is `None`."""
+        field_classes: list[EnumFieldClass] = (
+            list(EnumFieldClass) if field_class is None else [field_class]
+        )
 
-    def is_linux(self) -> bool:
-        if self.system == EnumSystemTypes.LINUX.value:
-            return True
-        else:
-            return False
+        with self._lock:
+            for _class in field_classes:
+                self._values.pop(_class, None)
+                self._unavailable.pop(_class, None)
+                self._expires_at.pop(_class, None)
 
-    def is_unix(self) -> bool:
-        if self.system in [EnumSystemTypes.LINUX.value, EnumSystemTypes.MAC.value]:
-            return True
-        else:
-            return False
+                if _class is EnumFieldClass.STATIC:
+                    _clear_static_probe_caches()
 
-    def is_win(self) -> bool:
-        if self.system == EnumSystemTypes.WINDOWS.value:
-            return True
-        else:
-            return False
+            self._snapshot = None
 
-    def is_mac(self) -> bool:
-        if self.system == EnumSystemTypes.MAC.value:
-            return True
-        else:
-            return False
 
-    def is_java(self) -> bool:
-        if self.system == EnumSystemTypes.JAVA.value:
-            return True
-        else:
-            return False
+## Process-wide cache used by get_cached_platform_info()
+PLATFORM_INFO_CACHE: PlatformInfoCache = PlatformInfoCache()
 
-    def is_32bit(self) -> bool:
-        if "32bit" in self.arch:
-            return True
-        else:
-            return False
 
-    def is_64bit(self) -> bool:
-        if "64bit" in self.arch:
-            return True
+##############
+# Watch mode #
+##############
+
+## Files static fields are parsed from. A change to their mtime, size or inode means
+#  the static fields must be re-probed, see get_static_sources_stamp().
+STATIC_SOURCE_FILES: t.Tuple[str, ...] = ("/etc/os-release", "/usr/lib/os-release")
+
+
+def get_static_sources_stamp() -> t.Tuple[t.Any, ...]:
+    """Return a cheap fingerprint of the sources static fields are read from.
+
+    Description:
+        Made of `os.uname()` (1 syscall, not cached like `platform.uname()`) & the
+        mtime, size & inode of each file in `STATIC_SOURCE_FILES`. Comparing 2
+        stamps is much cheaper than re-parsing the sources. On platforms without
+        `os.uname()` (i.e. Windows), only the files are compared.
+    """
+    stamp: list[t.Any] = [tuple(os.uname()) if hasattr(os, "uname") else None]
+
+    for path in STATIC_SOURCE_FILES:
+        try:
+            stat: os.stat_result = os.stat(path)
+        except OSError:
+            stamp.append(None)
         else:
-            return False
+            stamp.append((stat.st_mtime_ns, stat.st_size, stat.st_ino))
 
+    return tuple(stamp)
 
-@dataclass
-class PlatformInfo(PlatformInfoBase):
-    """Compile information about the OS running this script."""
 
-    @property
-    def platform_specific_info(
+class PlatformWatcher:
+    """Keep PlatformInfo up to date in a long-running process & report what changed.
+
+    Description:
+        The first `poll()` collects every field (or only `fields`). Later polls only
+        re-run the volatile probes (see `VOLATILE_FIELDS`) & compare a stamp of the
+        static sources (see `get_static_sources_stamp()`). The static probes are
+        re-run, with their caches cleared, only when the stamp changes. When no
+        probe value changed, a poll returns an empty delta without building a new
+        PlatformInfo object.
+
+    Params:
+        fields (Iterable[str] | None): Only collect & compare these dotted paths.
+        collector (ProbeCollector | None): Runs the probes. Defaults to `ProbeCollector()`.
+        previous (dict | None): The last reported state, as returned by
+            `to_json_dict()` (i.e. from `read_snapshot_file()`). The first poll
+            reports the changes since then, instead of every field.
+
+    """
+
+    def __init__(
         self,
-    ) -> t.Union[PlatformWinInfo, PlatformMacInfo, PlatformMacInfo]:
-        """Detect OS and return platform-specific class with additional platform info."""
-        match self.system:
-            case EnumSystemTypes.LINUX.value:
-                platform_extra: PlatformLinuxInfo = PlatformLinuxInfo()
-            case EnumSystemTypes.WINDOWS.value:
-                platform_extra: PlatformWinInfo = PlatformWinInfo()
-            case EnumSystemTypes.MAC.value:
-                platform_extra: PlatformMacInfo = PlatformMacInfo()
-            case _:
-                log.error(f"Unknown OS: {self.system}")
+        fields: t.Iterable[str] | None = None,
+        collector: ProbeCollector | None = None,
+        previous: dict[str, t.Any] | None = None,
+    ):
+        self.fields: list[str] | None = None if fields is None else list(fields)
+        self.collector: ProbeCollector = collector or ProbeCollector()
+        ## JSON dict of the last reported state
+        self.previous: dict[str, t.Any] = previous or {}
+        ## Latest PlatformInfo object, set by the first poll()
+        self.info: PlatformInfo | None = None
+
+        probes: list[Probe] = (
+            get_probes() if self.fields is None else select_probes(self.fields)
+        )
+        self._static_probes: list[Probe] = [
+            probe
+            for probe in probes
+            if get_field_class(probe.path) is EnumFieldClass.STATIC
+        ]
+        self._volatile_probes: list[Probe] = [
+            probe
+            for probe in probes
+            if get_field_class(probe.path) is EnumFieldClass.VOLATILE
+        ]
+
+        self._values: dict[str, t.Any] = {}
+        self._unavailable: set[str] = set()
+        self._stamp: t.Tuple[t.Any, ...] | None = None
+
+    def poll(self) -> PlatformInfoDelta:
+        """Re-probe the fields that may have changed & return the delta since the last poll."""
+        probes: list[Probe] = list(self._volatile_probes)
+
+        stamp: t.Tuple[t.Any, ...] = get_static_sources_stamp()
+        if stamp != self._stamp:
+            if self._stamp is not None:
+                log.info("Static sources changed, re-probing static fields")
+                _clear_static_probe_caches()
+            probes.extend(self._static_probes)
+            self._stamp = stamp
+
+        results: ProbeResults = self.collector.collect(probes)
+        values: dict[str, t.Any] = _detach_live_values(results.values)
+        unavailable: set[str] = (
+            self._unavailable - values.keys()
+        ) | results.unavailable
+
+        if (
+            self.info is not None
+            and unavailable == self._unavailable
+            and all(
+                path in self._values and self._values[path] == value
+                for path, value in values.items()
+            )
+        ):
+            return PlatformInfoDelta(changed={}, removed=())
+
+        self._values.update(values)
+        self._unavailable = unavailable
+        self.info = build_platform_info(
+            self._values,
+            unavailable=unavailable,
+            collection_stats=results.collection_stats,
+            fields=self.fields,
+        )
 
-                return f"<UNKNOWN_OS:'{self.system}'>"
+        current: dict[str, t.Any] = self.info.to_json_dict(fields=self.fields)
+        delta: PlatformInfoDelta = diff_platform_info(
+            self.previous, current, fields=self.fields
+        )
+        self.previous = current
+
+        return delta
+
+    def watch(
+        self, interval: float, stop: threading.Event | None = None
+    ) -> t.Iterator[PlatformInfoDelta]:
+        """Poll every `interval` seconds until `stop` is set, yielding only non-empty deltas.
+
+        Polls are scheduled on a fixed (monotonic) cadence, so slow polls do not
+        make the interval drift. Ticks missed by a poll that took longer than the
+        interval are skipped.
+        """
+        stop = stop or threading.Event()
+        next_poll: float = time.monotonic()
+
+        while not stop.is_set():
+            delta: PlatformInfoDelta = self.poll()
+            if delta.changed or delta.removed:
+                yield delta
+
+            next_poll += interval
+            now: float = time.monotonic()
+            if next_poll < now:
+                next_poll = now + interval - (now - next_poll) % interval
+
+            stop.wait(next_poll - now)
+
+
+####################
+# Resource metrics #
+####################
+
+## procfs files read by ResourceSampler
+PROC_MEMINFO: str = "/proc/meminfo"
+PROC_LOADAVG: str = "/proc/loadavg"
+PROC_STAT: str = "/proc/stat"
+
+## {/proc/meminfo key: MemoryInfo field}
+_MEMINFO_FIELDS: dict[bytes, str] = {
+    b"MemTotal": "total",
+    b"MemFree": "free",
+    b"MemAvailable": "available",
+    b"Buffers": "buffers",
+    b"Cached": "cached",
+    b"SwapTotal": "swap_total",
+    b"SwapFree": "swap_free",
+}
+
+
+class MemoryInfo(t.NamedTuple):
+    """Memory & swap usage from /proc/meminfo, in bytes."""
+
+    total: int
+    free: int
+    available: int
+    buffers: int
+    cached: int
+    swap_total: int
+    swap_free: int
 
-        return platform_extra
+    @property
+    def used(self) -> int:
+        return self.total - self.available
 
     @property
-    def ascii_art(self) -> str:
-        _ascii: str = get_os_ascii(os=self.system)
+    def swap_used(self) -> int:
+        return self.swap_total - self.swap_free
 
-        return _ascii
+    @property
+    def percent_used(self) -> float:
+        return 100.0 * self.used / self.total if self.total else 0.0
 
-    def display_info(self, simplified: bool = True):
-        if simplified:
-            msg: str = f"""[ Platform Information ]
-OS:
-    Type: {self.system}
-    Release: {self.release}
-    Version: {self.version}
-    Hostname: {self.uname.node}
-    Kernel release: {self.uname.release}
-CPU Architecture:
-    x86/x64: {self.processor}
-    CPU count: {self.cpu_count}
-Python:
-    Version: {self.python.version}
-    Executable location: {self.python.exec_prefix}
-    Default encoding: {self.python.default_encoding}
-    'PYTHONDONTWRITEBYTECODE' environment variable: {self.python.dont_write_bytecode}
-"""
+    def human_readable(self) -> dict[str, str]:
+        """Return each size (including `used` & `swap_used`) as a string, i.e. '1.20GB'."""
+        sizes: dict[str, int] = {
+            **self._asdict(),
+            "used": self.used,
+            "swap_used": self.swap_used,
+        }
 
-        else:
+        return {name: convert_bytes(size, as_str=True) for name, size in sizes.items()}
 
-            msg: str = f"""[ Platform Information ]
-OS:
-    Type: {self.system}
-    Release: {self.release}
-    Version: {self.version}
-    Platform: {self.platform}
-    Uname:
-        Node (hostname): {self.uname.node}
-        Kernel release: {self.uname.release}
-CPU Architecture:
-    x86/x64: {self.processor}
-    CPU count: {self.cpu_count}
-Python:
-    Implementation: {self.python.implementation}
-    Version: {self.python.version}
-    Executable location: {self.python.exec_prefix}
-    Base prefix: {self.python.base_prefix}
-    Build: {self.python.build}
-    Revision: {self.python.revision}
-    Compiler: {self.python.compiler}
-    Flags: {self.python.flags}
-    Default encoding: {self.python.default_encoding}
-    'PYTHONDONTWRITEBYTECODE' environment variable: {self.python.dont_write_bytecode}
 
-"""
+class LoadAverage(t.NamedTuple):
+    """System load averages & process counts from /proc/loadavg."""
 
-        print(msg)
+    load1: float
+    load5: float
+    load15: float
+    ## Runnable & total scheduling entities (processes/threads)
+    running: int
+    total: int
 
 
-def main(options: argparse.Namespace):
-    platform_info: PlatformInfo = get_platform_info()
+class CPUTimes(t.NamedTuple):
+    """Cumulative time spent by a CPU in each state, in clock ticks (a /proc/stat 'cpu' line)."""
+
+    user: int
+    nice: int
+    system: int
+    idle: int
+    iowait: int
+    irq: int
+    softirq: int
+    steal: int
+
+    @property
+    def total(self) -> int:
+        ## guest & guest_nice are already counted in user & nice
+        return sum(self)
+
+    @property
+    def busy(self) -> int:
+        return self.total - self.idle - self.iowait
+
+
+class CPUUtilization(t.NamedTuple):
+    """Percent of the time a CPU spent in each state between 2 samples."""
+
+    ## 'cpu' for all CPUs, or 'cpu0', 'cpu1', etc
+    cpu: str
+    busy: float
+    user: float
+    system: float
+    iowait: float
+    steal: float
+
+
+class ResourceSample(t.NamedTuple):
+    """1 sample of live resource usage, see `ResourceSampler`.
+
+    Values are `None` (or empty) when their source cannot be read, i.e. on platforms
+    without /proc. `cpu` is empty on the first sample, since utilization is the
+    change between 2 samples; `cpu[0]` is the total of all CPUs.
+    """
+
+    ## time.monotonic() when the sample was taken
+    timestamp: float
+    memory: MemoryInfo | None
+    load: LoadAverage | None
+    cpu: t.Tuple[CPUUtilization, ...]
+
 
+def parse_meminfo(data: bytes) -> MemoryInfo:
+    """Parse the contents of /proc/meminfo. Missing keys (i.e. on old kernels) are 0."""
+    values: dict[str, int] = dict.fromkeys(_MEMINFO_FIELDS.values(), 0)
+
+    for line in data.splitlines():
+        key, _, value = line.partition(b":")
+        name: str | None = _MEMINFO_FIELDS.get(key)
+        if name is not None:
+            ## i.e. b'  6147400 kB'
+            values[name] = int(value.split()[0]) * 1024
+
+    return MemoryInfo(**values)
+
+
+def parse_loadavg(data: bytes) -> LoadAverage:
+    """Parse the contents of /proc/loadavg, i.e. b'0.24 0.26 0.19 2/71 610'."""
+    load1, load5, load15, entities, *_ = data.split()
+    running, _, total = entities.partition(b"/")
+
+    return LoadAverage(
+        load1=float(load1),
+        load5=float(load5),
+        load15=float(load15),
+        running=int(running),
+        total=int(total),
+    )
+
+
+def parse_proc_stat_cpus(data: bytes) -> dict[str, CPUTimes]:
+    """Parse the 'cpu' lines of /proc/stat, keyed by CPU name ('cpu', 'cpu0', ...)."""
+    cpus: dict[str, CPUTimes] = {}
+
+    for line in data.splitlines():
+        if not line.startswith(b"cpu"):
+            break
+
+        name, *ticks = line.split()
+        ## Older kernels have fewer columns, pad the missing ones with 0
+        ticks = (ticks + [b"0"] * 8)[:8]
+        cpus[name.decode("ascii")] = CPUTimes(*map(int, ticks))
+
+    return cpus
+
+
+def _cpu_utilization(name: str, old: CPUTimes, new: CPUTimes) -> CPUUtilization:
+    elapsed: int = new.total - old.total
+    if elapsed <= 0:
+        return CPUUtilization(
+            cpu=name, busy=0.0, user=0.0, system=0.0, iowait=0.0, steal=0.0
+        )
+
+    scale: float = 100.0 / elapsed
+
+    return CPUUtilization(
+        cpu=name,
+        busy=(new.busy - old.busy) * scale,
+        user=((new.user + new.nice) - (old.user + old.nice)) * scale,
+        system=(
+            (new.system + new.irq + new.softirq) - (old.system + old.irq + old.softirq)
+        )
+        * scale,
+        iowait=(new.iowait - old.iowait) * scale,
+        steal=(new.steal - old.steal) * scale,
+    )
+
+
+class ResourceSampler(AbstractContextManager):
+    """Sample memory, load & per-CPU utilization from /proc, cheaply enough to run at 10Hz+.
+
+    Description:
+        The procfs files are opened once & re-read with `os.pread()` at offset 0,
+        which makes the kernel regenerate their contents, so each read is 1 syscall
+        without an open/seek/close. Read buffers grow to fit each file & are reused.
+        Only the leading 'cpu' lines of /proc/stat are read.
+
+        CPU utilization is the change in /proc/stat's counters since the previous
+        sample, so the first sample has no `cpu` values. Use as a context manager, or
+        call `close()`, to close the file descriptors.
+
+    Params:
+        meminfo (str): Path to /proc/meminfo.
+        loadavg (str): Path to /proc/loadavg.
+        stat (str): Path to /proc/stat.
+
+    """
+
+    def __init__(
+        self,
+        meminfo: str = PROC_MEMINFO,
+        loadavg: str = PROC_LOADAVG,
+        stat: str = PROC_STAT,
+    ):
+        self._fds: dict[str, int | None] = {
+            "meminfo": self._open(meminfo),
+            "loadavg": self._open(loadavg),
+            "stat": self._open(stat),
+        }
+        ## Bytes to read from each file, grown when a read fills the buffer
+        self._sizes: dict[str, int] = {"meminfo": 4096, "loadavg": 128, "stat": 1024}
+        self._cpu_times: dict[str, CPUTimes] = {}
+
+    @staticmethod
+    def _open(path: str) -> int | None:
+        try:
+            return os.open(path, os.O_RDONLY)
+        except OSError as exc:
+            log.debug(f"Unable to open '{path}' for resource sampling. Details: {exc}")
+            return None
+
+    def _read(self, name: str, until: bytes | None = None) -> bytes | None:
+        """Read a whole file, or up to the first line that starts with `until`."""
+        fd: int | None = self._fds[name]
+        if fd is None:
+            return None
+
+        while True:
+            size: int = self._sizes[name]
+            data: bytes = os.pread(fd, size, 0)
+
+            if len(data) < size or (until is not None and b"\n" + until in data):
+                return data
+
+            self._sizes[name] = size * 2
+
+    def sample_memory(self) -> MemoryInfo | None:
+        data: bytes | None = self._read("meminfo")
+        return None if data is None else parse_meminfo(data)
+
+    def sample_load(self) -> LoadAverage | None:
+        data: bytes | None = self._read("loadavg")
+        return None if data is None else parse_loadavg(data)
+
+    def sample_cpu(self) -> t.Tuple[CPUUtilization, ...]:
+        """Return the utilization of each CPU since the previous call."""
+        ## The 'intr' line follows the 'cpu' lines & can be many KB long
+        data: bytes | None = self._read("stat", until=b"intr")
+        if data is None:
+            return ()
+
+        cpu_times: dict[str, CPUTimes] = parse_proc_stat_cpus(data)
+        previous: dict[str, CPUTimes] = self._cpu_times
+        self._cpu_times = cpu_times
+
+        return tuple(
+            _cpu_utilization(name, previous[name], times)
+            for name, times in cpu_times.items()
+            ## CPUs that were hotplugged since the last sample have no delta yet
+            if name in previous
+        )
+
+    def sample(self) -> ResourceSample:
+        """Take a sample of memory, load & CPU utilization."""
+        return ResourceSample(
+            timestamp=time.monotonic(),
+            memory=self.sample_memory(),
+            load=self.sample_load(),
+            cpu=self.sample_cpu(),
+        )
+
+    def close(self) -> None:
+        for name, fd in self._fds.items():
+            if fd is not None:
+                os.close(fd)
+                self._fds[name] = None
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __del__(self):
+        ## Do not leak file descriptors when a sampler is not closed
+        with contextlib.suppress(Exception):
+            self.close()
+
+
+###############
+# Pool sizing #
+###############
+
+## Memory each worker process is assumed to need, see recommend_pool_sizes()
+DEFAULT_PROCESS_MEMORY: int = 128 * 1024 * 1024
+
+## Chunks handed to each worker over a CPU-bound map(), like multiprocessing.Pool.map()
+CHUNKS_PER_WORKER: int = 4
+
+
+class PoolSizeAdvice(t.NamedTuple):
+    """Suggested worker pool sizes for a platform, see `recommend_pool_sizes()`."""
+
+    ## Processes for CPU-bound work, i.e. ProcessPoolExecutor(max_workers=...)
+    cpu_bound_processes: int
+    ## Threads for CPU-bound work. 1 when the GIL is enabled, threads do not run Python code in parallel.
+    cpu_bound_threads: int
+    ## Threads for I/O-bound work, i.e. ThreadPoolExecutor(max_workers=...)
+    io_bound_threads: int
+    ## multiprocessing start method, i.e. multiprocessing.get_context(...)
+    start_method: str
+    effective_cpus: int
+    ## Hardware threads per physical core, 1 without SMT (or when unknown)
+    smt: int
+    gil_enabled: bool
+    available_memory: int | None
+    ## Why each value was picked, i.e. for logging at startup
+    notes: t.Tuple[str, ...] = ()
+
+    def cpu_bound_chunksize(self, items: int) -> int:
+        """Return the chunksize for a CPU-bound `map()` of `items` over the process pool."""
+        return max(1, -(-items // (self.cpu_bound_processes * CHUNKS_PER_WORKER)))
+
+    def io_bound_chunksize(self, items: int) -> int:
+        """Return the chunksize for an I/O-bound `map()`. Always 1: tasks wait, so small chunks keep every thread busy."""
+        return 1
+
+
+def _get_start_method(system: str | None) -> str:
+    match system:
+        case EnumSystemTypes.WINDOWS.value | EnumSystemTypes.MAC.value:
+            ## 'fork' is not available on Windows & unsafe with macOS system libraries
+            return "spawn"
+        case None:
+            return "spawn"
+        case _:
+            ## Unlike 'fork', safe when the parent has threads, & cheaper than 'spawn'
+            return "forkserver"
+
+
+def recommend_pool_sizes(
+    info: PlatformInfo | PlatformSnapshot | None = None,
+    memory: MemoryInfo | None = None,
+    process_memory: int = DEFAULT_PROCESS_MEMORY,
+) -> PoolSizeAdvice:
+    """Suggest worker pool sizes, a multiprocessing start method & chunk sizes for a platform.
+
+    Description:
+        - CPU-bound processes: the effective CPUs (see `CPULimits.effective`). With
+          SMT, CPUs limited by affinity/cpuset are counted as physical cores, since
+          siblings share 1 core's execution units. Limited to the processes that fit
+          in the available memory, at `process_memory` bytes each.
+        - CPU-bound threads: 1 when the GIL is enabled, otherwise the same as processes.
+        - I/O-bound threads: `min(32, effective CPUs + 4)`, `ThreadPoolExecutor`'s
+          default, without counting CPUs the process cannot use.
+        - Start method: 'forkserver' on Linux & other Unixes, 'spawn' on Windows & macOS.
+
+    Params:
+        info (PlatformInfo | PlatformSnapshot | None): Platform to advise for. Defaults to this host.
+        memory (MemoryInfo | None): Memory usage to size process pools with. Defaults to
+            sampling /proc/meminfo when `info` is `None`, otherwise memory is not considered.
+        process_memory (int): Bytes of memory each worker process is expected to use.
+
+    """
+    if info is None:
+        info = PlatformInfo(
+            fields=["system", "cpu_limits", "cpu", "python.gil_enabled"]
+        )
+        if memory is None:
+            with ResourceSampler() as sampler:
+                memory = sampler.sample_memory()
+
+    notes: list[str] = []
+
+    limits: CPULimits | None = info.cpu_limits
+    if limits is None:
+        limits = CPULimits(
+            logical=info.cpu_count,
+            affinity=None,
+            cpuset=None,
+            quota=None,
+            cgroup_version=None,
+        )
+    effective: int = limits.effective
+    notes.append(f"{effective} effective CPU(s) of {limits.logical} logical")
+
+    cpu: CPUInfo | CPUSnapshot | None = info.cpu
+    smt: int = 1
+    if cpu is not None and cpu.cores and cpu.threads and cpu.threads > cpu.cores:
+        smt = cpu.threads // cpu.cores
+
+    processes: int = effective
+    if smt > 1:
+        ## A quota limits CPU time, not cores, so only CPUs limited by count are paired up
+        cpus: int = min(
+            (
+                limit
+                for limit in (limits.logical, limits.affinity, limits.cpuset)
+                if limit is not None
+            ),
+            default=effective,
+        )
+        cores: int = max(cpus // smt, 1)
+        if cores < processes:
+            processes = cores
+            notes.append(f"{smt} SMT threads per core, using {cores} physical core(s)")
+
+    available_memory: int | None = None if memory is None else memory.available
+    if available_memory is not None and process_memory > 0:
+        fit: int = max(available_memory // process_memory, 1)
+        if fit < processes:
+            processes = fit
+            notes.append(
+                f"{convert_bytes(available_memory, as_str=True)} available fits {fit} process(es) of {convert_bytes(process_memory, as_str=True)}"
+            )
+
+    gil_enabled: bool = True
+    if info.python is not None and info.python.gil_enabled is not None:
+        gil_enabled = info.python.gil_enabled
+    if gil_enabled:
+        notes.append("GIL is enabled, use processes for CPU-bound work")
+
+    start_method: str = _get_start_method(info.system)
+
+    return PoolSizeAdvice(
+        cpu_bound_processes=processes,
+        cpu_bound_threads=1 if gil_enabled else processes,
+        io_bound_threads=min(32, effective + 4),
+        start_method=start_method,
+        effective_cpus=effective,
+        smt=smt,
+        gil_enabled=gil_enabled,
+        available_memory=available_memory,
+        notes=tuple(notes),
+    )
+
+
+def write_pool_size_advice(advice: PoolSizeAdvice, output_format: str) -> None:
+    """Write a PoolSizeAdvice to stdout."""
+    match output_format:
+        case "text":
+            print(
+                f"""[ Pool sizes ]
+CPU-bound:
+    Processes: {advice.cpu_bound_processes}
+    Threads: {advice.cpu_bound_threads}
+    Chunksize: items / {advice.cpu_bound_processes * CHUNKS_PER_WORKER} (rounded up)
+I/O-bound:
+    Threads: {advice.io_bound_threads}
+    Chunksize: 1
+Start method: {advice.start_method}
+Notes:"""
+            )
+            for note in advice.notes:
+                print(f"    - {note}")
+        case "json":
+            write_json(_json_value(advice), sys.stdout, indent=2)
+            sys.stdout.write("\n")
+        case "ndjson":
+            write_json(_json_value(advice), sys.stdout)
+            sys.stdout.write("\n")
+        case _:
+            raise ValueError(f"Unsupported output format: '{output_format}'")
+
+
+def print_fields(platform_info: PlatformInfo, fields: list[str]) -> None:
+    """Print the value of each dotted field path, 1 per line."""
+    for path in fields:
+        print(f"{path}: {get_field_value(platform_info, path)}")
+
+
+def write_platform_info(
+    platform_info: PlatformInfo,
+    output_format: str,
+    fields: list[str] | None = None,
+) -> None:
+    """Write a PlatformInfo object (or only some of its fields) to stdout as 'json' or 'ndjson'."""
+    match output_format:
+        case "json":
+            platform_info.to_json(sys.stdout, indent=2, fields=fields)
+            sys.stdout.write("\n")
+        case "ndjson":
+            write_ndjson([platform_info], sys.stdout, fields=fields)
+        case _:
+            raise ValueError(f"Unsupported output format: '{output_format}'")
+
+
+def write_platform_info_delta(
+    delta: PlatformInfoDelta, output_format: str, timestamp: float | None = None
+) -> None:
+    """Write a PlatformInfoDelta to stdout. 'text' prints 1 line per changed or removed path.
+
+    When `timestamp` (seconds since the epoch) is set, it is written with the delta
+    ('time' in JSON), i.e. for events in watch mode.
+    """
+    data: dict[str, t.Any] = _json_value(delta)
+    if timestamp is not None:
+        data = {"time": timestamp, **data}
+
+    match output_format:
+        case "text":
+            if timestamp is not None:
+                print(
+                    f"[ {time.strftime('%Y-%m-%dT%H:%M:%S%z', time.localtime(timestamp))} ]"
+                )
+            for path, value in delta.changed.items():
+                print(f"{path}: {value}")
+            for path in delta.removed:
+                print(f"{path}: <removed>")
+        case "json":
+            write_json(data, sys.stdout, indent=2)
+            sys.stdout.write("\n")
+        case "ndjson":
+            write_json(data, sys.stdout)
+            sys.stdout.write("\n")
+        case _:
+            raise ValueError(f"Unsupported output format: '{output_format}'")
+
+
+def read_snapshot_file(path: str) -> dict[str, t.Any]:
+    """Load a JSON snapshot written by `write_snapshot_file()` (or `--format json`).
+
+    A missing file is an empty snapshot, so the first delta contains every field.
+    """
+    import json
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data: t.Any = json.load(f)
+    except FileNotFoundError:
+        log.debug(f"Snapshot file '{path}' does not exist, comparing against nothing")
+        return {}
+
+    if not isinstance(data, dict):
+        raise ValueError(f"Snapshot file '{path}' does not contain a JSON object")
+
+    return data
+
+
+def write_snapshot_file(
+    platform_info: PlatformInfo, path: str, fields: list[str] | None = None
+) -> None:
+    """Write a PlatformInfo object (or only some of its fields) to a JSON file.
+
+    The file is replaced atomically, so a concurrent `read_snapshot_file()` never
+    reads a partial snapshot.
+    """
+    tmp_path: str = f"{path}.{os.getpid()}.tmp"
+
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            platform_info.to_json(f, fields=fields)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+
+def print_platform_info(
+    platform_info: PlatformInfo, options: argparse.Namespace
+) -> None:
+    """Print a PlatformInfo object as text, with more detail for each verbosity level."""
     if options.debug:
         print(platform_info.ascii_art)
         print()
@@ -758,10 +6202,107 @@ def main(options: argparse.Namespace):
 
             platform_info.display_info(simplified=False)
 
+    if options.profile:
+        print(platform_info.collection_stats.format_table())
+
+
+def run_watch(options: argparse.Namespace) -> None:
+    """Run watch mode: print a delta each time a field changes, until interrupted or SIGTERM."""
+    import signal
+
+    previous: dict[str, t.Any] | None = None
+    if options.delta_from:
+        try:
+            previous = read_snapshot_file(options.delta_from)
+        except ValueError as exc:
+            sys.exit(f"Invalid --delta-from: {exc}")
+
+    watcher: PlatformWatcher = PlatformWatcher(fields=options.fields, previous=previous)
+    stop: threading.Event = threading.Event()
+    ## Stop between polls on SIGTERM (i.e. from a service manager), like Ctrl+C
+    signal.signal(signal.SIGTERM, lambda signum, frame: stop.set())
+
+    try:
+        for delta in watcher.watch(options.watch, stop=stop):
+            write_platform_info_delta(delta, options.format, timestamp=time.time())
+            sys.stdout.flush()
+
+            if options.save_snapshot:
+                write_snapshot_file(
+                    watcher.info, options.save_snapshot, fields=options.fields
+                )
+    except KeyboardInterrupt:
+        pass
+
+
+def main(options: argparse.Namespace):
+    if options.fields:
+        try:
+            select_probes(options.fields)
+        except ValueError as exc:
+            sys.exit(f"Invalid --fields: {exc}")
+
+    if options.watch is not None:
+        run_watch(options)
+        return
+
+    if options.recommend_pools:
+        write_pool_size_advice(recommend_pool_sizes(), options.format)
+        return
+
+    if options.delta_from:
+        try:
+            previous: dict[str, t.Any] = read_snapshot_file(options.delta_from)
+        except ValueError as exc:
+            sys.exit(f"Invalid --delta-from: {exc}")
+
+        platform_info: PlatformInfo = get_platform_info(
+            fields=options.fields, show_spinner=False
+        )
+        write_platform_info_delta(
+            diff_platform_info(
+                previous,
+                platform_info.to_json_dict(fields=options.fields),
+                fields=options.fields,
+            ),
+            options.format,
+        )
+
+        if options.profile:
+            print(platform_info.collection_stats.format_table(), file=sys.stderr)
+
+    elif options.format != "text":
+        platform_info: PlatformInfo = get_platform_info(
+            fields=options.fields, show_spinner=False
+        )
+        ## Only writes the requested fields when --fields is set
+        write_platform_info(platform_info, options.format, fields=options.fields)
+
+        if options.profile:
+            ## Keep stdout parseable
+            print(platform_info.collection_stats.format_table(), file=sys.stderr)
+
+    elif options.fields:
+        platform_info: PlatformInfo = get_platform_info(fields=options.fields)
+        print_fields(platform_info, options.fields)
+
+        if options.profile:
+            print(platform_info.collection_stats.format_table())
+
+    else:
+        platform_info: PlatformInfo = get_platform_info()
+        print_platform_info(platform_info, options)
+
+    if options.save_snapshot:
+        write_snapshot_file(platform_info, options.save_snapshot, fields=options.fields)
+
 
 if __name__ == "__main__":
     options: argparse.Namespace = get_args()
 
     _set_logging_level(verbosity=options.verbosity, set_debug=options.debug)
 
+    if options.disk_cache:
+        enable_disk_cache()
+
     main(options=options)
@@ -26,3 +26,49 @@ def fake_windows_system() -> str:
 @fixture
 def fake_mac_system() -> str:
     return "Darwin"
+
+
+def _cpuinfo_block(processor: int, physical_id: int, core_id: int) -> str:
+    return f"""processor\t: {processor}
+vendor_id\t: GenuineIntel
+cpu family\t: 6
+model\t\t: 85
+model name\t: Intel(R) Xeon(R) Gold 6230 CPU @ 2.10GHz
+stepping\t: 7
+microcode\t: 0x5003604
+physical id\t: {physical_id}
+siblings\t: 4
+core id\t\t: {core_id}
+cpu cores\t: 2
+flags\t\t: fpu sse sse2 ssse3 sse4_1 sse4_2 popcnt avx avx2 bmi1 bmi2 fma movbe avx512f avx512bw avx512cd avx512dq avx512vl
+"""
+
+
+@fixture
+def cpuinfo_x86_2_sockets() -> str:
+    """/proc/cpuinfo for 2 sockets x 2 cores x 2 SMT threads."""
+    blocks: list[str] = []
+    processor: int = 0
+    for thread in range(2):
+        for physical_id in range(2):
+            for core_id in range(2):
+                blocks.append(_cpuinfo_block(processor, physical_id, core_id))
+                processor += 1
+
+    return "\n".join(blocks)
+
+
+@fixture
+def cpuinfo_arm64() -> str:
+    """/proc/cpuinfo for a 2 core ARM64 CPU (no 'model name')."""
+    block: str = """processor\t: {processor}
+BogoMIPS\t: 50.00
+Features\t: fp asimd evtstrm aes pmull sha1 sha2 crc32 atomics fphp asimdhp cpuid
+CPU implementer\t: 0x41
+CPU architecture: 8
+CPU variant\t: 0x3
+CPU part\t: 0xd0c
+CPU revision\t: 1
+"""
+
+    return "\n".join(block.format(processor=processor) for processor in range(2))
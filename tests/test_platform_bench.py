@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import logging
+import os
+import sys
+
+from pytest import mark
+
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "benchmarks"))
+)
+
+import bench_platform_info
+
+log = logging.getLogger(__name__)
+
+
+@mark.bench
+def test_bench_summarize():
+    summary: dict = bench_platform_info.summarize([1_000_000 * n for n in range(1, 21)])
+
+    assert summary["median_ms"] == 10.5, ValueError(
+        f"Unexpected median: {summary['median_ms']}"
+    )
+    assert 19 <= summary["p95_ms"] <= 20, ValueError(
+        f"Unexpected p95: {summary['p95_ms']}"
+    )
+    assert summary["samples"] == 20, ValueError("Sample count should be recorded")
+
+
+@mark.bench
+def test_bench_compare_baseline():
+    baseline: dict = {"results": {"import": {"median_ms": 10.0}}}
+    report: dict = {
+        "results": {
+            "import": {"median_ms": 15.0},
+            "convert_bytes": {"median_ms": 0.001},
+        }
+    }
+
+    regressions: list[str] = bench_platform_info.compare(
+        report, baseline, threshold=0.2
+    )
+
+    assert regressions == ["import"], ValueError(
+        f"Only 'import' should have regressed, got: {regressions}"
+    )
+    assert report["results"]["import"]["ratio"] == 1.5, ValueError(
+        "Comparison ratio should be recorded on the report"
+    )
+    assert "ratio" not in report["results"]["convert_bytes"], ValueError(
+        "Cases missing from the baseline should not be compared"
+    )
+
+
+@mark.bench
+def test_bench_run_child_variables(tmp_path):
+    samples: dict = bench_platform_info.run_child(
+        '_emit({"probe": [len(PROBE_PATH)]})',
+        bench_platform_info._child_env(str(tmp_path)),
+        warm_calls=1,
+        variables={"PROBE_PATH": "uname"},
+    )
+
+    assert samples == {"probe": [5]}, ValueError(
+        f"Variables should be defined in the child: {samples}"
+    )
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import logging
+import os
+import sys
+
+from pytest import mark, raises
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import platform_info
+
+log = logging.getLogger(__name__)
+
+
+@mark.platform
+def test_binary_round_trip():
+    plat: platform_info.PlatformInfo = platform_info.PlatformInfo()
+    data: bytes = plat.to_binary()
+
+    assert data.startswith(platform_info.BINARY_MAGIC), ValueError(
+        "Binary data should start with the magic bytes"
+    )
+    assert len(data) < len(plat.to_json()), ValueError(
+        f"Binary data ({len(data)} bytes) should be smaller than JSON"
+    )
+
+    loaded: platform_info.PlatformInfo = platform_info.PlatformInfo.from_binary(data)
+    assert (
+        loaded.to_json_dict()
+        == platform_info.PlatformInfo.from_json(plat.to_json()).to_json_dict()
+    ), ValueError("Binary round trip should match the JSON round trip")
+
+    log.debug(f"Binary: {len(data)} bytes, JSON: {len(plat.to_json())} bytes")
+
+
+@mark.platform
+def test_binary_values():
+    data: dict = {
+        "text": "Linux",
+        "nul": "a\x00b",
+        "ints": [0, -1, 2**70, -(2**70)],
+        "float": 1.5,
+        "flags": {"debug": False, "optimize": True, "none": None},
+        "strings": [f"s{i}" for i in range(300)],
+    }
+
+    assert platform_info.decode_binary(platform_info.encode_binary(data)).as_dict() == (
+        data
+    ), ValueError("Decoded values should match the encoded values")
+
+
+@mark.platform
+def test_binary_snapshot_is_lazy():
+    snapshot: platform_info.BinarySnapshot = platform_info.decode_binary(
+        platform_info.PlatformInfo().to_binary(fields=["system", "python.version"])
+    )
+
+    assert snapshot.keys() == ["system", "python"], ValueError(
+        f"Unexpected fields: {snapshot.keys()}"
+    )
+    assert not snapshot._values, ValueError("No field should be decoded up front")
+    assert snapshot.python["version"] == platform_info.PlatformPython().version
+    assert set(snapshot._values) == {"python"}, ValueError(
+        "Only the accessed field should be decoded"
+    )
+
+    with raises(AttributeError):
+        snapshot.not_a_field
+
+
+@mark.platform
+def test_binary_rejects_bad_data():
+    data: bytearray = bytearray(platform_info.encode_binary({"system": "Linux"}))
+
+    with raises(ValueError):
+        platform_info.decode_binary(b"JSON" + bytes(data[4:]))
+
+    data[4] = platform_info.BINARY_FORMAT_VERSION + 1
+    with raises(ValueError):
+        platform_info.decode_binary(data)
+
+    with raises(ValueError):
+        platform_info.decode_binary(b"PI")
@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+from dataclasses import FrozenInstanceError
+import json
+import logging
+import os
+import platform
+import sys
+
+from pytest import MonkeyPatch, mark, raises
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import platform_info
+
+log = logging.getLogger(__name__)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now: float = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@mark.platform
+def test_cached_platform_info_is_shared():
+    platform_info.invalidate_platform_info_cache()
+
+    first: platform_info.PlatformInfo = platform_info.get_cached_platform_info()
+    second: platform_info.PlatformInfo = platform_info.get_cached_platform_info()
+
+    assert first is second, ValueError("Cached snapshot should be shared between calls")
+    assert isinstance(first, platform_info.PlatformInfo), TypeError(
+        f"Invalid type for cached snapshot: ({type(first)})"
+    )
+
+    platform_info.invalidate_platform_info_cache()
+
+    assert platform_info.get_cached_platform_info() is not first, ValueError(
+        "invalidate_platform_info_cache() should discard the shared snapshot"
+    )
+
+
+@mark.platform
+def test_cached_platform_info_is_read_only():
+    snapshot: platform_info.PlatformInfo = platform_info.get_cached_platform_info()
+
+    with raises(FrozenInstanceError):
+        snapshot.system = "Force test failure"
+
+    with raises(FrozenInstanceError):
+        snapshot.python.version = "Force test failure"
+
+    assert isinstance(snapshot.python.path, tuple), TypeError(
+        "Cached snapshot should not reference the live sys.path list"
+    )
+    assert "_read_only" not in snapshot.as_dict(), ValueError(
+        "as_dict() should not include private attributes"
+    )
+
+
+@mark.platform
+def test_cached_platform_specific_info_is_read_only(detected_system: str):
+    platform_info.invalidate_platform_info_cache()
+    snapshot: platform_info.PlatformInfo = platform_info.get_cached_platform_info()
+    platform_specific = snapshot.platform_specific_info
+
+    if not isinstance(platform_specific, platform_info.PlatformSpecificInfo):
+        log.warning(f"[{detected_system}] No platform-specific info.")
+        return
+
+    with raises(FrozenInstanceError):
+        platform_specific.os = "Force test failure"
+
+    if isinstance(platform_specific, platform_info.PlatformUnixInfoBase):
+        with raises(FrozenInstanceError):
+            platform_specific.libc_ver = ("Force test failure", "")
+
+    if isinstance(platform_specific, platform_info.PlatformLinuxInfo) and (
+        platform_specific.os_release is not None
+    ):
+        with raises(TypeError):
+            platform_specific.os_release["NAME"] = "Force test failure"
+
+        assert platform_info.PlatformInfo.from_json(
+            snapshot.to_json()
+        ).platform_specific_info.os_release == dict(
+            platform_specific.os_release
+        ), ValueError(
+            "A read-only os_release should still serialize to JSON"
+        )
+
+
+@mark.platform
+def test_cache_ttl_per_field_class():
+    clock = FakeClock()
+    cache = platform_info.PlatformInfoCache(
+        static_ttl=None, volatile_ttl=10.0, clock=clock
+    )
+
+    first: platform_info.PlatformInfo = cache.get()
+
+    clock.now = 5.0
+    assert cache.get() is first, ValueError("Snapshot should not expire before its TTL")
+
+    clock.now = 11.0
+    second: platform_info.PlatformInfo = cache.get()
+
+    assert second is not first, ValueError("Volatile fields should have expired")
+    ## Static values are reused, not re-probed
+    assert second.uname is first.uname, ValueError("Static fields should not expire")
+    assert second.python.build is first.python.build, ValueError(
+        "Static Python fields should not expire"
+    )
+
+    cache.invalidate(field_class=platform_info.EnumFieldClass.STATIC)
+    assert cache.get().uname is not first.uname, ValueError(
+        "Invalidating static fields should re-probe them"
+    )
+
+
+@mark.platform
+def test_cache_static_ttl_reprobes(monkeypatch: MonkeyPatch):
+    clock = FakeClock()
+    cache = platform_info.PlatformInfoCache(
+        static_ttl=10.0, volatile_ttl=None, clock=clock
+    )
+    first: platform_info.PlatformInfo = cache.get()
+
+    ## The static probes' memoized values are stale once the TTL expires
+    monkeypatch.setattr(
+        platform_info, "_static_architecture", lambda: ("32bit", "FAKE")
+    )
+    try:
+        clock.now = 5.0
+        assert cache.get().arch == first.arch, ValueError(
+            "Static fields should not be re-probed before their TTL"
+        )
+
+        clock.now = 11.0
+        assert cache.get().arch == ("32bit", "FAKE"), ValueError(
+            "Expired static fields should be re-probed, not read from the probe memos"
+        )
+    finally:
+        monkeypatch.undo()
+        platform_info._clear_static_probe_caches()
+
+
+@mark.platform
+def test_cache_marks_failed_probes_unavailable(monkeypatch: MonkeyPatch):
+    def _failing_probe() -> str:
+        raise OSError("Force test failure")
+
+    probes: list[platform_info.Probe] = [
+        probe._replace(func=_failing_probe) if probe.path == "release" else probe
+        for probe in platform_info.get_probes()
+    ]
+    monkeypatch.setattr(platform_info, "get_probes", lambda: probes)
+
+    snapshot: platform_info.PlatformInfo = platform_info.PlatformInfoCache().get()
+
+    assert snapshot.release is None, ValueError(
+        f"A failed probe should leave its field as None, got: {snapshot.release}"
+    )
+    assert snapshot.unavailable_fields == {"release"}, ValueError(
+        f"Only the failed probe should be unavailable: {snapshot.unavailable_fields}"
+    )
+    assert snapshot.system == platform.system(), ValueError(
+        "Other fields should still be collected"
+    )
+
+
+@mark.platform
+def test_disk_cache_round_trip(tmp_path):
+    cache = platform_info.InterpreterDiskCache(cache_dir=str(tmp_path))
+
+    assert cache.get("arch") is None, ValueError("New cache should be empty")
+
+    cache.set("arch", ("64bit", "ELF"))
+
+    ## A new instance (i.e. a new process) reads the value back from disk
+    reloaded = platform_info.InterpreterDiskCache(cache_dir=str(tmp_path))
+    assert reloaded.key == cache.key, ValueError("Cache key should be stable")
+    assert reloaded.get("arch") == ["64bit", "ELF"], ValueError(
+        f"Unexpected cached value: {reloaded.get('arch')}"
+    )
+
+    cache.clear()
+    assert not os.path.exists(cache.path), ValueError("clear() should delete the file")
+
+
+@mark.platform
+def test_disk_cache_key_changes_with_executable(tmp_path):
+    fake_executable = tmp_path / "python"
+    fake_executable.write_bytes(b"\x7fELF")
+
+    cache = platform_info.InterpreterDiskCache(
+        cache_dir=str(tmp_path), executable=str(fake_executable)
+    )
+    key: str = cache.key
+
+    fake_executable.write_bytes(b"\x7fELF rebuilt")
+
+    changed = platform_info.InterpreterDiskCache(
+        cache_dir=str(tmp_path), executable=str(fake_executable)
+    )
+    assert changed.key != key, ValueError(
+        "Cache key should change when the interpreter binary changes"
+    )
+
+
+@mark.platform
+def test_disk_cache_loads_static_probes(tmp_path):
+    cache = platform_info.enable_disk_cache(cache_dir=str(tmp_path))
+    platform_info._architecture.cache_clear()
+
+    try:
+        cache.set("arch", ("99bit", "FAKE"))
+
+        assert platform_info.get_architecture() == ("99bit", "FAKE"), ValueError(
+            "get_architecture() should load its value from the disk cache"
+        )
+    finally:
+        platform_info.disable_disk_cache()
+        platform_info._architecture.cache_clear()
+
+
+@mark.platform
+def test_disk_cache_ignores_other_schema_versions(tmp_path):
+    cache = platform_info.InterpreterDiskCache(cache_dir=str(tmp_path))
+    ## A 'libc' entry written before LibcVersion had a 'source'
+    with open(cache.path, "w", encoding="utf-8") as f:
+        json.dump({"libc": ["glibc", "2.35"]}, f)
+
+    assert (
+        platform_info.InterpreterDiskCache(cache_dir=str(tmp_path)).get("libc") is None
+    ), ValueError("Entries from another schema version should be ignored")
+
+
+@mark.platform
+def test_disk_cache_skips_quick_libc_sources(tmp_path):
+    if platform_info._quick_libc_version(sys.executable) is None:
+        log.warning("No quick libc source on this host, the binary scan is cached.")
+        return
+
+    cache = platform_info.enable_disk_cache(cache_dir=str(tmp_path))
+    platform_info._libc_ver.cache_clear()
+
+    try:
+        cache.set("libc", ("fakelibc", "0.1", "binary-scan"))
+        libc = platform_info._libc_ver()
+
+        assert libc.lib != "fakelibc", ValueError(
+            f"A {libc.source} answer should not be read from the disk cache"
+        )
+    finally:
+        platform_info.disable_disk_cache()
+        platform_info._libc_ver.cache_clear()
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import logging
+import os
+import sys
+
+from pytest import mark
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import platform_info
+
+log = logging.getLogger(__name__)
+
+
+@mark.platform
+def test_parse_cpuinfo_x86(cpuinfo_x86_2_sockets: str):
+    cpu_info = platform_info.parse_cpuinfo(cpuinfo_x86_2_sockets)
+
+    assert (
+        cpu_info.model_name == "Intel(R) Xeon(R) Gold 6230 CPU @ 2.10GHz"
+    ), ValueError(f"Unexpected model name: {cpu_info.model_name}")
+    assert cpu_info.vendor == "GenuineIntel", ValueError(
+        f"Unexpected vendor: {cpu_info.vendor}"
+    )
+    assert (cpu_info.family, cpu_info.model, cpu_info.stepping) == (
+        6,
+        85,
+        7,
+    ), ValueError(f"Unexpected family/model/stepping: {cpu_info}")
+    assert cpu_info.microcode == "0x5003604", ValueError(
+        f"Unexpected microcode: {cpu_info.microcode}"
+    )
+    assert (cpu_info.sockets, cpu_info.cores, cpu_info.threads) == (
+        2,
+        4,
+        8,
+    ), ValueError(f"Unexpected topology: {cpu_info}")
+
+
+@mark.platform
+def test_parse_cpuinfo_arm64(cpuinfo_arm64: str):
+    cpu_info = platform_info.parse_cpuinfo(cpuinfo_arm64)
+
+    assert cpu_info.model_name is None, ValueError(
+        f"ARM64 cpuinfo has no model name, got: {cpu_info.model_name}"
+    )
+    assert cpu_info.vendor == "0x41", ValueError(
+        f"Unexpected vendor: {cpu_info.vendor}"
+    )
+    assert cpu_info.threads == 2, ValueError(f"Unexpected thread count: {cpu_info}")
+
+
+@mark.platform
+def test_get_processor(detected_system: str):
+    processor: str = platform_info.get_processor()
+
+    assert isinstance(processor, str), TypeError(
+        f"'processor' should be a str, got type: ({type(processor)})"
+    )
+
+    if detected_system == "Linux":
+        cpu_info = platform_info.get_cpu_info()
+
+        assert cpu_info is not None, ValueError("/proc/cpuinfo should be readable")
+        assert processor in (
+            cpu_info.model_name,
+            platform_info._platform.machine(),
+        ), ValueError(f"Processor '{processor}' should come from /proc/cpuinfo")
+
+    log.debug(f"Processor: {processor}")
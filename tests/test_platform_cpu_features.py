@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import logging
+import os
+import struct
+import sys
+
+from pytest import mark, raises
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import platform_info
+
+log = logging.getLogger(__name__)
+
+## Flags of an x86-64-v3 CPU (Haswell), without any AVX-512 flags
+HASWELL_FLAGS: str = (
+    "fpu vme de pse tsc msr pae mce cx8 apic sep mtrr pge mca cmov pat pse36 clflush "
+    "mmx fxsr sse sse2 ss ht syscall nx pdpe1gb rdtscp lm constant_tsc pni pclmulqdq "
+    "ssse3 fma cx16 pcid sse4_1 sse4_2 x2apic movbe popcnt aes xsave avx f16c rdrand "
+    "lahf_lm abm bmi1 avx2 bmi2 erms"
+)
+
+
+@mark.platform
+def test_parse_cpuinfo_features_x86():
+    cpuinfo: str = (
+        "processor\t: 0\n"
+        "vendor_id\t: GenuineIntel\n"
+        f"flags\t\t: {HASWELL_FLAGS}\n"
+        "\n"
+        "processor\t: 1\n"
+        "flags\t\t: fpu\n"
+    )
+
+    features = platform_info.parse_cpuinfo_features(cpuinfo)
+
+    assert features is not None and features.source == "cpuinfo", ValueError(
+        f"Unable to parse CPU features: {features}"
+    )
+    assert features.has_feature("avx2") and features.has_feature("SSE4.2"), ValueError(
+        f"Missing features: {features.names}"
+    )
+    assert not features.has_feature("avx-512"), ValueError("Haswell has no AVX-512")
+    assert features.x86_64_level == 3, ValueError(
+        f"Unexpected x86-64 level: {features.x86_64_level}"
+    )
+    assert features.has_mask(
+        platform_info.cpu_feature_mask("avx2", "fma", "bmi2")
+    ), ValueError("has_mask() should match when every feature is set")
+    assert not features.has_mask(
+        platform_info.cpu_feature_mask("avx2", "avx512f")
+    ), ValueError("has_mask() should not match when a feature is missing")
+    assert "ht" not in features.names and "avx2" in features.names, ValueError(
+        f"Only known features should be kept: {features.names}"
+    )
+
+
+@mark.platform
+def test_x86_64_levels():
+    v1 = platform_info.CPUFeatures.from_names(
+        "fpu cx8 cmov mmx fxsr sse sse2 syscall lm".split(), source="cpuinfo"
+    )
+    v2 = platform_info.CPUFeatures.from_names(
+        v1.names + ("cx16", "lahf_lm", "popcnt", "pni", "sse4_1", "sse4_2", "ssse3"),
+        source="cpuinfo",
+    )
+    v4 = platform_info.CPUFeatures.from_names(
+        HASWELL_FLAGS.split()
+        + ["avx512f", "avx512bw", "avx512cd", "avx512dq", "avx512vl"],
+        source="cpuinfo",
+    )
+    ## AVX-512 without the v3 features does not make a v4 CPU
+    v2_avx512 = platform_info.CPUFeatures.from_names(
+        v2.names + ("avx512f", "avx512bw", "avx512cd", "avx512dq", "avx512vl"),
+        source="cpuinfo",
+    )
+
+    levels = [features.x86_64_level for features in (v1, v2, v4, v2_avx512)]
+    assert levels == [1, 2, 4, 2], ValueError(f"Unexpected x86-64 levels: {levels}")
+
+
+@mark.platform
+def test_aarch64_features():
+    cpuinfo: str = (
+        "processor\t: 0\n"
+        "BogoMIPS\t: 50.00\n"
+        "Features\t: fp asimd evtstrm aes pmull sha1 sha2 crc32 atomics cpuid\n"
+    )
+    from_cpuinfo = platform_info.parse_cpuinfo_features(cpuinfo)
+
+    ## (AT_HWCAP, value), (AT_HWCAP2, value), (AT_NULL, 0) as native unsigned longs
+    hwcap: int = 0b1001_1111_1111  # fp ... atomics (bits 0-8), cpuid (11)
+    auxv: bytes = struct.pack("@6L", 6, 4096, 16, hwcap, 26, 0b10) + struct.pack(
+        "@2L", 0, 0
+    )
+    assert platform_info.parse_auxv_hwcaps(auxv) == (hwcap, 0b10), ValueError(
+        "Unable to parse the auxiliary vector"
+    )
+    from_auxv = platform_info.aarch64_features_from_hwcaps(hwcap, 0b10)
+
+    assert (
+        from_cpuinfo is not None
+        and from_cpuinfo.bits | platform_info.cpu_feature_mask("sve2") == from_auxv.bits
+    ), ValueError(f"HWCAPs {from_auxv.names} do not match /proc/cpuinfo {from_cpuinfo}")
+    assert from_auxv.has_feature("neon") and from_auxv.has_feature("sha"), ValueError(
+        "Aliases should match 64-bit ARM feature names"
+    )
+    assert from_auxv.x86_64_level is None, ValueError("ARM CPUs have no x86-64 level")
+
+
+@mark.platform
+def test_cpu_feature_mask_aliases():
+    x86 = platform_info.CPUFeatures.from_names(
+        HASWELL_FLAGS.split() + ["sha_ni"], source="cpuinfo"
+    )
+    aarch64 = platform_info.CPUFeatures.from_names(
+        "fp asimd aes pmull sha1 sha2 crc32".split(), source="cpuinfo"
+    )
+
+    assert x86.has_mask(
+        platform_info.cpu_feature_mask("sha", "SSE4.2", "avx2", machine="x86_64")
+    ), ValueError("Aliases in a mask should resolve to x86 features")
+    assert aarch64.has_mask(
+        platform_info.cpu_feature_mask("sha", "neon", "aes", machine="aarch64")
+    ), ValueError("Aliases in a mask should resolve to 64-bit ARM features")
+    assert not x86.has_mask(
+        platform_info.cpu_feature_mask("neon", machine="x86_64")
+    ), ValueError("An alias with no feature on x86 should never match")
+    assert not x86.has_feature("neon") and aarch64.has_feature("NEON"), ValueError(
+        "has_feature() should match an alias on any architecture"
+    )
+
+
+@mark.platform
+def test_cpu_feature_mask_unknown():
+    with raises(ValueError):
+        platform_info.cpu_feature_mask("not_a_feature")
+
+
+@mark.platform
+def test_get_cpu_features(detected_system: str):
+    features = platform_info.get_cpu_features()
+
+    if detected_system != "Linux" or features is None:
+        log.warning(f"[{detected_system}] CPU features are not available.")
+        return
+
+    plat = platform_info.build_platform_info({"cpu_features": features})
+    loaded = platform_info.PlatformInfo.from_json(plat.to_json(fields=["cpu_features"]))
+
+    assert loaded.cpu_features == features, ValueError(
+        f"CPU features did not survive a JSON round trip: {loaded.cpu_features}"
+    )
+    if os.uname().machine == "x86_64":
+        assert features.x86_64_level, ValueError(
+            f"An x86_64 host should be at least x86-64-v1: {features.names}"
+        )
+
+    log.debug(
+        f"[{detected_system}] CPU features (x86-64-v{features.x86_64_level}): {features.names}"
+    )
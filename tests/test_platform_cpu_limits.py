@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import logging
+import os
+from pathlib import Path
+import sys
+
+from pytest import mark
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import platform_info
+
+log = logging.getLogger(__name__)
+
+MOUNTINFO_V2: str = """24 1 0:22 / / rw,relatime - overlay overlay rw
+30 24 0:26 / /sys/fs/cgroup rw,nosuid - cgroup2 cgroup2 rw,nsdelegate
+"""
+
+MOUNTINFO_V1: str = """32 24 0:28 / /sys/fs/cgroup rw,relatime - tmpfs tmpfs rw,mode=755
+33 32 0:29 / /sys/fs/cgroup/cpu,cpuacct rw,relatime - cgroup cgroup rw,cpu,cpuacct
+35 32 0:31 / /sys/fs/cgroup/cpuset rw,relatime - cgroup cgroup rw,cpuset
+42 32 0:38 / /sys/fs/cgroup/unified rw,relatime - cgroup2 cgroup2 rw
+"""
+
+
+@mark.platform
+def test_parse_cgroup_cpu_dirs_v2():
+    dirs = platform_info.parse_cgroup_cpu_dirs("0::/kubepods/pod1/abc\n", MOUNTINFO_V2)
+
+    assert dirs == (
+        2,
+        "/sys/fs/cgroup/kubepods/pod1/abc",
+        "/sys/fs/cgroup/kubepods/pod1/abc",
+    ), ValueError(f"Unexpected cgroup v2 directories: {dirs}")
+
+
+@mark.platform
+def test_parse_cgroup_cpu_dirs_v1_container():
+    ## Without a cgroup namespace, /proc/self/cgroup lists host paths. Here the cpu
+    #  hierarchy is mounted from the container's cgroup, & cpuset from the host's root.
+    mountinfo: str = MOUNTINFO_V1.replace(
+        " / /sys/fs/cgroup/cpu,cpuacct", " /docker/abc /sys/fs/cgroup/cpu,cpuacct"
+    )
+    dirs = platform_info.parse_cgroup_cpu_dirs(
+        "4:cpu,cpuacct:/docker/abc\n3:cpuset:/docker/abc\n0::/\n", mountinfo
+    )
+
+    assert dirs == (
+        1,
+        "/sys/fs/cgroup/cpu,cpuacct",
+        "/sys/fs/cgroup/cpuset/docker/abc",
+    ), ValueError(f"Unexpected cgroup v1 directories: {dirs}")
+
+    assert platform_info.parse_cgroup_cpu_dirs("", "") is None, ValueError(
+        "No cgroup mounts should return None"
+    )
+
+
+@mark.platform
+def test_read_cgroup_limits(tmp_path: Path):
+    (tmp_path / "cpu.max").write_text("150000 100000\n")
+    (tmp_path / "cpuset.cpus.effective").write_text("0-3,8,10-11\n")
+    dirs = (2, str(tmp_path), str(tmp_path))
+
+    assert platform_info.read_cgroup_cpu_quota(dirs) == 1.5, ValueError(
+        "Unexpected cgroup v2 quota"
+    )
+    assert platform_info.read_cgroup_cpuset(dirs) == 7, ValueError(
+        "Unexpected cgroup v2 cpuset"
+    )
+
+    (tmp_path / "cpu.max").write_text("max 100000\n")
+    assert platform_info.read_cgroup_cpu_quota(dirs) is None, ValueError(
+        "An unlimited quota should be None"
+    )
+
+    (tmp_path / "cpu.cfs_quota_us").write_text("-1\n")
+    (tmp_path / "cpu.cfs_period_us").write_text("100000\n")
+    assert (
+        platform_info.read_cgroup_cpu_quota((1, str(tmp_path), None)) is None
+    ), ValueError("An unlimited cgroup v1 quota should be None")
+
+
+@mark.platform
+def test_cpu_limits_effective():
+    limits = platform_info.CPULimits(
+        logical=64, affinity=16, cpuset=8, quota=2.5, cgroup_version=2
+    )
+    assert limits.effective == 2, ValueError(
+        f"The quota should limit the effective CPU count, got: {limits.effective}"
+    )
+
+    unlimited = platform_info.CPULimits(
+        logical=4, affinity=None, cpuset=None, quota=0.5, cgroup_version=None
+    )
+    assert unlimited.effective == 1, ValueError(
+        "The effective CPU count should be at least 1"
+    )
+
+
+@mark.platform
+def test_get_cpu_limits(detected_system: str):
+    limits = platform_info.get_cpu_limits()
+
+    assert limits.logical == os.cpu_count(), ValueError(
+        f"Unexpected logical CPU count: {limits.logical}"
+    )
+    assert 1 <= limits.effective <= limits.logical, ValueError(
+        f"Unexpected effective CPU count: {limits.effective}"
+    )
+    if hasattr(os, "sched_getaffinity"):
+        assert limits.affinity == len(os.sched_getaffinity(0)), ValueError(
+            f"Unexpected affinity CPU count: {limits.affinity}"
+        )
+
+    log.debug(f"[{detected_system}] CPU limits: {limits}")
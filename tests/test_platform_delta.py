@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import copy
+import logging
+import os
+from pathlib import Path
+import sys
+
+from pytest import mark
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import platform_info
+
+log = logging.getLogger(__name__)
+
+
+@mark.platform
+def test_diff_and_apply_round_trip():
+    old: dict = platform_info.PlatformInfo().to_json_dict()
+    new: dict = copy.deepcopy(old)
+    new["cpu_count"] = old["cpu_count"] + 1
+    del new["uname"]["node"]
+    new["python"]["modules"].pop()
+    new["python"]["modules"][0]["version"] = "9.9"
+
+    delta: platform_info.PlatformInfoDelta = platform_info.diff_platform_info(old, new)
+
+    assert delta.changed["cpu_count"] == new["cpu_count"], ValueError(
+        f"Changed field was not in the delta: {delta}"
+    )
+    assert "uname.node" in delta.removed, ValueError(
+        f"Removed field was not in the delta: {delta.removed}"
+    )
+    assert len(delta.paths()) == 4, ValueError(
+        f"Module records should be diffed 1 by 1: {delta.paths()}"
+    )
+    assert platform_info.apply_platform_info_delta(old, delta) == new, ValueError(
+        "Applying the delta to the old dict should rebuild the new dict"
+    )
+    assert old["uname"]["node"] is not None, ValueError(
+        "Applying a delta should not change the base"
+    )
+
+
+@mark.platform
+def test_diff_unchanged_and_fields():
+    plat: platform_info.PlatformInfo = platform_info.PlatformInfo()
+    data: dict = plat.to_json_dict()
+
+    assert platform_info.diff_platform_info(plat, data).paths() == (), ValueError(
+        "An unchanged object should have an empty delta"
+    )
+
+    delta = platform_info.diff_platform_info({}, data, fields=["uname"])
+    assert delta.paths() and all(
+        path.startswith("uname.") for path in delta.paths()
+    ), ValueError(f"Only the requested fields should be diffed: {delta.paths()}")
+
+    rebuilt = platform_info.apply_platform_info_delta(
+        plat, platform_info.diff_platform_info(plat, {**data, "system": "Plan9"})
+    )
+    assert isinstance(rebuilt, platform_info.PlatformInfo), TypeError(
+        f"Applying a delta to a PlatformInfo should return one, got: {type(rebuilt)}"
+    )
+    assert rebuilt.system == "Plan9", ValueError("Delta was not applied")
+
+
+@mark.platform
+def test_snapshot_file(tmp_path: Path):
+    snapshot: Path = tmp_path / "snapshot.json"
+
+    assert platform_info.read_snapshot_file(str(snapshot)) == {}, ValueError(
+        "A missing snapshot file should be an empty snapshot"
+    )
+
+    plat: platform_info.PlatformInfo = platform_info.PlatformInfo(fields=["system"])
+    platform_info.write_snapshot_file(plat, str(snapshot), fields=["system"])
+
+    assert platform_info.read_snapshot_file(str(snapshot)) == {
+        "system": plat.system
+    }, ValueError("Snapshot file does not match the collected fields")
+    assert list(tmp_path.iterdir()) == [snapshot], ValueError(
+        "Temporary files should be replaced, not left behind"
+    )
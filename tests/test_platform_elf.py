@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import logging
+import os
+from pathlib import Path
+import platform
+import struct
+import sys
+
+from pytest import mark
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import platform_info
+
+log = logging.getLogger(__name__)
+
+
+def _write_elf_prefix(path: Path, ei_class: int, ei_data: int, machine: int) -> None:
+    """Write a minimal ELF identification + e_type/e_machine header."""
+    fmt: str = "<HH" if ei_data == 1 else ">HH"
+    ident: bytes = b"\x7fELF" + bytes([ei_class, ei_data, 1]) + bytes(9)
+    path.write_bytes(ident + struct.pack(fmt, 2, machine) + bytes(44))
+
+
+@mark.platform
+def test_read_elf_header_matches_platform_architecture():
+    elf_header = platform_info.read_elf_header(sys.executable)
+
+    if elf_header is None:
+        log.warning(f"Python executable '{sys.executable}' is not an ELF binary.")
+        return
+
+    assert elf_header.architecture == platform.architecture(), ValueError(
+        f"ELF architecture {elf_header.architecture} does not match platform.architecture()"
+    )
+    assert elf_header.byteorder == sys.byteorder, ValueError(
+        f"ELF byte order '{elf_header.byteorder}' does not match sys.byteorder"
+    )
+
+    log.debug(f"ELF header: {elf_header} ({elf_header.machine_name})")
+
+
+@mark.platform
+def test_read_elf_header_big_endian_32bit(tmp_path: Path):
+    binary: Path = tmp_path / "arm-be"
+    _write_elf_prefix(binary, ei_class=1, ei_data=2, machine=40)
+
+    elf_header = platform_info.read_elf_header(str(binary))
+
+    assert elf_header == ("32bit", "big", 40), ValueError(
+        f"Unexpected ELF header: {elf_header}"
+    )
+    assert elf_header.machine_name == "arm", ValueError(
+        f"Unexpected machine name: {elf_header.machine_name}"
+    )
+
+
+@mark.platform
+def test_read_elf_header_non_elf(tmp_path: Path):
+    script: Path = tmp_path / "script.sh"
+    script.write_text("#!/bin/sh\necho 'not an ELF binary'\n")
+
+    assert platform_info.read_elf_header(str(script)) is None, ValueError(
+        "Non-ELF files should return None"
+    )
+    assert platform_info.read_elf_header(str(tmp_path / "missing")) is None, ValueError(
+        "Missing files should return None"
+    )
+
+
+@mark.platform
+def test_read_elf_dependencies():
+    dependencies = platform_info.read_elf_dependencies(sys.executable)
+
+    if dependencies is None:
+        log.warning(f"Python executable '{sys.executable}' is not an ELF binary.")
+        return
+
+    assert isinstance(dependencies.needed, tuple), TypeError(
+        f"'needed' should be a tuple, got type: ({type(dependencies.needed)})"
+    )
+
+    log.debug(f"ELF dependencies: {dependencies}")
+
+
+@mark.platform
+def test_libc_from_elf():
+    musl = platform_info.ElfDependencies(
+        interpreter="/lib/ld-musl-x86_64.so.1", needed=("libc.musl-x86_64.so.1",)
+    )
+    glibc = platform_info.ElfDependencies(interpreter=None, needed=("libc.so.6",))
+    static = platform_info.ElfDependencies(interpreter=None, needed=())
+
+    assert platform_info._libc_from_elf(musl) == "musl", ValueError("Expected musl")
+    assert platform_info._libc_from_elf(glibc) == "glibc", ValueError("Expected glibc")
+    assert platform_info._libc_from_elf(static) is None, ValueError(
+        "Static binaries should not identify a libc"
+    )
+
+
+@mark.platform
+def test_resolve_libc_version(detected_system: str):
+    libc = platform_info.resolve_libc_version()
+
+    assert libc.source in ("confstr", "elf", "musl-loader", "binary-scan"), ValueError(
+        f"Unknown libc source: {libc.source}"
+    )
+
+    if libc.source == "confstr":
+        assert (libc.lib, libc.version) == platform.libc_ver(), ValueError(
+            f"confstr libc {libc} does not match platform.libc_ver()"
+        )
+
+    log.debug(f"[{detected_system}] libc: {libc}")
@@ -143,6 +143,47 @@ def test_convert_bytes_str(ten_mb_bytes: int):
     log.debug(f"Converted {ten_mb_bytes} bytes to: {_converted}")
 
 
+@mark.platform
+def test_convert_bytes_batch(ten_mb_bytes: int):
+    from array import array
+
+    values = array("Q", [0, 1023, 1024, 1253656, ten_mb_bytes, 1253656678, 1 << 50])
+    expected: list[str] = [
+        platform_info.convert_bytes(value, as_str=True) for value in values
+    ]
+
+    _converted = platform_info.convert_bytes_batch(values, as_str=True)
+    assert _converted == expected, ValueError(
+        f"Batch conversion does not match convert_bytes(): {_converted} != {expected}"
+    )
+
+    _arrays = platform_info.convert_bytes_batch(values)
+    assert isinstance(_arrays, platform_info.ConvertedBytesArray), TypeError(
+        f"Invalid type for converted bytes, got type: ({type(_arrays)})"
+    )
+    assert _arrays.amounts[4] == 10.0 and _arrays.unit(4) == "MB", ValueError(
+        f"Unexpected conversion of {ten_mb_bytes} bytes: {_arrays}"
+    )
+
+    log.debug(f"Converted {list(values)} bytes to: {_converted}")
+
+
+@mark.platform
+def test_convert_bytes_largest_unit():
+    ## 1 byte under 1024PB, 1024PB & the largest 64-bit count
+    values: list[int] = [(1 << 60) - 1, 1 << 60, (1 << 64) - 1]
+    expected: list[str] = [
+        platform_info.convert_bytes(value, as_str=True) for value in values
+    ]
+
+    assert expected == ["1024.00PB", "1024.00PB", "16384.00PB"], ValueError(
+        f"Counts >= 1024PB should stay in PB: {expected}"
+    )
+    assert (
+        platform_info.convert_bytes_batch(values, as_str=True) == expected
+    ), ValueError("Batch conversion does not match convert_bytes() at 1024PB")
+
+
 @mark.xfail
 def test_fail_get_cpu_count():
     cpu_count = platform_info.get_cpu_count()
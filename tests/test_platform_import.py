@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import logging
+import os
+from pathlib import Path
+import subprocess
+import sys
+
+from pytest import fixture, mark
+
+log = logging.getLogger(__name__)
+
+REPO_ROOT: Path = Path(__file__).resolve().parent.parent
+
+## Max time (in microseconds) the platform_info module body may take to execute,
+#  excluding the stdlib modules it imports. The module body takes ~12ms on a typical
+#  x86_64 host. Override with PLATFORM_INFO_IMPORT_BUDGET_US.
+IMPORT_BUDGET_US: int = int(os.environ.get("PLATFORM_INFO_IMPORT_BUDGET_US", 15000))
+
+## Modules that are only imported when they are used (i.e. by a collection or the
+#  CLI), & must not be imported with platform_info
+LAZY_MODULES: tuple[str, ...] = (
+    "argparse",
+    "asyncio",
+    "concurrent.futures",
+    "ctypes",
+    "json",
+    "multiprocessing",
+    "struct",
+    "subprocess",
+)
+
+
+@fixture
+def import_env(tmp_path: Path) -> dict[str, str]:
+    """Environment for a fresh interpreter that can write & reuse bytecode.
+
+    Without a .pyc, the measured import time includes compiling the module.
+    """
+    env: dict[str, str] = os.environ.copy()
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    env["PYTHONPYCACHEPREFIX"] = str(tmp_path)
+
+    ## Warm the bytecode cache
+    subprocess.run(
+        [sys.executable, "-c", "import platform_info"],
+        cwd=REPO_ROOT,
+        env=env,
+        check=True,
+    )
+
+    return env
+
+
+def _import_self_time_us(env: dict[str, str]) -> int:
+    """Return the 'self' time reported by -X importtime for platform_info."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import platform_info"],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    for line in proc.stderr.splitlines():
+        ## Format: 'import time: self [us] | cumulative | imported package'
+        _, _, timings = line.partition(":")
+        parts = [part.strip() for part in timings.split("|")]
+        if len(parts) == 3 and parts[2] == "platform_info":
+            return int(parts[0])
+
+    raise ValueError(f"platform_info not found in -X importtime output:\n{proc.stderr}")
+
+
+@mark.platform
+def test_import_time_budget(import_env: dict[str, str]):
+    ## Take the best of a few runs to smooth out scheduler noise
+    self_time_us: int = min(_import_self_time_us(import_env) for _ in range(5))
+
+    log.debug(f"platform_info import self time: {self_time_us}us")
+
+    assert self_time_us <= IMPORT_BUDGET_US, ValueError(
+        f"Importing platform_info took {self_time_us}us, budget is {IMPORT_BUDGET_US}us"
+    )
+
+
+@mark.platform
+def test_import_does_not_probe_platform():
+    code: str = f"""
+import platform, sys
+import platform_info
+
+assert platform._uname_cache is None, "uname() was called at import"
+for probe in (
+    platform_info._libc_ver,
+    platform_info._architecture,
+    platform_info._processor,
+    platform_info._cpu_info,
+    platform_info._cpu_features,
+    platform_info._build_probes,
+):
+    assert probe.cache_info().currsize == 0, f"{{probe.__name__}}() was called at import"
+assert not platform_info._subprocess_audit_installed, "An audit hook was installed at import"
+for mod in {LAZY_MODULES!r}:
+    assert mod not in sys.modules, f"{{mod}} was imported at import"
+"""
+    proc = subprocess.run(
+        [sys.executable, "-c", code], cwd=REPO_ROOT, capture_output=True, text=True
+    )
+
+    assert proc.returncode == 0, AssertionError(proc.stderr)
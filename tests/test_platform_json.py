@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import io
+import json
+import logging
+import os
+import sys
+import typing as t
+
+from pytest import mark
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import platform_info
+
+log = logging.getLogger(__name__)
+
+
+@mark.platform
+def test_platform_info_json_round_trip():
+    plat: platform_info.PlatformInfo = platform_info.PlatformInfo()
+    serialized: str = plat.to_json()
+
+    data: dict = json.loads(serialized)
+    assert data["python"]["modules"][0].keys() == {
+        "name",
+        "origin",
+        "version",
+        "kind",
+    }, ValueError("Module inventory records should be serialized as dicts")
+    assert isinstance(data["python"]["flags"], dict), TypeError(
+        "Struct sequences should be serialized as dicts"
+    )
+
+    loaded: platform_info.PlatformInfo = platform_info.PlatformInfo.from_json(
+        serialized
+    )
+    assert loaded.arch == plat.arch, ValueError(
+        f"Loaded arch {loaded.arch} does not match {plat.arch}"
+    )
+    assert loaded.uname == plat.uname, ValueError("Loaded uname does not match")
+    assert loaded.python.modules == plat.python.modules, ValueError(
+        "Loaded module inventory does not match"
+    )
+    reloaded: dict = loaded.to_json_dict()
+    assert reloaded == data, ValueError(
+        "Serializing a loaded object should give the same JSON"
+    )
+
+
+@mark.platform
+def test_platform_info_json_fields():
+    plat: platform_info.PlatformInfo = platform_info.PlatformInfo(
+        fields=["system", "uname.node"]
+    )
+
+    assert plat.to_json_dict(fields=["system", "uname.node"]) == {
+        "system": plat.system,
+        "uname": {"node": plat.uname.node},
+    }, ValueError("Only the requested fields should be serialized")
+
+
+@dataclass
+class _OptionalRecords:
+    limits: t.Optional[platform_info.CPULimits] = None
+    features: platform_info.CPUFeatures | None = None
+    arch: t.Optional[t.Tuple[str, str]] = None
+
+
+@mark.platform
+def test_json_field_decoders_resolve_annotations():
+    limits = platform_info.CPULimits(4, 2, None, 1.5, 2)
+    features = platform_info.CPUFeatures.from_names(["sse2", "avx2"], source="cpuinfo")
+    data: dict = json.loads(
+        json.dumps(
+            {
+                "limits": platform_info._json_value(limits),
+                "features": platform_info._json_value(features),
+                "arch": ["64bit", "ELF"],
+            }
+        )
+    )
+
+    loaded = platform_info._dataclass_from_json_dict(_OptionalRecords, data)
+
+    assert loaded == _OptionalRecords(limits, features, ("64bit", "ELF")), ValueError(
+        f"Optional record fields should be decoded by their type: {loaded}"
+    )
+
+
+@mark.platform
+def test_write_ndjson():
+    plat: platform_info.PlatformInfo = platform_info.PlatformInfo(fields=["system"])
+    output = io.StringIO()
+
+    platform_info.write_ndjson([plat, plat], output, fields=["system"])
+
+    lines: list[str] = output.getvalue().splitlines()
+    assert len(lines) == 2, ValueError(f"Expected 1 line per object, got: {lines}")
+    assert json.loads(lines[0]) == {"system": plat.system}, ValueError(
+        f"Unexpected NDJSON line: {lines[0]}"
+    )
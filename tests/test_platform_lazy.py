@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+import os
+import sys
+
+from pytest import mark
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import platform_info
+
+log = logging.getLogger(__name__)
+
+
+class CountingFactory:
+    def __init__(self, value: str):
+        self.value = value
+        self.calls: int = 0
+
+    def __call__(self) -> str:
+        self.calls += 1
+        return self.value
+
+
+@mark.platform
+def test_lazy_field_computed_once():
+    factory = CountingFactory("computed")
+
+    @dataclass(repr=False)
+    class LazyExample(platform_info.LazyFieldsMixin, platform_info.DictMixin):
+        value: str = platform_info.LazyField(factory)
+        static: int = 1
+
+    example = LazyExample()
+
+    assert factory.calls == 0, ValueError(
+        "Lazy fields should not be computed in __init__"
+    )
+    assert repr(example).endswith("LazyExample(value=<pending>, static=1)"), ValueError(
+        f"repr() should show pending fields without computing them: {example!r}"
+    )
+    assert example.as_dict(compute=False) == {"static": 1}, ValueError(
+        "as_dict(compute=False) should only return computed fields"
+    )
+
+    assert example.value == "computed" and example.value == "computed", ValueError(
+        f"Unexpected lazy value: {example.value}"
+    )
+    assert factory.calls == 1, ValueError(
+        f"Lazy field should be computed once, computed {factory.calls} times"
+    )
+    assert example.pending_fields() == [], ValueError(
+        "Computed fields should not be pending"
+    )
+
+    ## A value passed to __init__ is never computed
+    assert LazyExample(value="passed").value == "passed", ValueError(
+        "Values passed to __init__ should be used as-is"
+    )
+    assert factory.calls == 1, ValueError("Passed values should not be computed")
+
+
+@mark.platform
+def test_platform_info_fields_are_lazy():
+    plat: platform_info.PlatformInfo = platform_info.PlatformInfo()
+
+    assert "arch" in plat.pending_fields(), ValueError(
+        "PlatformInfo() should not probe fields until they are read"
+    )
+    assert plat.system, ValueError("'system' should be computed on first read")
+    assert "system" not in plat.pending_fields(), ValueError(
+        "'system' should be stored after its first read"
+    )
+    assert plat.platform_specific_info is plat.platform_specific_info, ValueError(
+        "platform_specific_info should be built once"
+    )
+
+    plat_dict: dict = plat.as_dict()
+    assert "arch" in plat_dict and not plat.pending_fields(), ValueError(
+        "as_dict() should compute every pending field"
+    )
+
+    log.debug(f"Lazy PlatformInfo: {plat!r}")
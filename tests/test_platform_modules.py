@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import logging
+import os
+import sys
+from types import ModuleType, SimpleNamespace
+
+from pytest import mark, raises
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import platform_info
+
+log = logging.getLogger(__name__)
+
+
+def _module(name: str, file: str | None = None, version: str | None = None):
+    module = ModuleType(name)
+    module.__spec__ = SimpleNamespace(
+        origin=file, submodule_search_locations=[] if file is None else None
+    )
+    if file is not None:
+        module.__file__ = file
+    if version is not None:
+        module.__version__ = version
+
+    return module
+
+
+@mark.platform
+def test_module_inventory_capture():
+    inventory: platform_info.ModuleInventory = platform_info.ModuleInventory.capture()
+
+    assert "sys" in inventory and len(inventory) > 1, ValueError(
+        f"Unexpected inventory: {inventory}"
+    )
+    assert inventory["sys"].kind == platform_info.MODULE_KIND_BUILTIN, ValueError(
+        f"'sys' should be a builtin module: {inventory['sys']}"
+    )
+    assert inventory["platform_info"].kind == platform_info.MODULE_KIND_SOURCE
+    assert list(inventory) == sorted(inventory), ValueError(
+        "Inventory should be sorted by module name"
+    )
+    assert repr(inventory) == f"ModuleInventory({len(inventory)} modules)"
+
+    with raises(KeyError):
+        inventory["not_a_module"]
+
+    log.debug(f"Module kinds: {sorted({r.kind for r in inventory.records})}")
+
+
+@mark.platform
+def test_module_inventory_filter():
+    inventory = platform_info.ModuleInventory.capture(
+        {
+            "pkg": _module("pkg", "/lib/pkg/__init__.py", version="1.0"),
+            "pkg.sub": _module("pkg.sub", "/lib/pkg/sub.so"),
+            "pkg_other": _module("pkg_other", "/lib/pkg_other.py"),
+            "ns": _module("ns"),
+            "blocked": None,
+        }
+    )
+
+    assert "blocked" not in inventory, ValueError("None entries should be skipped")
+    assert inventory["pkg"].version == "1.0", ValueError("Version was not recorded")
+    assert inventory["ns"].kind == platform_info.MODULE_KIND_NAMESPACE
+    assert list(inventory.filter("pkg")) == ["pkg", "pkg.sub", "pkg_other"]
+    assert list(inventory.filter("pkg.")) == ["pkg.sub"], ValueError(
+        "A trailing dot should only select submodules"
+    )
+
+
+@mark.platform
+def test_module_inventory_diff():
+    before = platform_info.ModuleInventory.capture(
+        {"a": _module("a", "/lib/a.py"), "b": _module("b", "/lib/b.py")}
+    )
+    after = platform_info.ModuleInventory.capture(
+        {"a": _module("a", "/lib/new/a.py"), "c": _module("c", "/lib/c.py")}
+    )
+
+    diff: platform_info.ModuleInventoryDiff = after.diff(before)
+
+    assert [r.name for r in diff.added] == ["c"], ValueError(f"Added: {diff.added}")
+    assert [r.name for r in diff.removed] == ["b"], ValueError(
+        f"Removed: {diff.removed}"
+    )
+    assert diff.changed == (after["a"],), ValueError(f"Changed: {diff.changed}")
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sys
+
+from pytest import mark
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import platform_info
+
+log = logging.getLogger(__name__)
+
+
+def _host(
+    system: str = "Linux",
+    gil_enabled: bool = True,
+    quota: float | None = None,
+    cores: int = 32,
+    threads: int = 64,
+) -> platform_info.PlatformInfo:
+    """Load a PlatformInfo object for a 64 CPU host from JSON."""
+    return platform_info.PlatformInfo.from_json(
+        json.dumps(
+            {
+                "system": system,
+                "cpu_count": 64,
+                "cpu_limits": {
+                    "logical": 64,
+                    "affinity": 64,
+                    "cpuset": 64,
+                    "quota": quota,
+                    "cgroup_version": 2,
+                },
+                "cpu": {"sockets": 1, "cores": cores, "threads": threads},
+                "python": {"gil_enabled": gil_enabled},
+            }
+        )
+    )
+
+
+@mark.platform
+def test_recommend_pool_sizes_smt():
+    advice = platform_info.recommend_pool_sizes(_host())
+
+    assert advice.smt == 2 and advice.cpu_bound_processes == 32, ValueError(
+        f"CPU-bound processes should use physical cores with SMT: {advice}"
+    )
+    assert advice.cpu_bound_threads == 1, ValueError(
+        "CPU-bound work should not use threads with the GIL"
+    )
+    assert advice.io_bound_threads == 32, ValueError(
+        f"Unexpected I/O-bound threads: {advice.io_bound_threads}"
+    )
+    assert advice.start_method == "forkserver", ValueError(
+        f"Unexpected start method: {advice.start_method}"
+    )
+    assert advice.cpu_bound_chunksize(1000) == 8, ValueError(
+        f"Unexpected chunksize: {advice.cpu_bound_chunksize(1000)}"
+    )
+
+
+@mark.platform
+def test_recommend_pool_sizes_quota():
+    advice = platform_info.recommend_pool_sizes(
+        _host(system="Darwin", gil_enabled=False, quota=2.0)
+    )
+
+    assert advice.effective_cpus == 2 and advice.cpu_bound_processes == 2, ValueError(
+        f"Pools should be sized to the CPU quota: {advice}"
+    )
+    assert advice.cpu_bound_threads == 2, ValueError(
+        "CPU-bound work can use threads without the GIL"
+    )
+    assert advice.io_bound_threads == 6, ValueError(
+        f"Unexpected I/O-bound threads: {advice.io_bound_threads}"
+    )
+    assert advice.start_method == "spawn", ValueError(
+        f"Unexpected start method: {advice.start_method}"
+    )
+
+
+@mark.platform
+def test_recommend_pool_sizes_memory():
+    gib: int = 1024**3
+    memory = platform_info.MemoryInfo(
+        total=16 * gib,
+        free=gib,
+        available=2 * gib,
+        buffers=0,
+        cached=0,
+        swap_total=0,
+        swap_free=0,
+    )
+
+    advice = platform_info.recommend_pool_sizes(
+        _host(), memory=memory, process_memory=gib // 2
+    )
+
+    assert advice.cpu_bound_processes == 4, ValueError(
+        f"Processes should be limited by available memory: {advice}"
+    )
+
+
+@mark.platform
+def test_recommend_pool_sizes_this_host(detected_system: str):
+    advice = platform_info.recommend_pool_sizes()
+
+    assert 1 <= advice.cpu_bound_processes <= advice.effective_cpus, ValueError(
+        f"Unexpected CPU-bound processes: {advice}"
+    )
+
+    log.debug(f"[{detected_system}] Pool size advice: {advice}")
@@ -0,0 +1,334 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import platform
+import subprocess
+import sys
+import threading
+import time
+
+from pytest import MonkeyPatch, mark, raises
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import platform_info
+
+log = logging.getLogger(__name__)
+
+
+@mark.platform
+def test_probe_collector_platform_info():
+    plat: platform_info.PlatformInfo = (
+        platform_info.ProbeCollector().collect_platform_info()
+    )
+
+    assert isinstance(plat, platform_info.PlatformInfo), TypeError(
+        f"Invalid type for 'plat': ({type(plat)})"
+    )
+    assert plat.python.version == platform_info.PlatformPython().version, ValueError(
+        "Collected Python version does not match PlatformPython()"
+    )
+    assert not plat.unavailable_fields, ValueError(
+        f"No probes should time out, unavailable: {plat.unavailable_fields}"
+    )
+
+    log.debug(f"Collected platform: {plat.platform}")
+
+
+@mark.platform
+def test_probe_collector_timeout():
+    release = threading.Event()
+
+    def _stalled_probe() -> str:
+        release.wait(timeout=10)
+        return "Force test failure"
+
+    probes: list[platform_info.Probe] = [
+        platform_info.Probe(path="system", func=lambda: "Linux"),
+        platform_info.Probe(path="processor", func=_stalled_probe, blocking=True),
+        platform_info.Probe(path="arch", func=lambda: ("64bit", "ELF"), blocking=True),
+    ]
+
+    started: float = time.monotonic()
+    try:
+        results = platform_info.ProbeCollector(
+            timeout=5, timeouts={"processor": 0.1}
+        ).collect(probes)
+        values, unavailable = results.values, results.unavailable
+    finally:
+        release.set()
+    elapsed: float = time.monotonic() - started
+
+    assert elapsed < 5, ValueError(f"Stalled probe blocked collection for {elapsed}s")
+    assert unavailable == {"processor"}, ValueError(
+        f"Only the stalled probe should be unavailable, got: {unavailable}"
+    )
+    assert values["processor"] is None, ValueError(
+        "Unavailable probe should have a value of None"
+    )
+    assert values["arch"] == ("64bit", "ELF"), ValueError(
+        f"Unexpected value for 'arch': {values['arch']}"
+    )
+
+
+@mark.platform
+@mark.parametrize("collect", ["collect", "async_collect"])
+def test_timed_out_probe_does_not_delay_exit(collect: str):
+    ## A probe that hangs for 3s, with a 0.1s deadline
+    code: str = f"""
+import asyncio, inspect, time
+import platform_info
+
+probes = [platform_info.Probe(path="processor", func=lambda: time.sleep(3), blocking=True)]
+results = platform_info.ProbeCollector(timeout=0.1).{collect}(probes)
+if inspect.isawaitable(results):
+    results = asyncio.run(results)
+assert results.unavailable == {{"processor"}}, results.unavailable
+"""
+    started: float = time.monotonic()
+    proc = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        capture_output=True,
+        text=True,
+    )
+    elapsed: float = time.monotonic() - started
+
+    assert proc.returncode == 0, AssertionError(proc.stderr)
+    assert elapsed < 2, ValueError(
+        f"A timed-out probe delayed interpreter exit, took {elapsed:.1f}s"
+    )
+
+
+@mark.platform
+def test_collection_runs_no_subprocess(detected_system: str, monkeypatch: MonkeyPatch):
+    if detected_system != "Linux":
+        ## 'uname -p' is still the only source of the processor on macOS & BSD
+        log.warning(f"[{detected_system}] Probes may run a subprocess.")
+        return
+
+    spawned: list = []
+
+    def _popen(args, *_args, **_kwargs):
+        spawned.append(args)
+        raise OSError(f"Probe tried to spawn a subprocess: {args}")
+
+    ## Re-probe static fields instead of reading the memoized values
+    platform_info._clear_static_probe_caches()
+    monkeypatch.setattr(subprocess, "Popen", _popen)
+
+    plat: platform_info.PlatformInfo = (
+        platform_info.ProbeCollector().collect_platform_info()
+    )
+    monkeypatch.undo()
+
+    assert not spawned, ValueError(f"Collection spawned subprocesses: {spawned}")
+    assert plat.platform == platform.platform(), ValueError(
+        f"'{plat.platform}' does not match platform.platform()"
+    )
+
+
+@mark.platform
+def test_async_get_platform_info():
+    plat: platform_info.PlatformInfo = asyncio.run(
+        platform_info.async_get_platform_info()
+    )
+
+    assert isinstance(plat, platform_info.PlatformInfo), TypeError(
+        f"Invalid type for 'plat': ({type(plat)})"
+    )
+    assert plat.arch == platform.architecture(), ValueError(
+        f"Async architecture {plat.arch} does not match platform.architecture()"
+    )
+    assert plat.processor == platform_info.get_processor(), ValueError(
+        f"Async processor '{plat.processor}' does not match get_processor()"
+    )
+
+    log.debug(f"Async collected platform: {plat.platform}")
+
+
+@mark.platform
+def test_async_probes_share_memoized_values():
+    for func in (
+        platform_info.get_platform,
+        platform_info.get_platform_terse,
+        platform_info.get_platform_aliased,
+    ):
+        assert func in platform_info.ASYNC_PROBES, ValueError(
+            f"{func.__name__}() has no async version"
+        )
+
+    platform_info._clear_static_probe_caches()
+
+    async def _probe() -> tuple:
+        return await asyncio.gather(
+            platform_info.async_get_architecture(),
+            platform_info.async_get_platform(),
+            platform_info.async_get_platform_terse(),
+            platform_info.async_get_platform_aliased(),
+        )
+
+    arch, plat, terse, aliased = asyncio.run(_probe())
+
+    assert platform_info._architecture.cache_info().currsize == 1, ValueError(
+        "async_get_architecture() should memoize its value for get_architecture()"
+    )
+    assert (
+        arch == platform_info.get_architecture() == platform.architecture()
+    ), ValueError(f"Async architecture {arch} does not match platform.architecture()")
+    assert (plat, terse, aliased) == (
+        platform.platform(),
+        platform.platform(terse=True),
+        platform.platform(aliased=True),
+    ), ValueError(f"Async platform strings do not match platform.platform(): {plat}")
+
+
+@mark.platform
+def test_parse_file_architecture():
+    fileout: str = (
+        "ELF 32-bit LSB pie executable, ARM, EABI5 version 1 (SYSV), dynamically linked"
+    )
+
+    assert platform_info._parse_file_architecture(fileout) == (
+        "32bit",
+        "ELF",
+    ), ValueError("Unable to parse 'file' output")
+
+
+@mark.platform
+def test_collection_stats():
+    plat: platform_info.PlatformInfo = (
+        platform_info.ProbeCollector().collect_platform_info()
+    )
+    stats: platform_info.CollectionStats = plat.collection_stats
+
+    probe_paths: set[str] = {probe.path for probe in platform_info.get_probes()}
+    assert {probe.path for probe in stats.probes} == probe_paths, ValueError(
+        "Every probe should have timing stats"
+    )
+    assert stats.wall_ns > 0, ValueError("Collection wall time should be recorded")
+
+    slowest = stats.slowest()
+    assert slowest[0].wall_ns >= slowest[-1].wall_ns, ValueError(
+        "slowest() should sort probes by wall time, descending"
+    )
+
+    log.debug(f"\n{stats.format_table()}")
+
+
+@mark.platform
+def test_uname_probe_computes_fields():
+    probe: platform_info.Probe = next(
+        probe for probe in platform_info.get_probes() if probe.path == "uname"
+    )
+    uname, _ = platform_info.run_timed_probe(probe)
+
+    assert not uname.pending_fields(), ValueError(
+        f"The 'uname' probe left fields to compute later: {uname.pending_fields()}"
+    )
+    assert uname.node == platform.uname().node, ValueError(
+        f"Unexpected node: {uname.node}"
+    )
+
+
+@mark.platform
+def test_probe_stats_notes():
+    def _spawning_probe() -> str:
+        platform_info._note_probe(subprocess=True)
+        return "value"
+
+    value, stats = platform_info.run_timed_probe(
+        platform_info.Probe(path="processor", func=_spawning_probe)
+    )
+
+    assert value == "value", ValueError(f"Unexpected probe value: {value}")
+    assert stats.subprocess and not stats.cached, ValueError(
+        f"Probe notes were not recorded: {stats}"
+    )
+
+    ## Notes outside of a timed probe are ignored
+    platform_info._note_probe(cached=True)
+
+
+@mark.platform
+def test_probe_stats_detect_subprocess():
+    def _spawning_probe() -> int:
+        return subprocess.run([sys.executable, "-c", "pass"]).returncode
+
+    async def _async_spawning_probe() -> int:
+        proc = await asyncio.create_subprocess_exec(sys.executable, "-c", "pass")
+        return await proc.wait()
+
+    _, spawned = platform_info.run_timed_probe(
+        platform_info.Probe(path="processor", func=_spawning_probe)
+    )
+    _, async_spawned = asyncio.run(
+        platform_info.async_run_timed_probe("processor", _async_spawning_probe)
+    )
+    _, inline = platform_info.run_timed_probe(
+        platform_info.Probe(path="system", func=platform.system)
+    )
+
+    assert spawned.subprocess and async_spawned.subprocess, ValueError(
+        f"Spawned subprocesses were not detected: {spawned}, {async_spawned}"
+    )
+    assert not inline.subprocess, ValueError(
+        f"A probe that spawned nothing was flagged: {inline}"
+    )
+
+
+@mark.platform
+def test_select_probes():
+    paths: set[str] = {
+        probe.path
+        for probe in platform_info.select_probes(
+            ["uname.node", "python.version", "platform_specific_info"],
+            system="Linux",
+        )
+    }
+
+    assert "uname" in paths and "python.version" in paths, ValueError(
+        f"Requested fields were not selected: {paths}"
+    )
+    assert "system" in paths, ValueError(
+        "Platform-specific fields should pull in their 'system' dependency"
+    )
+    assert "platform_specific_info.os_release" in paths, ValueError(
+        "A group should select every probe in it"
+    )
+    assert "python.modules" not in paths and "arch" not in paths, ValueError(
+        f"Fields that were not requested should not be selected: {paths}"
+    )
+
+    with raises(ValueError):
+        platform_info.select_probes(["not_a_field"])
+
+
+@mark.platform
+def test_platform_info_selected_fields():
+    plat: platform_info.PlatformInfo = platform_info.PlatformInfo(
+        fields=["system", "cpu_count", "python.version"]
+    )
+
+    assert plat.system == platform.system(), ValueError(
+        f"Unexpected system: {plat.system}"
+    )
+    assert plat.python.version == platform.python_version(), ValueError(
+        f"Unexpected Python version: {plat.python.version}"
+    )
+    assert "arch" in plat.pending_fields(), ValueError(
+        "Fields that were not selected should not be collected"
+    )
+    assert "modules" in plat.python.pending_fields(), ValueError(
+        "Nested fields that were not selected should not be collected"
+    )
+    assert plat.collected_fields == {
+        "system",
+        "cpu_count",
+        "python.version",
+    }, ValueError(f"Unexpected collected fields: {plat.collected_fields}")
+    assert platform_info.get_field_value(plat, "python.version") == (
+        plat.python.version
+    ), ValueError("get_field_value() should resolve dotted paths")
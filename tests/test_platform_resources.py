@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import logging
+import os
+from pathlib import Path
+import sys
+
+from pytest import mark
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import platform_info
+
+log = logging.getLogger(__name__)
+
+MEMINFO: str = """MemTotal:        6147400 kB
+MemFree:         4907596 kB
+MemAvailable:    5579952 kB
+Buffers:           60296 kB
+Cached:           816176 kB
+SwapCached:            0 kB
+SwapTotal:       2097148 kB
+SwapFree:        1048574 kB
+"""
+
+STAT_BEFORE: str = """cpu  100 0 50 800 50 0 0 0 0 0
+cpu0 100 0 50 800 50 0 0 0 0 0
+intr 12345 0 1 2 3
+ctxt 98765
+"""
+
+STAT_AFTER: str = """cpu  160 0 70 900 70 0 0 0 0 0
+cpu0 160 0 70 900 70 0 0 0 0 0
+intr 12399 0 1 2 3
+ctxt 98799
+"""
+
+
+def _write_proc(tmp_path: Path, stat: str) -> dict[str, str]:
+    paths: dict[str, str] = {
+        "meminfo": str(tmp_path / "meminfo"),
+        "loadavg": str(tmp_path / "loadavg"),
+        "stat": str(tmp_path / "stat"),
+    }
+    Path(paths["meminfo"]).write_text(MEMINFO)
+    Path(paths["loadavg"]).write_text("0.24 0.26 0.19 2/71 610\n")
+    Path(paths["stat"]).write_text(stat)
+
+    return paths
+
+
+@mark.platform
+def test_parse_meminfo():
+    memory = platform_info.parse_meminfo(MEMINFO.encode())
+
+    assert memory.total == 6147400 * 1024, ValueError(
+        f"Unexpected total memory: {memory.total}"
+    )
+    assert memory.used == (6147400 - 5579952) * 1024, ValueError(
+        f"Unexpected used memory: {memory.used}"
+    )
+    assert memory.swap_used == 1048574 * 1024, ValueError(
+        f"Unexpected used swap: {memory.swap_used}"
+    )
+    assert memory.human_readable()["swap_total"] == "2.00GB", ValueError(
+        f"Unexpected human-readable sizes: {memory.human_readable()}"
+    )
+
+
+@mark.platform
+def test_parse_loadavg():
+    load = platform_info.parse_loadavg(b"0.24 0.26 0.19 2/71 610\n")
+
+    assert load == (0.24, 0.26, 0.19, 2, 71), ValueError(
+        f"Unexpected load average: {load}"
+    )
+
+
+@mark.platform
+def test_resource_sampler_cpu_delta(tmp_path: Path):
+    paths: dict[str, str] = _write_proc(tmp_path, STAT_BEFORE)
+
+    with platform_info.ResourceSampler(**paths) as sampler:
+        ## Force the /proc/stat buffer to grow until it reaches the 'intr' line
+        sampler._sizes["stat"] = 8
+        first = sampler.sample()
+        Path(paths["stat"]).write_text(STAT_AFTER)
+        second = sampler.sample()
+
+    assert first.cpu == (), ValueError("The first sample should not have CPU usage")
+    assert first.load.running == 2 and first.memory.total == 6147400 * 1024, ValueError(
+        f"Unexpected first sample: {first}"
+    )
+
+    ## 200 ticks elapsed: 60 user, 20 system, 100 idle & 20 iowait
+    total, cpu0 = second.cpu
+    assert total.cpu == "cpu" and cpu0.cpu == "cpu0", ValueError(
+        f"Unexpected CPU names: {second.cpu}"
+    )
+    assert (total.busy, total.user, total.system, total.iowait) == (
+        40.0,
+        30.0,
+        10.0,
+        10.0,
+    ), ValueError(f"Unexpected CPU utilization: {total}")
+
+
+@mark.platform
+def test_resource_sampler_missing_files(tmp_path: Path):
+    with platform_info.ResourceSampler(
+        meminfo=str(tmp_path / "meminfo"),
+        loadavg=str(tmp_path / "loadavg"),
+        stat=str(tmp_path / "stat"),
+    ) as sampler:
+        sample = sampler.sample()
+
+    assert sample.memory is None and sample.load is None, ValueError(
+        f"Missing files should be sampled as None: {sample}"
+    )
+    assert sample.cpu == (), ValueError(f"Unexpected CPU usage: {sample.cpu}")
+
+
+@mark.platform
+def test_resource_sampler(detected_system: str):
+    if not os.path.exists(platform_info.PROC_STAT):
+        log.warning(f"[{detected_system}] No /proc filesystem to sample.")
+        return
+
+    with platform_info.ResourceSampler() as sampler:
+        sampler.sample()
+        sample = sampler.sample()
+
+    assert sample.memory.total > 0, ValueError(f"Unexpected memory: {sample.memory}")
+    assert sample.cpu and sample.cpu[0].cpu == "cpu", ValueError(
+        f"Unexpected CPU usage: {sample.cpu}"
+    )
+    assert all(0.0 <= cpu.busy <= 100.0 for cpu in sample.cpu), ValueError(
+        f"CPU usage should be a percentage: {sample.cpu}"
+    )
+
+    log.debug(f"[{detected_system}] Resource sample: {sample}")
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from dataclasses import FrozenInstanceError
+import logging
+import os
+import sys
+
+from pytest import mark, raises
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import platform_info
+
+log = logging.getLogger(__name__)
+
+
+@mark.platform
+def test_freeze_platform_info():
+    plat: platform_info.PlatformInfo = platform_info.PlatformInfo()
+    snapshot: platform_info.PlatformSnapshot = plat.freeze()
+
+    assert snapshot.system == plat.system, ValueError(
+        f"Snapshot system '{snapshot.system}' does not match '{plat.system}'"
+    )
+    assert snapshot.python.version == plat.python.version, ValueError(
+        "Snapshot Python version does not match"
+    )
+    assert snapshot.is_64bit() == plat.is_64bit(), ValueError(
+        "Snapshot should support the same system checks"
+    )
+    assert not hasattr(snapshot, "__dict__"), ValueError(
+        "Snapshots should be slotted, without a __dict__"
+    )
+    assert snapshot.system is sys.intern(plat.system), ValueError(
+        "Repeated strings should be interned"
+    )
+
+    with raises(FrozenInstanceError):
+        snapshot.system = "Force test failure"
+
+    log.debug(f"Snapshot: {snapshot.uname}")
+
+
+@mark.platform
+def test_snapshot_holds_no_live_state():
+    snapshot: platform_info.PlatformSnapshot = platform_info.PlatformInfo().freeze()
+
+    assert isinstance(snapshot.python.path, tuple), TypeError(
+        "Snapshot should not reference the live sys.path list"
+    )
+    assert isinstance(
+        snapshot.python.modules, platform_info.ModuleInventory
+    ), TypeError("Snapshot should hold a module inventory, not module objects")
+    assert isinstance(snapshot.platform_specific_info, dict), TypeError(
+        "platform_specific_info should be returned as a dict"
+    )
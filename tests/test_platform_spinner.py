@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import io
+import logging
+import os
+import sys
+import time
+
+from pytest import mark
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import platform_info
+
+log = logging.getLogger(__name__)
+
+
+@mark.platform
+def test_spinner_skipped_when_not_a_tty():
+    stream = io.StringIO()
+
+    with platform_info.CLISpinner(message="Spinning...", stream=stream) as spinner:
+        assert spinner.spinner_thread is None, ValueError(
+            "The spinner should not start a thread when the stream is not a TTY"
+        )
+
+    assert stream.getvalue() == "", ValueError(
+        f"The spinner should not write to a non-TTY stream, got: {stream.getvalue()!r}"
+    )
+
+
+@mark.platform
+def test_spinner_stops_immediately():
+    stream = io.StringIO()
+    spinner = platform_info.CLISpinner(
+        message="Spinning...", stream=stream, interval=10, enabled=True
+    )
+
+    with spinner:
+        spinner.update(3, 5)
+        assert spinner.status().startswith("3/5 probes"), ValueError(
+            f"Unexpected spinner status: {spinner.status()}"
+        )
+
+        started: float = time.monotonic()
+    elapsed: float = time.monotonic() - started
+
+    assert elapsed < 1, ValueError(f"Stopping the spinner took {elapsed}s")
+    assert stream.getvalue().startswith("\rSpinning... |"), ValueError(
+        f"Unexpected spinner output: {stream.getvalue()!r}"
+    )
+    assert stream.getvalue().endswith("\r"), ValueError(
+        "The spinner line should be cleared on exit"
+    )
+
+
+@mark.platform
+def test_probe_collector_progress():
+    progress: list[tuple[int, int]] = []
+    probes: list[platform_info.Probe] = platform_info.select_probes(
+        ["system", "cpu_count", "python.version"]
+    )
+
+    platform_info.ProbeCollector(
+        progress=lambda done, total: progress.append((done, total))
+    ).collect(probes)
+
+    assert progress[-1] == (len(probes), len(probes)), ValueError(
+        f"Progress should end with every probe finished, got: {progress}"
+    )
+    assert [done for done, _ in progress] == list(
+        range(1, len(probes) + 1)
+    ), ValueError(f"Progress should be reported once per probe, got: {progress}")
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import logging
+import os
+from pathlib import Path
+import sys
+
+from pytest import mark
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import platform_info
+
+log = logging.getLogger(__name__)
+
+
+def _write_sysfs(
+    root: Path,
+    cpus: dict[int, tuple[int, int]],
+    nodes: dict[int, tuple[str, int]],
+    online: str,
+) -> None:
+    """Write a minimal /sys/devices/system tree.
+
+    `cpus` is {cpu: (physical_package_id, core_id)}, `nodes` is {node: (cpulist, kB)}.
+    """
+    (root / "cpu").mkdir(parents=True)
+    (root / "cpu" / "online").write_text(f"{online}\n")
+    for cpu, (socket, core) in cpus.items():
+        topology: Path = root / "cpu" / f"cpu{cpu}" / "topology"
+        topology.mkdir(parents=True)
+        (topology / "physical_package_id").write_text(f"{socket}\n")
+        (topology / "core_id").write_text(f"{core}\n")
+
+    if not nodes:
+        return
+
+    (root / "node").mkdir()
+    (root / "node" / "online").write_text(
+        ",".join(str(node) for node in sorted(nodes)) + "\n"
+    )
+    for node, (cpulist, memory_kb) in nodes.items():
+        node_dir: Path = root / "node" / f"node{node}"
+        node_dir.mkdir()
+        (node_dir / "cpulist").write_text(f"{cpulist}\n")
+        (node_dir / "meminfo").write_text(
+            f"Node {node} MemTotal:       {memory_kb} kB\n"
+            f"Node {node} MemFree:        {memory_kb // 2} kB\n"
+        )
+
+
+@mark.platform
+def test_expand_cpu_list():
+    assert platform_info.expand_cpu_list("0-2,8,10-11\n") == (
+        0,
+        1,
+        2,
+        8,
+        10,
+        11,
+    ), ValueError("Unable to expand CPU list")
+    assert platform_info.expand_cpu_list("") == (), ValueError(
+        "An empty CPU list should expand to no CPUs"
+    )
+
+
+@mark.platform
+def test_read_cpu_topology_two_sockets(tmp_path: Path):
+    ## 2 sockets (1 node each) of 2 cores with 2 SMT threads; cpu7 is offline.
+    #  Like Linux on x86, a core's sibling is numbered after every core's 1st thread.
+    _write_sysfs(
+        tmp_path,
+        cpus={
+            0: (0, 0),
+            1: (0, 1),
+            2: (1, 0),
+            3: (1, 1),
+            4: (0, 0),
+            5: (0, 1),
+            6: (1, 0),
+        },
+        nodes={0: ("0-1,4-5", 1024), 1: ("2-3,6-7", 2048)},
+        online="0-6",
+    )
+
+    topology = platform_info.read_cpu_topology(str(tmp_path))
+
+    assert topology is not None, ValueError("Unable to read the CPU topology")
+    assert topology.sockets == (0, 1), ValueError(
+        f"Unexpected sockets: {topology.sockets}"
+    )
+    assert topology.as_tree() == {
+        0: {0: {0: (0, 4), 1: (1, 5)}},
+        1: {1: {0: (2, 6), 1: (3,)}},
+    }, ValueError(f"Unexpected topology tree: {topology.as_tree()}")
+    assert topology.nodes == (
+        platform_info.NUMANode(node=0, cpus=(0, 1, 4, 5), memory_total=1024 * 1024),
+        platform_info.NUMANode(node=1, cpus=(2, 3, 6), memory_total=2048 * 1024),
+    ), ValueError(f"Offline CPUs should not be listed in a node: {topology.nodes}")
+
+    assert topology.node_cpus(1) == {2, 3, 6}, ValueError("Unexpected node CPUs")
+    assert topology.socket_cpus(0) == {0, 1, 4, 5}, ValueError("Unexpected socket CPUs")
+    assert topology.core_cpus(5) == {1, 5}, ValueError("Unexpected SMT siblings")
+    assert topology.primary_threads() == {0, 1, 2, 3}, ValueError(
+        "primary_threads() should return 1 CPU per core"
+    )
+    assert topology.primary_threads(topology.node_cpus(1)) == {2, 3}, ValueError(
+        "primary_threads() should only consider the given CPUs"
+    )
+
+
+@mark.platform
+def test_read_cpu_topology_without_numa(tmp_path: Path):
+    _write_sysfs(tmp_path, cpus={0: (0, 0), 1: (0, 0)}, nodes={}, online="0-1")
+
+    topology = platform_info.read_cpu_topology(str(tmp_path))
+
+    assert topology is not None and topology.nodes == (
+        platform_info.NUMANode(node=0, cpus=(0, 1), memory_total=None),
+    ), ValueError(f"CPUs should be reported in 1 node: {topology}")
+    assert (
+        platform_info.read_cpu_topology(str(tmp_path / "missing")) is None
+    ), ValueError("A missing sysfs tree should return None")
+
+
+@mark.platform
+def test_cpu_topology_json_round_trip(tmp_path: Path):
+    _write_sysfs(
+        tmp_path,
+        cpus={0: (0, 0), 1: (0, 0)},
+        nodes={0: ("0-1", 4096)},
+        online="0-1",
+    )
+    topology = platform_info.read_cpu_topology(str(tmp_path))
+    plat = platform_info.build_platform_info(
+        {"system": "Linux", "cpu_topology": topology}
+    )
+
+    loaded = platform_info.PlatformInfo.from_json(
+        plat.to_json(fields=["system", "cpu_topology"])
+    )
+
+    assert loaded.cpu_topology == topology, ValueError(
+        f"CPU topology did not survive a JSON round trip: {loaded.cpu_topology}"
+    )
+    assert plat.freeze().cpu_topology == topology, ValueError(
+        "Snapshots should keep the CPU topology"
+    )
+
+
+@mark.platform
+def test_get_cpu_topology(detected_system: str):
+    topology = platform_info.get_cpu_topology()
+
+    if detected_system != "Linux" or topology is None:
+        log.warning(f"[{detected_system}] CPU topology is not available.")
+        return
+
+    online: set[int] = {cpu for cpu, _, _, _ in topology.cpus}
+    assert all(cpu in topology.core_cpus(cpu) for cpu in online), ValueError(
+        "Every online CPU should belong to a core"
+    )
+    assert online == {cpu for node in topology.nodes for cpu in node.cpus}, ValueError(
+        f"Every online CPU should belong to a NUMA node: {topology.nodes}"
+    )
+    assert os.sched_getaffinity(0) <= online, ValueError(
+        "The affinity mask should only contain online CPUs"
+    )
+
+    log.debug(f"[{detected_system}] CPU topology: {topology.as_tree()}")
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import logging
+import os
+import sys
+import threading
+
+from pytest import MonkeyPatch, mark
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import platform_info
+
+log = logging.getLogger(__name__)
+
+WATCH_FIELDS: list[str] = ["system", "cpu_count", "python.recursion_limit"]
+
+
+@mark.platform
+def test_watcher_reports_only_changes():
+    watcher = platform_info.PlatformWatcher(fields=WATCH_FIELDS)
+
+    first: platform_info.PlatformInfoDelta = watcher.poll()
+    assert set(first.changed) == set(WATCH_FIELDS), ValueError(
+        f"The first poll should report every field: {first}"
+    )
+    assert watcher.poll().paths() == (), ValueError(
+        "A poll with no changes should return an empty delta"
+    )
+
+    limit: int = sys.getrecursionlimit()
+    sys.setrecursionlimit(limit + 1)
+    try:
+        delta: platform_info.PlatformInfoDelta = watcher.poll()
+    finally:
+        sys.setrecursionlimit(limit)
+
+    assert delta.changed == {"python.recursion_limit": limit + 1}, ValueError(
+        f"Only the changed volatile field should be reported: {delta}"
+    )
+
+
+@mark.platform
+def test_watcher_static_sources(monkeypatch: MonkeyPatch):
+    stamps: list[tuple] = [("boot",)]
+    cleared: list[bool] = []
+    monkeypatch.setattr(platform_info, "get_static_sources_stamp", lambda: stamps[-1])
+    monkeypatch.setattr(
+        platform_info, "_clear_static_probe_caches", lambda: cleared.append(True)
+    )
+
+    watcher = platform_info.PlatformWatcher(fields=["system", "cpu_count"])
+    watcher.poll()
+    watcher.poll()
+    assert not cleared, ValueError("Static probes should not re-run without a change")
+
+    stamps.append(("upgraded",))
+    watcher.poll()
+    assert cleared == [True], ValueError(
+        "A changed static source should clear the static probe caches"
+    )
+
+
+@mark.platform
+def test_watcher_resumes_from_previous():
+    plat: platform_info.PlatformInfo = platform_info.PlatformInfo(fields=WATCH_FIELDS)
+    previous: dict = plat.to_json_dict(fields=WATCH_FIELDS)
+    previous["cpu_count"] = -1
+
+    watcher = platform_info.PlatformWatcher(fields=WATCH_FIELDS, previous=previous)
+
+    assert watcher.poll().paths() == ("cpu_count",), ValueError(
+        "The first poll should only report changes since the previous state"
+    )
+
+
+@mark.platform
+def test_watch_stops():
+    watcher = platform_info.PlatformWatcher(fields=["system"])
+    stop = threading.Event()
+
+    deltas: list = []
+    for delta in watcher.watch(0.01, stop=stop):
+        deltas.append(delta)
+        stop.set()
+
+    assert len(deltas) == 1, ValueError(f"Expected 1 delta before stopping: {deltas}")